@@ -1,24 +1,45 @@
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
 from collections import deque
-import time
+import os
+import sys
+
+# Permite importar o pacote compartilhado "grafos" da raiz do repositório
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from grafos.csr import CSRGraph
+from grafos.instrument import count_traversal, phase
+from grafos.loaders import load_graph
+from grafos.bfs import direction_optimizing_bfs
+from grafos import export, layout
+from grafos.render import GraphRenderer
+from grafos.state_log import FrameLog
+from grafos.stepper import Stepper
+from grafos.traversal import bfs_traversal
+from grafos.tree_layout import IncrementalTreeLayout
 
 # Configurar matplotlib para modo interativo
 plt.ion()
 
 class BFSVisualization:
-    def __init__(self):
-        # Definindo um grafo de exemplo simples
-        # Formato: {vértice: [vizinhos]}
-        self.graph = {
-            'A': ['B', 'C'],
-            'B': ['A', 'D', 'E'],
-            'C': ['A', 'F'],
-            'D': ['B'],
-            'E': ['B', 'F'],
-            'F': ['C', 'E']
-        }
+    def __init__(self, graph=None, stats=None):
+        # Grafo em CSR compartilhado pelas visualizações (grafos.csr)
+        if graph is None:
+            # Definindo um grafo de exemplo simples
+            # Formato: {vértice: [vizinhos]}
+            graph = CSRGraph.from_adjacency({
+                'A': ['B', 'C'],
+                'B': ['A', 'D', 'E'],
+                'C': ['A', 'F'],
+                'D': ['B'],
+                'E': ['B', 'F'],
+                'F': ['C', 'E']
+            })
+        elif isinstance(graph, dict):
+            graph = CSRGraph.from_adjacency(graph)
+        self.csr = graph
+        
+        # Formato: {vértice: [vizinhos]} usado no desenho
+        self.graph = self.csr.to_adjacency()
         
         # Vértices do grafo
         self.vertices = list(self.graph.keys())
@@ -26,34 +47,35 @@ class BFSVisualization:
         # Para visualização do algoritmo
         self.visited = set()
         self.queue = deque()
+        self.enqueued = set()  # Pertinência O(1) à fila (evita busca linear na deque)
         self.current_vertex = None
         self.path = []
         self.fig = None
         self.pos = None
+        self.renderer = None  # Artistas persistentes do painel de exploração
+        self.artists = None
+        self.frames = []      # Quadros gravados por record_steps
+        
+        # Contadores e tempos por fase, opcionais (ver grafos.instrument)
+        self.stats = stats
         
         # Para construção da árvore BFS
         self.tree_edges = []  # Arestas que formam a árvore BFS
         self.parent = {}      # Dicionário pai->filho para construir a árvore
         self.levels = {}      # Nível de cada vértice na árvore
+        self.tree_layout = IncrementalTreeLayout(spacing=1.5)  # Posições fixas na árvore
         
     def show_initial_graph(self):
         """Mostra o grafo inicial antes de começar o algoritmo"""
         self.fig, (self.ax1, self.ax2, self.ax3) = plt.subplots(1, 3, figsize=(20, 8))
+        self.renderer = None
         
-        # Cria o grafo NetworkX
-        G = nx.Graph()
-        for vertex, neighbors in self.graph.items():
-            for neighbor in neighbors:
-                G.add_edge(vertex, neighbor)
-        
-        # Posicionamento fixo dos vértices para toda a animação
-        self.pos = nx.spring_layout(G, seed=42)
+        self.compute_layout()
         
-        # Subplot 1: Grafo original
-        nx.draw_networkx_edges(G, self.pos, edge_color='blue', width=2, alpha=0.7, ax=self.ax1)
-        nx.draw_networkx_nodes(G, self.pos, node_color='lightblue', 
-                              node_size=1500, alpha=0.9, ax=self.ax1)
-        nx.draw_networkx_labels(G, self.pos, font_size=16, font_weight='bold', ax=self.ax1)
+        # Subplot 1: Grafo original (com nível de detalhe; ver grafos.render)
+        GraphRenderer(self.ax1, self.pos, self.vertices, self.edge_list(),
+                      node_color='lightblue', node_size=1500, edge_color='blue', edge_width=2,
+                      edge_alpha=0.7, font_size=16, blit=False)
         
         self.ax1.set_title("GRAFO ORIGINAL", fontsize=14, fontweight='bold', color='blue')
         self.ax1.axis('off')
@@ -73,7 +95,7 @@ class BFSVisualization:
         info_text.append("")
         info_text.append("🔗 ADJACÊNCIAS:")
         for vertex, neighbors in self.graph.items():
-            neighbors_str = ", ".join(neighbors)
+            neighbors_str = ", ".join(map(str, neighbors))
             info_text.append(f"   {vertex}: {neighbors_str}")
         
         info_text.append("")
@@ -89,19 +111,50 @@ class BFSVisualization:
                      bbox=dict(boxstyle='round,pad=0.5', facecolor='lightcyan', alpha=0.8))
         
         plt.tight_layout()
-        plt.draw()
-        plt.pause(3)  # Mostra por 3 segundos
+        plt.draw()  # Fica na tela até o primeiro passo (ver play)
+    
+    def compute_layout(self):
+        """Calcula o posicionamento fixo dos vértices para toda a animação (em cache no disco)"""
+        self.pos = layout.spring_layout(self.csr, seed=42)
+        return self.pos
+    
+    def edge_list(self):
+        """Arestas ``(u, v)`` do grafo, sem repetição"""
+        label_of = self.csr.label_of
+        src, dst, _, _ = self.csr.unique_edges()
+        return [(label_of(u), label_of(v)) for u, v in zip(src.tolist(), dst.tolist())]
     
-    def bfs_algorithm(self, start_vertex='A'):
-        """Algoritmo BFS com visualização passo a passo"""
+    def bfs_algorithm(self, start_vertex='A', mode='auto', interval=2.0):
+        """Algoritmo BFS com visualização passo a passo
+        
+        O algoritmo roda sem pausas gravando os passos, que depois são mostrados
+        por grafos.stepper: mode='auto' (um passo a cada interval segundos),
+        'keys' (um passo por tecla) ou 'benchmark' (sem espera).
+        """
         print("🌟 ALGORITMO BFS - BUSCA EM LARGURA")
         print("=" * 45)
         print("📊 Mostrando grafo inicial...")
-        self.show_initial_graph()
+        with phase(self.stats, 'render'):
+            self.show_initial_graph()
+        
+        with phase(self.stats, 'main_loop'):
+            path = self.record_steps(start_vertex)
+        with phase(self.stats, 'render'):
+            self.play(mode, interval)
+        return path
+    
+    def record_steps(self, start_vertex='A'):
+        """Executa o BFS sem pausas, gravando um quadro por passo em self.frames
+        
+        Os quadros são gravados como deltas (grafos.state_log.FrameLog) e
+        montados por frame_of só quando são lidos.
+        """
+        self.frames = FrameLog(self.frame_of, ('queue', 'visited', 'levels', 'tree_edges'))
+        frames = self.frames
         
         print("📊 Grafo original:")
         for vertex, neighbors in self.graph.items():
-            neighbors_str = ", ".join(neighbors)
+            neighbors_str = ", ".join(map(str, neighbors))
             print(f"   {vertex}: {neighbors_str}")
         
         print(f"\n🚀 Iniciando BFS do vértice: {start_vertex}")
@@ -111,26 +164,30 @@ class BFSVisualization:
         # Inicialização
         self.visited = set()
         self.queue = deque([start_vertex])
+        self.enqueued = {start_vertex}
         self.path = []
         self.tree_edges = []
         self.parent = {}
         self.levels = {start_vertex: 0}
+        self.tree_layout = IncrementalTreeLayout(spacing=1.5)
+        frames.set('queue', start_vertex)
+        frames.set('levels', start_vertex, 0)
         step = 0
         
         # Primeiro passo: adiciona o vértice inicial
         print(f"\nPasso {step}: Iniciando com vértice {start_vertex}")
         print(f"   📥 Fila: {list(self.queue)}")
-        print(f"   ✅ Visitados: {sorted(self.visited)}")
+        print(f"   ✅ Visitados: {len(self.visited)}")
         
         self.current_vertex = start_vertex
-        self.visualize_step(f"Iniciando com vértice {start_vertex}", step)
-        time.sleep(2)
+        self.record_step(f"Iniciando com vértice {start_vertex}")
         
         step += 1
         
         while self.queue:
             # Remove o primeiro vértice da fila
             current = self.queue.popleft()
+            frames.remove('queue', current)
             
             print(f"\nPasso {step}: Processando vértice {current}")
             
@@ -138,274 +195,253 @@ class BFSVisualization:
                 # Marca como visitado
                 self.visited.add(current)
                 self.path.append(current)
+                # Entra na árvore desenhada; a posição não muda mais (O(1))
+                self.tree_layout.add(current, self.parent.get(current))
+                frames.set('visited', current, self.parent.get(current))
                 
                 print(f"   🎯 Vértice {current} visitado!")
-                print(f"   📋 Caminho atual: {' → '.join(self.path)}")
+                # Só o que mudou no passo e os tamanhos: listar caminho e fila a
+                # cada passo custaria O(V) por passo, O(V²) na execução
+                print(f"   📋 Caminho atual: {len(self.path)} vértices (... → {current})")
                 
                 # Adiciona todos os vizinhos não visitados à fila
                 neighbors_added = []
                 for neighbor in self.graph[current]:
-                    if neighbor not in self.visited and neighbor not in self.queue:
+                    if neighbor not in self.visited and neighbor not in self.enqueued:
                         self.queue.append(neighbor)
+                        self.enqueued.add(neighbor)
                         neighbors_added.append(neighbor)
                         
                         # Constrói a árvore BFS
                         self.parent[neighbor] = current
                         self.tree_edges.append((current, neighbor))
                         self.levels[neighbor] = self.levels[current] + 1
+                        frames.set('queue', neighbor)
+                        frames.set('tree_edges', (current, neighbor))
+                        frames.set('levels', neighbor, self.levels[neighbor])
                 
                 if neighbors_added:
-                    neighbors_str = ", ".join(neighbors_added)
+                    neighbors_str = ", ".join(map(str, neighbors_added))
                     print(f"   ➕ Adicionados à fila: {neighbors_str}")
                 
-                print(f"   📥 Fila atual: {list(self.queue)}")
-                print(f"   ✅ Visitados: {sorted(self.visited)}")
+                print(f"   📥 Fila atual: {len(self.queue)} vértices")
+                print(f"   ✅ Visitados: {len(self.visited)} (+{current})")
                 
-                # Atualiza visualização
+                # Grava o passo para a visualização
                 self.current_vertex = current
-                self.visualize_step(f"Processando vértice {current}", step)
+                self.record_step(f"Processando vértice {current}")
                 
                 step += 1
-                time.sleep(2)
             else:
                 print(f"   ⚠️  Vértice {current} já foi visitado")
         
+        if self.stats is not None:
+            count_traversal(self.stats, self.csr, [self.csr.id_of(v) for v in self.path])
+        
         print(f"\n🎉 BFS CONCLUÍDO!")
-        print(f"📋 Ordem de visitação: {' → '.join(self.path)}")
+        print(f"📋 Ordem de visitação: {' → '.join(map(str, self.path))}")
         print(f"✅ Total de vértices visitados: {len(self.visited)}")
         
         return self.path
     
-    def visualize_step(self, title, step):
-        """Visualiza o estado atual do algoritmo BFS com árvore"""
-        # Limpa os subplots
-        self.ax1.clear()
-        self.ax2.clear()
-        self.ax3.clear()
-        
-        # Cria o grafo NetworkX
-        G = nx.Graph()
-        for vertex, neighbors in self.graph.items():
-            for neighbor in neighbors:
-                G.add_edge(vertex, neighbor)
-        
-        # SUBPLOT 1: Grafo original com estado atual
-        # Desenha todas as arestas em cinza claro
-        nx.draw_networkx_edges(G, self.pos, edge_color='lightgray', width=1, alpha=0.5, ax=self.ax1)
-        
-        # Desenha arestas da árvore BFS em verde
-        if self.tree_edges:
-            tree_graph = nx.Graph()
-            tree_graph.add_edges_from(self.tree_edges)
-            nx.draw_networkx_edges(tree_graph, self.pos, edge_color='green', 
-                                 width=3, ax=self.ax1)
-        
-        # Define cores dos vértices
-        node_colors = []
-        for vertex in self.vertices:
-            if vertex == self.current_vertex:
-                node_colors.append('red')  # Vértice sendo processado
-            elif vertex in self.visited:
-                node_colors.append('lightgreen')  # Vértices visitados
-            elif vertex in self.queue:
-                node_colors.append('orange')  # Vértices na fila
-            else:
-                node_colors.append('lightgray')  # Vértices não visitados
-        
-        # Desenha os vértices
-        nx.draw_networkx_nodes(G, self.pos, node_color=node_colors, 
-                              node_size=1200, alpha=0.9, ax=self.ax1)
-        
-        # Adiciona labels dos vértices
-        nx.draw_networkx_labels(G, self.pos, font_size=14, font_weight='bold', ax=self.ax1)
-        
-        self.ax1.set_title(f"EXPLORAÇÃO BFS - {title}", fontsize=12, fontweight='bold')
-        self.ax1.axis('off')
+    def run_headless(self, start_vertex='A'):
+        """Executa o BFS sem desenho nem pausas (ver grafos.traversal)"""
+        return bfs_traversal(self.csr, self.csr.id_of(start_vertex), stats=self.stats)
+    
+    def run_engine(self, start_vertex='A'):
+        """Executa o BFS por níveis (grafos.bfs) e preenche o estado usado no desenho
+        
+        Produz os mesmos path, levels, parent e tree_edges de bfs_algorithm, então
+        create_final_visualization pode ser chamado em seguida.
+        """
+        result = direction_optimizing_bfs(self.csr, self.csr.id_of(start_vertex), stats=self.stats)
+        self.path = result.path_labels()
+        self.visited = set(self.path)
+        self.queue = deque()
+        self.enqueued = set(self.path)
+        self.levels = result.level_labels()
+        self.parent = result.parent_labels()
+        self.tree_edges = result.tree_edge_labels()
+        self.tree_layout = IncrementalTreeLayout.from_parents(self.path, self.parent, spacing=1.5)
+        self.current_vertex = None
+        return self.path
+    
+    def build_scene(self):
+        """Descreve os três subplots (exploração, informações e árvore) para grafos.export
+        
+        A árvore é criada já completa (depois de record_steps), com vértices,
+        arestas e rótulos invisíveis; cada quadro só revela os já visitados.
+        """
+        edges = self.edge_list()
+        tree_vertices = list(self.tree_layout.pos)
+        
+        scene = export.Scene(figsize=(20, 8))
+        scene.add_graph('graph', self.pos, self.vertices, edges,
+                        title=("EXPLORAÇÃO BFS", dict(fontsize=12, fontweight='bold')),
+                        node_size=1200, edge_width=1, edge_alpha=0.5)
+        scene.add_text('info', 0.05, 0.95, fontsize=10, verticalalignment='top',
+                       fontfamily='monospace',
+                       bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.8))
+        scene.add_graph('tree', self.tree_layout.pos, tree_vertices, self.tree_layout.edges(),
+                        title=("ÁRVORE BFS", dict(fontsize=12, fontweight='bold', color='green')),
+                        node_size=800, node_alpha=0.0, edge_alpha=0.0, font_size=12,
+                        margins=(0.15, 0.25), label_text={vertex: '' for vertex in tree_vertices})
+        scene.add_text('tree_info', 0.02, 0.98, panel='tree', fontsize=10,
+                       verticalalignment='top',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7))
+        scene.add_text('tree_message', 0.5, 0.5, panel='tree', fontsize=12, ha='center',
+                       va='center',
+                       bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.5))
+        return scene
+    
+    def setup_renderer(self):
+        """Cria uma única vez os artistas dos três subplots (ver grafos.render)"""
+        for ax in (self.ax1, self.ax2, self.ax3):
+            ax.clear()
+        self.artists = self.build_scene().build(
+            self.fig, axes={'graph': self.ax1, 'info': self.ax2, 'tree': self.ax3})
+        self.renderer = self.artists['graph']
+    
+    def frame_of(self, state):
+        """Quadro dos três subplots a partir de um estado gravado (ver GraphRenderer.apply)"""
+        queue, visited, levels = state['queue'], state['visited'], state['levels']
+        current = state['current']
+        
+        # SUBPLOT 1: Grafo original com estado atual (só muda o estilo dos artistas)
+        # Cores dos vértices: não visitados (cinza, base) < na fila < visitados < atual
+        nodes = [(list(queue), 'orange', None),
+                 (list(visited), 'lightgreen', None)]
+        if current is not None:
+            nodes.append(([current], 'red', None))
+        graph = {
+            'nodes': nodes,
+            # Arestas da árvore BFS em verde
+            'edges': [(list(state['tree_edges']), 'green', 3, 'solid', None)],
+            'title': (f"EXPLORAÇÃO BFS - {state['title']}",
+                      dict(fontsize=12, fontweight='bold')),
+        }
         
         # SUBPLOT 2: Informações do algoritmo
-        self.ax2.axis('off')
-        
         info_text = []
         info_text.append("ESTADO ATUAL DO BFS")
         info_text.append("=" * 25)
         info_text.append("")
         
         # Vértice atual
-        if self.current_vertex:
-            info_text.append(f"🎯 Processando: {self.current_vertex}")
-            if self.current_vertex in self.levels:
-                info_text.append(f"   Nível: {self.levels[self.current_vertex]}")
+        if current is not None:
+            info_text.append(f"🎯 Processando: {current}")
+            if current in levels:
+                info_text.append(f"   Nível: {levels[current]}")
         info_text.append("")
         
         # Fila atual
-        if self.queue:
-            queue_str = " ← ".join(list(self.queue))
+        if queue:
+            queue_str = " ← ".join(map(str, queue))
             info_text.append("📥 FILA (próximos):")
             info_text.append(f"   {queue_str}")
         else:
             info_text.append("📥 FILA: Vazia")
         info_text.append("")
         
-        # Visitados por nível
-        if self.levels:
+        # Visitados por nível, agrupados numa passada em ordem de visita (a do
+        # FrameLog): o BFS visita os níveis em ordem, então nada é ordenado
+        if levels:
             info_text.append("📊 NÍVEIS DA ÁRVORE:")
-            max_level = max(self.levels.values()) if self.levels else 0
-            for level in range(max_level + 1):
-                vertices_at_level = [v for v, l in self.levels.items() if l == level and v in self.visited]
-                if vertices_at_level:
-                    info_text.append(f"   Nível {level}: {', '.join(sorted(vertices_at_level))}")
+            by_level = {}
+            for vertex in visited:
+                by_level.setdefault(levels[vertex], []).append(vertex)
+            for level, vertices in by_level.items():
+                vertices_at_level = ', '.join(map(str, vertices))
+                info_text.append(f"   Nível {level}: {vertices_at_level}")
         
         info_text.append("")
         
-        # Caminho
-        if self.path:
-            path_str = " → ".join(self.path)
+        # Caminho (os visitados estão em ordem de visita)
+        if visited:
+            path_str = " → ".join(map(str, visited))
             info_text.append("📋 ORDEM DE VISITA:")
             info_text.append(f"   {path_str}")
         
-        text_content = "\n".join(info_text)
-        self.ax2.text(0.05, 0.95, text_content, transform=self.ax2.transAxes, fontsize=10,
-                     verticalalignment='top', fontfamily='monospace',
-                     bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.8))
-        
-        # SUBPLOT 3: Árvore BFS
-        self.draw_bfs_tree()
-        
-        plt.tight_layout()
-        plt.draw()
-        plt.pause(0.1)  # Pequena pausa para renderização
-    
-    def draw_bfs_tree(self):
-        """Desenha a árvore BFS no subplot 3"""
-        self.ax3.clear()
-        self.ax3.set_title("ÁRVORE BFS", fontsize=12, fontweight='bold', color='green')
-        self.ax3.axis('off')
-        
-        if not self.tree_edges:
+        # SUBPLOT 3: Árvore BFS (só vértices já visitados, nas posições fixas de tree_layout)
+        tree, tree_info, tree_message = {}, "", ""
+        if not state['tree_edges']:
             # Se não há árvore ainda, mostra mensagem
-            self.ax3.text(0.5, 0.5, "Árvore será\nconstruída\nconforme BFS\nprogredir", 
-                         transform=self.ax3.transAxes, fontsize=12, ha='center', va='center',
-                         bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.5))
-            return
-        
-        # Cria um grafo da árvore BFS apenas com nós visitados
-        tree_graph = nx.Graph()
-        
-        # Adiciona apenas arestas que conectam nós já visitados
-        for edge in self.tree_edges:
-            if edge[0] in self.visited and edge[1] in self.visited:
-                tree_graph.add_edge(edge[0], edge[1])
-        
-        # Adiciona nós visitados que podem estar isolados
-        for vertex in self.visited:
-            tree_graph.add_node(vertex)
-        
-        if len(tree_graph.nodes()) == 0:
-            return
-        
-        # Calcula posições hierárquicas para a árvore
-        tree_pos = self.calculate_tree_positions()
-        
-        # Filtra posições apenas para nós que existem no grafo
-        filtered_tree_pos = {node: pos for node, pos in tree_pos.items() if node in tree_graph.nodes()}
-        
-        # Desenha as arestas da árvore
-        if len(tree_graph.edges()) > 0 and len(filtered_tree_pos) > 1:
-            nx.draw_networkx_edges(tree_graph, filtered_tree_pos, edge_color='green', 
-                                 width=2, ax=self.ax3)
-        
-        # Define cores dos nós na árvore
-        tree_node_colors = []
-        for vertex in tree_graph.nodes():
-            if vertex == self.current_vertex:
-                tree_node_colors.append('red')
-            elif vertex in self.visited:
-                tree_node_colors.append('lightgreen')
-            else:
-                tree_node_colors.append('orange')
-        
-        # Desenha os nós da árvore
-        if len(filtered_tree_pos) > 0:
-            nx.draw_networkx_nodes(tree_graph, filtered_tree_pos, node_color=tree_node_colors, 
-                                  node_size=800, alpha=0.9, ax=self.ax3)
-            
-            # Adiciona labels
-            nx.draw_networkx_labels(tree_graph, filtered_tree_pos, font_size=12, font_weight='bold', ax=self.ax3)
-        
-        # Adiciona informações sobre os níveis
-        if self.levels:
-            visited_levels = {v: l for v, l in self.levels.items() if v in self.visited}
-            if visited_levels:
-                max_level = max(visited_levels.values())
-                level_info = f"Profundidade: {max_level}\nNós: {len(self.visited)}"
-                self.ax3.text(0.02, 0.98, level_info, transform=self.ax3.transAxes, fontsize=10,
-                             verticalalignment='top',
-                             bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7))
+            tree_message = "Árvore será\nconstruída\nconforme BFS\nprogredir"
+        else:
+            tree_nodes = [(list(visited), 'lightgreen', None)]
+            if current in visited:
+                tree_nodes.append(([current], 'red', None))
+            tree = {
+                'nodes': tree_nodes,
+                'edges': [([(parent, vertex) for vertex, parent in visited.items()
+                            if parent is not None], 'green', 2, 'solid', None)],
+                'labels': {vertex: str(vertex) for vertex in visited},
+            }
+            tree_info = f"Profundidade: {state['tree_height']}\nNós: {len(visited)}"
+        
+        return {'graph': graph, 'info': "\n".join(info_text), 'tree': tree,
+                'tree_info': tree_info, 'tree_message': tree_message}
     
-    def calculate_tree_positions(self):
-        """Calcula posições hierárquicas para desenhar a árvore"""
-        if not self.levels:
-            return {}
-        
-        # Organiza vértices por nível
-        levels_dict = {}
-        for vertex, level in self.levels.items():
-            if vertex in self.visited:  # Só mostra vértices já visitados
-                if level not in levels_dict:
-                    levels_dict[level] = []
-                levels_dict[level].append(vertex)
-        
-        # Calcula posições
-        tree_pos = {}
-        max_level = max(levels_dict.keys()) if levels_dict else 0
-        
-        for level, vertices in levels_dict.items():
-            y = max_level - level  # Nível 0 no topo
-            vertices.sort()  # Ordena para consistência
-            
-            if len(vertices) == 1:
-                x = 0
-                tree_pos[vertices[0]] = (x, y)
-            else:
-                # Distribui horizontalmente
-                width = len(vertices) - 1
-                for i, vertex in enumerate(vertices):
-                    x = (i - width/2) * 1.5  # Espaçamento horizontal
-                    tree_pos[vertex] = (x, y)
-        
-        return tree_pos
+    def record_step(self, title):
+        """Fecha o quadro com os deltas do passo atual do algoritmo BFS"""
+        with phase(self.stats, 'record'):
+            self.frames.commit(title=title, current=self.current_vertex,
+                               tree_height=self.tree_layout.height)
+    
+    def show_frame(self, frame):
+        """Desenha um quadro gravado nos três subplots"""
+        if self.renderer is None:
+            self.setup_renderer()
+        export.Scene.apply(self.artists, frame)
+        self.renderer.draw()
+    
+    def play(self, mode='auto', interval=2.0):
+        """Mostra os quadros gravados pelo laço de eventos (ver grafos.stepper)"""
+        frames = self.frames
+        print(f"\n🎬 Mostrando {len(frames)} passos (modo: {mode})...")
+        return Stepper(self.fig, frames, lambda i: self.show_frame(frames[i]),
+                       mode=mode, interval=interval).run()
+    
+    def export_animation(self, path, start_vertex='A', fps=0.5, workers=None, dpi=100):
+        """Grava o BFS e exporta sem abrir janela: .gif, .mp4 ou diretório de PNGs
+        
+        Os quadros são desenhados em paralelo por grafos.export, com os três
+        subplots da visualização.
+        """
+        self.compute_layout()
+        with phase(self.stats, 'main_loop'):
+            self.record_steps(start_vertex)
+        frames = self.frames
+        
+        print(f"\n🎬 Exportando {len(frames)} quadros para {path}...")
+        with phase(self.stats, 'render'):
+            export.export_animation(self.build_scene(), frames, path, fps=fps,
+                                    workers=workers, dpi=dpi)
+        print(f"✅ Animação salva em {path}")
+        return path
     
     def create_final_visualization(self, path):
         """Cria a visualização final do BFS com árvore completa"""
+        # Desliga os artistas persistentes antes de limpar os subplots
+        if self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+        
         # Limpa o conteúdo anterior
         self.ax1.clear()
         self.ax2.clear()
         self.ax3.clear()
         
         # SUBPLOT 1: Grafo original com árvore BFS
-        G = nx.Graph()
-        for vertex, neighbors in self.graph.items():
-            for neighbor in neighbors:
-                G.add_edge(vertex, neighbor)
-        
-        # Desenha todas as arestas em cinza claro
-        nx.draw_networkx_edges(G, self.pos, edge_color='lightgray', width=1, alpha=0.3, ax=self.ax1)
+        # Todas as arestas em cinza claro e os vértices - todos visitados em verde
+        final = GraphRenderer(self.ax1, self.pos, self.vertices, self.edge_list(),
+                              node_color='lightgreen', node_size=1500, edge_alpha=0.3,
+                              font_size=16, blit=False)
         
-        # Desenha a árvore BFS em verde
-        if self.tree_edges:
-            tree_graph = nx.Graph()
-            tree_graph.add_edges_from(self.tree_edges)
-            nx.draw_networkx_edges(tree_graph, self.pos, edge_color='green', 
-                                 width=4, ax=self.ax1)
-        
-        # Desenha os vértices - todos visitados em verde
-        nx.draw_networkx_nodes(G, self.pos, node_color='lightgreen', 
-                              node_size=1500, alpha=0.9, ax=self.ax1)
-        
-        # Labels dos vértices
-        nx.draw_networkx_labels(G, self.pos, font_size=16, font_weight='bold', ax=self.ax1)
+        # Árvore BFS em verde
+        final.apply({'edges': [(self.tree_edges, 'green', 4, 'solid', None)]})
         
-        self.ax1.set_title(f"GRAFO COM ÁRVORE BFS\nOrdem: {' → '.join(path)}", 
+        self.ax1.set_title(f"GRAFO COM ÁRVORE BFS\nOrdem: {' → '.join(map(str, path))}", 
                           fontsize=14, fontweight='bold', color='darkgreen')
         self.ax1.axis('off')
         
@@ -430,12 +466,12 @@ class BFSVisualization:
             for level in range(max_level + 1):
                 vertices_at_level = [v for v, l in self.levels.items() if l == level]
                 if vertices_at_level:
-                    summary_text.append(f"   Nível {level}: {', '.join(sorted(vertices_at_level))}")
+                    summary_text.append(f"   Nível {level}: {', '.join(map(str, sorted(vertices_at_level)))}")
         
         summary_text.append("")
         summary_text.append("🏆 RESULTADO:")
         summary_text.append(f"   • {len(path)} vértices visitados")
-        summary_text.append(f"   • Ordem: {' → '.join(path)}")
+        summary_text.append(f"   • Ordem: {' → '.join(map(str, path))}")
         summary_text.append("")
         summary_text.append("💡 CARACTERÍSTICAS:")
         summary_text.append("   • Visita por níveis")
@@ -452,28 +488,12 @@ class BFSVisualization:
         self.ax3.set_title("ÁRVORE BFS COMPLETA", fontsize=14, fontweight='bold', color='darkgreen')
         self.ax3.axis('off')
         
-        # Desenha a árvore completa
+        # Desenha a árvore completa, nas posições hierárquicas da animação
         if self.tree_edges:
-            tree_graph = nx.Graph()
-            tree_graph.add_edges_from(self.tree_edges)
-            
-            # Adiciona todos os vértices visitados
-            for vertex in self.visited:
-                tree_graph.add_node(vertex)
-            
-            # Calcula posições hierárquicas
-            tree_pos = self.calculate_tree_positions()
-            
-            # Desenha arestas da árvore
-            nx.draw_networkx_edges(tree_graph, tree_pos, edge_color='darkgreen', 
-                                 width=3, ax=self.ax3)
-            
-            # Desenha nós da árvore
-            nx.draw_networkx_nodes(tree_graph, tree_pos, node_color='lightgreen', 
-                                  node_size=1000, alpha=0.9, ax=self.ax3)
-            
-            # Labels
-            nx.draw_networkx_labels(tree_graph, tree_pos, font_size=14, font_weight='bold', ax=self.ax3)
+            GraphRenderer(self.ax3, self.tree_layout.pos, list(self.tree_layout.pos),
+                          self.tree_layout.edges(), node_color='lightgreen', node_size=1000,
+                          edge_color='darkgreen', edge_width=3, edge_alpha=1.0, font_size=14,
+                          max_edges=None, blit=False)
             
             # Adiciona informação sobre a raiz
             root = path[0] if path else 'A'
@@ -491,15 +511,23 @@ class BFSVisualization:
         plt.ioff()  # Desliga modo interativo
         plt.show()
 
-def main():
-    """Função principal para executar a demonstração"""
+def main(mode='auto', graph_file=None):
+    """Função principal para executar a demonstração
+    
+    mode: 'auto', 'keys' ou 'benchmark' (ver grafos.stepper)
+    graph_file: arquivo do grafo (ver grafos.loaders); sem ele, usa o exemplo A–F
+    """
     print("🚀 Iniciando demonstração do Algoritmo BFS")
     print("⏳ Aguarde... A visualização será exibida passo a passo\n")
     
-    bfs_demo = BFSVisualization()
+    graph = load_graph(graph_file) if graph_file else None
+    bfs_demo = BFSVisualization(graph)
     
     # Executa o algoritmo
-    path = bfs_demo.bfs_algorithm(start_vertex='A')
+    # Num grafo carregado a busca começa no vértice de maior grau (como em
+    # benchmarks/suite.py): o vértice 0 pode estar isolado
+    start_vertex = 'A' if graph is None else graph.label_of(int(np.argmax(graph.degrees())))
+    path = bfs_demo.bfs_algorithm(start_vertex=start_vertex, mode=mode)
     
     # Visualização final
     print(f"\n📊 Criando visualização final...")
@@ -510,4 +538,6 @@ def main():
     print(f"   em ordem de distância crescente do vértice inicial.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Argumentos opcionais: modo (auto, keys ou benchmark) e arquivo do grafo
+    main(sys.argv[1] if len(sys.argv) > 1 else 'auto',
+         sys.argv[2] if len(sys.argv) > 2 else None)
\ No newline at end of file
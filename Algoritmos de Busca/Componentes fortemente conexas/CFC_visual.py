@@ -0,0 +1,52 @@
+import os
+import sys
+
+# As CFCs são animadas pela visualização do DFS (mesmos passos, ver grafos.scc)
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(DIRECTORY, '..', '..'))
+sys.path.insert(0, os.path.join(DIRECTORY, '..', 'DFS'))
+from DFS_Visul import DFSVisualization
+from grafos.csr import CSRGraph
+from grafos.loaders import load_graph
+
+
+def example_graph():
+    """Grafo dirigido do exemplo do Readme: CFCs {A, B, D, E} e {C, F}"""
+    return CSRGraph.from_adjacency({
+        'A': ['B'],
+        'B': ['C', 'E'],
+        'C': ['F'],
+        'D': ['A'],
+        'E': ['D'],
+        'F': ['C'],
+    }, directed=True)
+
+
+def main(method='tarjan', mode='auto', graph_file=None):
+    """Função principal para executar a demonstração
+
+    method: 'tarjan' ou 'kosaraju' (ver grafos.scc)
+    mode: 'auto', 'keys' ou 'benchmark' (ver grafos.stepper)
+    graph_file: arquivo do grafo, lido como dirigido (ver grafos.loaders); um
+        ``.csr`` já guarda se é dirigido
+    """
+    print(f"🚀 Iniciando demonstração das CFCs ({method})")
+    print("⏳ Aguarde... A visualização será exibida passo a passo\n")
+
+    if graph_file is None:
+        graph = example_graph()
+    elif graph_file.endswith('.csr'):
+        graph = load_graph(graph_file)
+    else:
+        graph = load_graph(graph_file, directed=True)
+    components = DFSVisualization(graph).scc_algorithm(method, mode=mode)
+
+    print(f"\n✨ Demonstração concluída!")
+    print(f"📈 {len(components)} componentes fortemente conexas encontradas.")
+
+
+if __name__ == "__main__":
+    # Argumentos opcionais: método (tarjan ou kosaraju), modo e arquivo do grafo
+    main(sys.argv[1] if len(sys.argv) > 1 else 'tarjan',
+         sys.argv[2] if len(sys.argv) > 2 else 'auto',
+         sys.argv[3] if len(sys.argv) > 3 else None)
@@ -1,23 +1,48 @@
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
-import time
+import os
+import sys
+
+# Permite importar o pacote compartilhado "grafos" da raiz do repositório
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from grafos import export, layout
+from grafos.csr import CSRGraph
+from grafos.instrument import count_traversal, phase
+from grafos.loaders import load_graph
+from grafos.dfs import DISCOVER, EDGE_TYPE_NAMES, FINISH, iterative_dfs
+from grafos.render import GraphRenderer
+from grafos.scc import COMPONENT, PASS, kosaraju_scc, tarjan_scc
+from grafos.state_log import FrameLog
+from grafos.stepper import Stepper
+from grafos.traversal import dfs_traversal
+from grafos.tree_layout import IncrementalTreeLayout
 
 # Configurar matplotlib para modo interativo
 plt.ion()
 
+# Coleções gravadas em DFSVisualization.frames (ver frame_of)
+FRAME_COLLECTIONS = ('stack', 'visited', 'finish', 'tree_edges', 'backtrack', 'tree', 'components')
+
 class DFSVisualization:
-    def __init__(self):
-        # Definindo um grafo de exemplo simples
-        # Formato: {vértice: [vizinhos]}
-        self.graph = {
-            'A': ['B', 'C'],
-            'B': ['A', 'D', 'E'],
-            'C': ['A', 'F'],
-            'D': ['B'],
-            'E': ['B', 'F'],
-            'F': ['C', 'E']
-        }
+    def __init__(self, graph=None, stats=None):
+        # Grafo em CSR compartilhado pelas visualizações (grafos.csr)
+        if graph is None:
+            # Definindo um grafo de exemplo simples
+            # Formato: {vértice: [vizinhos]}
+            graph = CSRGraph.from_adjacency({
+                'A': ['B', 'C'],
+                'B': ['A', 'D', 'E'],
+                'C': ['A', 'F'],
+                'D': ['B'],
+                'E': ['B', 'F'],
+                'F': ['C', 'E']
+            })
+        elif isinstance(graph, dict):
+            graph = CSRGraph.from_adjacency(graph)
+        self.csr = graph
+        
+        # Formato: {vértice: [vizinhos]} usado no desenho
+        self.graph = self.csr.to_adjacency()
         
         # Vértices do grafo
         self.vertices = list(self.graph.keys())
@@ -25,10 +50,17 @@ class DFSVisualization:
         # Para visualização do algoritmo
         self.visited = set()
         self.stack = []
+        self.on_stack = set()  # Pertinência O(1) à pilha (evita busca linear na lista)
         self.current_vertex = None
         self.path = []
         self.fig = None
         self.pos = None
+        self.renderer = None  # Artistas persistentes do painel de exploração
+        self.artists = None
+        self.frames = []      # Quadros gravados por record_steps
+        
+        # Contadores e tempos por fase, opcionais (ver grafos.instrument)
+        self.stats = stats
         
         # Para construção da árvore DFS
         self.tree_edges = []  # Arestas que formam a árvore DFS
@@ -36,28 +68,25 @@ class DFSVisualization:
         self.discovery_time = {}  # Tempo de descoberta de cada vértice
         self.finish_time = {}     # Tempo de finalização de cada vértice
         self.time_counter = 0
+        self.tree_layout = IncrementalTreeLayout(spacing=1.5)  # Posições fixas na árvore
         
         # Para mostrar o backtracking
         self.backtrack_edges = []  # Arestas usadas no backtracking
         
+        # Componentes fortemente conexas já encontradas (record_scc_steps)
+        self.components = []
+        
     def show_initial_graph(self):
         """Mostra o grafo inicial antes de começar o algoritmo"""
         self.fig, (self.ax1, self.ax2, self.ax3) = plt.subplots(1, 3, figsize=(20, 8))
+        self.renderer = None
         
-        # Cria o grafo NetworkX
-        G = nx.Graph()
-        for vertex, neighbors in self.graph.items():
-            for neighbor in neighbors:
-                G.add_edge(vertex, neighbor)
-        
-        # Posicionamento fixo dos vértices para toda a animação
-        self.pos = nx.spring_layout(G, seed=42)
+        self.compute_layout()
         
-        # Subplot 1: Grafo original
-        nx.draw_networkx_edges(G, self.pos, edge_color='blue', width=2, alpha=0.7, ax=self.ax1)
-        nx.draw_networkx_nodes(G, self.pos, node_color='lightblue', 
-                              node_size=1500, alpha=0.9, ax=self.ax1)
-        nx.draw_networkx_labels(G, self.pos, font_size=16, font_weight='bold', ax=self.ax1)
+        # Subplot 1: Grafo original (com nível de detalhe; ver grafos.render)
+        GraphRenderer(self.ax1, self.pos, self.vertices, self.edge_list(),
+                      node_color='lightblue', node_size=1500, edge_color='blue', edge_width=2,
+                      edge_alpha=0.7, font_size=16, blit=False)
         
         self.ax1.set_title("GRAFO ORIGINAL", fontsize=14, fontweight='bold', color='blue')
         self.ax1.axis('off')
@@ -77,7 +106,7 @@ class DFSVisualization:
         info_text.append("")
         info_text.append("🔗 ADJACÊNCIAS:")
         for vertex, neighbors in self.graph.items():
-            neighbors_str = ", ".join(neighbors)
+            neighbors_str = ", ".join(map(str, neighbors))
             info_text.append(f"   {vertex}: {neighbors_str}")
         
         info_text.append("")
@@ -93,19 +122,50 @@ class DFSVisualization:
                      bbox=dict(boxstyle='round,pad=0.5', facecolor='lightcyan', alpha=0.8))
         
         plt.tight_layout()
-        plt.draw()
-        plt.pause(3)  # Mostra por 3 segundos
+        plt.draw()  # Fica na tela até o primeiro passo (ver play)
+    
+    def compute_layout(self):
+        """Calcula o posicionamento fixo dos vértices para toda a animação (em cache no disco)"""
+        self.pos = layout.spring_layout(self.csr, seed=42)
+        return self.pos
+    
+    def edge_list(self):
+        """Arestas ``(u, v)`` do grafo, sem repetição"""
+        label_of = self.csr.label_of
+        src, dst, _, _ = self.csr.unique_edges()
+        return [(label_of(u), label_of(v)) for u, v in zip(src.tolist(), dst.tolist())]
     
-    def dfs_algorithm(self, start_vertex='A'):
-        """Algoritmo DFS com visualização passo a passo"""
+    def dfs_algorithm(self, start_vertex='A', mode='auto', interval=2.0):
+        """Algoritmo DFS com visualização passo a passo
+        
+        O algoritmo roda sem pausas gravando os passos, que depois são mostrados
+        por grafos.stepper: mode='auto' (um passo a cada interval segundos),
+        'keys' (um passo por tecla) ou 'benchmark' (sem espera).
+        """
         print("🌟 ALGORITMO DFS - BUSCA EM PROFUNDIDADE")
         print("=" * 50)
         print("📊 Mostrando grafo inicial...")
-        self.show_initial_graph()
+        with phase(self.stats, 'render'):
+            self.show_initial_graph()
+        
+        with phase(self.stats, 'main_loop'):
+            path = self.record_steps(start_vertex)
+        with phase(self.stats, 'render'):
+            self.play(mode, interval)
+        return path
+    
+    def record_steps(self, start_vertex='A'):
+        """Executa o DFS sem pausas, gravando um quadro por passo em self.frames
+        
+        Os quadros são gravados como deltas (grafos.state_log.FrameLog) e
+        montados por frame_of só quando são lidos.
+        """
+        self.frames = FrameLog(self.frame_of, FRAME_COLLECTIONS)
+        frames = self.frames
         
         print("📊 Grafo original:")
         for vertex, neighbors in self.graph.items():
-            neighbors_str = ", ".join(neighbors)
+            neighbors_str = ", ".join(map(str, neighbors))
             print(f"   {vertex}: {neighbors_str}")
         
         print(f"\n🚀 Iniciando DFS do vértice: {start_vertex}")
@@ -115,23 +175,26 @@ class DFSVisualization:
         # Inicialização
         self.visited = set()
         self.stack = [start_vertex]
+        self.on_stack = {start_vertex}
         self.path = []
         self.tree_edges = []
         self.parent = {}
         self.discovery_time = {}
         self.finish_time = {}
         self.time_counter = 0
+        self.tree_layout = IncrementalTreeLayout(spacing=1.5)
         self.backtrack_edges = []
+        self.components = []
+        frames.set('stack', start_vertex)
         step = 0
         
         # Primeiro passo: adiciona o vértice inicial
         print(f"\nPasso {step}: Iniciando com vértice {start_vertex}")
         print(f"   📚 Pilha: {self.stack}")
-        print(f"   ✅ Visitados: {sorted(self.visited)}")
+        print(f"   ✅ Visitados: {len(self.visited)}")
         
         self.current_vertex = start_vertex
-        self.visualize_step(f"Iniciando com vértice {start_vertex}", step)
-        time.sleep(2)
+        self.record_step(f"Iniciando com vértice {start_vertex}")
         
         step += 1
         
@@ -147,9 +210,15 @@ class DFSVisualization:
                 self.path.append(current)
                 self.discovery_time[current] = self.time_counter
                 self.time_counter += 1
+                # Entra na árvore desenhada; a posição não muda mais (O(1))
+                self.tree_layout.add(current, self.parent.get(current))
+                frames.set('visited', current, self.discovery_time[current])
+                frames.set('tree', current, self.parent.get(current))
                 
                 print(f"   🎯 Vértice {current} visitado!")
-                print(f"   📋 Caminho atual: {' → '.join(self.path)}")
+                # Só o que mudou no passo e os tamanhos: listar caminho e pilha a
+                # cada passo custaria O(V) por passo, O(V²) na execução
+                print(f"   📋 Caminho atual: {len(self.path)} vértices (... → {current})")
                 print(f"   ⏰ Tempo de descoberta: {self.discovery_time[current]}")
                 
                 # Encontra vizinhos não visitados
@@ -162,58 +231,70 @@ class DFSVisualization:
                     # Adiciona vizinhos à pilha (ordem reversa para manter ordem alfabética)
                     neighbors_added = []
                     for neighbor in reversed(sorted(unvisited_neighbors)):
-                        if neighbor not in self.stack:
+                        if neighbor not in self.on_stack:
                             self.stack.append(neighbor)
+                            self.on_stack.add(neighbor)
                             neighbors_added.append(neighbor)
                             
                             # Constrói a árvore DFS
                             self.parent[neighbor] = current
                             self.tree_edges.append((current, neighbor))
+                            frames.set('stack', neighbor)
+                            frames.set('tree_edges', (current, neighbor))
                     
                     if neighbors_added:
-                        neighbors_str = ", ".join(reversed(neighbors_added))
+                        neighbors_str = ", ".join(map(str, reversed(neighbors_added)))
                         print(f"   ➕ Adicionados à pilha: {neighbors_str}")
                 else:
                     print(f"   🔚 Sem vizinhos não visitados")
                 
-                print(f"   📚 Pilha atual: {self.stack}")
-                print(f"   ✅ Visitados: {sorted(self.visited)}")
+                print(f"   📚 Pilha atual: {len(self.stack)} vértices (topo: {self.stack[-1]})")
+                print(f"   ✅ Visitados: {len(self.visited)} (+{current})")
                 
-                # Atualiza visualização
+                # Grava o passo para a visualização
                 self.current_vertex = current
-                self.visualize_step(f"Processando vértice {current}", step)
+                self.record_step(f"Processando vértice {current}")
                 
                 step += 1
-                time.sleep(2)
             else:
                 # Vértice já visitado, faz backtracking
                 finished_vertex = self.stack.pop()
+                self.on_stack.discard(finished_vertex)
                 self.finish_time[finished_vertex] = self.time_counter
                 self.time_counter += 1
+                frames.remove('stack', finished_vertex)
+                frames.set('finish', finished_vertex, self.finish_time[finished_vertex])
                 
                 print(f"   🔙 Backtrack de {finished_vertex}")
                 print(f"   ⏰ Tempo de finalização: {self.finish_time[finished_vertex]}")
-                print(f"   📚 Pilha após backtrack: {self.stack}")
+                if self.stack:
+                    print(f"   📚 Pilha após backtrack: {len(self.stack)} vértices "
+                          f"(topo: {self.stack[-1]})")
+                else:
+                    print("   📚 Pilha após backtrack: vazia")
                 
                 # Adiciona aresta de backtrack para visualização
                 if self.stack and finished_vertex in self.parent:
                     parent_vertex = self.parent[finished_vertex]
-                    if parent_vertex in self.stack:
+                    if parent_vertex in self.on_stack:
                         self.backtrack_edges.append((finished_vertex, parent_vertex))
+                        frames.set('backtrack', (finished_vertex, parent_vertex))
                 
-                # Atualiza visualização
+                # Grava o passo para a visualização
                 if self.stack:
                     self.current_vertex = self.stack[-1]
                 else:
                     self.current_vertex = None
                     
-                self.visualize_step(f"Backtrack de {finished_vertex}", step)
+                self.record_step(f"Backtrack de {finished_vertex}")
                 
                 step += 1
-                time.sleep(1.5)
+        
+        if self.stats is not None:
+            count_traversal(self.stats, self.csr, [self.csr.id_of(v) for v in self.path])
         
         print(f"\n🎉 DFS CONCLUÍDO!")
-        print(f"📋 Ordem de visitação: {' → '.join(self.path)}")
+        print(f"📋 Ordem de visitação: {' → '.join(map(str, self.path))}")
         print(f"✅ Total de vértices visitados: {len(self.visited)}")
         
         # Mostra tempos de descoberta e finalização
@@ -225,250 +306,351 @@ class DFSVisualization:
         
         return self.path
     
-    def visualize_step(self, title, step):
-        """Visualiza o estado atual do algoritmo DFS com árvore"""
-        # Limpa os subplots
-        self.ax1.clear()
-        self.ax2.clear()
-        self.ax3.clear()
-        
-        # Cria o grafo NetworkX
-        G = nx.Graph()
-        for vertex, neighbors in self.graph.items():
-            for neighbor in neighbors:
-                G.add_edge(vertex, neighbor)
-        
-        # SUBPLOT 1: Grafo original com estado atual
-        # Desenha todas as arestas em cinza claro
-        nx.draw_networkx_edges(G, self.pos, edge_color='lightgray', width=1, alpha=0.5, ax=self.ax1)
-        
-        # Desenha arestas da árvore DFS em verde
-        if self.tree_edges:
-            tree_graph = nx.Graph()
-            for edge in self.tree_edges:
-                if edge[0] in self.visited and edge[1] in self.visited:
-                    tree_graph.add_edge(edge[0], edge[1])
-            
-            if len(tree_graph.edges()) > 0:
-                nx.draw_networkx_edges(tree_graph, self.pos, edge_color='green', 
-                                     width=3, ax=self.ax1)
-        
-        # Desenha arestas de backtrack em vermelho pontilhado
-        if self.backtrack_edges:
-            backtrack_graph = nx.Graph()
-            backtrack_graph.add_edges_from(self.backtrack_edges)
-            nx.draw_networkx_edges(backtrack_graph, self.pos, edge_color='red', 
-                                 width=2, style='dashed', alpha=0.7, ax=self.ax1)
-        
-        # Define cores dos vértices
-        node_colors = []
-        for vertex in self.vertices:
-            if vertex == self.current_vertex:
-                node_colors.append('red')  # Vértice sendo processado
-            elif vertex in self.visited:
-                node_colors.append('lightgreen')  # Vértices visitados
-            elif vertex in self.stack:
-                node_colors.append('orange')  # Vértices na pilha
-            else:
-                node_colors.append('lightgray')  # Vértices não visitados
+    def scc_algorithm(self, method='tarjan', mode='auto', interval=2.0):
+        """Componentes fortemente conexas com visualização passo a passo
         
-        # Desenha os vértices
-        nx.draw_networkx_nodes(G, self.pos, node_color=node_colors, 
-                              node_size=1200, alpha=0.9, ax=self.ax1)
-        
-        # Adiciona labels dos vértices com tempos
-        labels = {}
-        for vertex in self.vertices:
-            if vertex in self.discovery_time and vertex in self.finish_time:
-                labels[vertex] = f"{vertex}\n{self.discovery_time[vertex]}/{self.finish_time[vertex]}"
-            elif vertex in self.discovery_time:
-                labels[vertex] = f"{vertex}\n{self.discovery_time[vertex]}/-"
-            else:
-                labels[vertex] = vertex
-        
-        nx.draw_networkx_labels(G, self.pos, labels, font_size=10, font_weight='bold', ax=self.ax1)
-        
-        self.ax1.set_title(f"EXPLORAÇÃO DFS - {title}", fontsize=12, fontweight='bold')
-        self.ax1.axis('off')
+        method: 'tarjan' ou 'kosaraju' (ver grafos.scc). Os passos são os
+        mesmos do DFS, mais um passo por componente encontrada.
+        """
+        print(f"🌟 COMPONENTES FORTEMENTE CONEXAS - {method.upper()}")
+        print("=" * 50)
+        print("📊 Mostrando grafo inicial...")
+        with phase(self.stats, 'render'):
+            self.show_initial_graph()
+        
+        with phase(self.stats, 'main_loop'):
+            components = self.record_scc_steps(method)
+        with phase(self.stats, 'render'):
+            self.play(mode, interval)
+        return components
+    
+    def record_scc_steps(self, method='tarjan'):
+        """Executa Tarjan ou Kosaraju (grafos.scc), gravando um quadro por evento
+        
+        Os eventos DISCOVER/FINISH do motor viram os mesmos passos de
+        record_steps ("Processando vértice", "Backtrack de"), e cada CFC
+        completa vira um passo. No Kosaraju, a segunda passada (em Gᵀ)
+        recomeça a árvore; o painel da árvore só mostra a floresta de Gᵀ, cujas
+        árvores são as CFCs. Retorna as CFCs como listas de rótulos.
+        """
+        engines = {'tarjan': tarjan_scc, 'kosaraju': kosaraju_scc}
+        if method not in engines:
+            raise ValueError(f"método desconhecido: {method}")
+        self.frames = FrameLog(self.frame_of, FRAME_COLLECTIONS)
+        frames = self.frames
+        self.components = []
+        label_of = self.csr.label_of
+        current_pass = None
+        
+        def reset():
+            self.visited = set()
+            self.stack = []
+            self.on_stack = set()
+            self.path = []
+            self.tree_edges = []
+            self.parent = {}
+            self.discovery_time = {}
+            self.finish_time = {}
+            self.time_counter = 0
+            self.tree_layout = IncrementalTreeLayout(spacing=1.5)
+            self.backtrack_edges = []
+            self.current_vertex = None
+            for name in FRAME_COLLECTIONS:
+                if name != 'components':
+                    frames.clear(name)
+        
+        def on_step(event, vertex, info):
+            nonlocal current_pass
+            if event == PASS:
+                current_pass = vertex
+                reset()
+                graph_name = "G" if vertex == 1 else "Gᵀ (transposto)"
+                print(f"\n🔁 Passada {vertex}: DFS em {graph_name}")
+                self.record_step(f"Passada {vertex}: DFS em {graph_name}")
+            elif event == DISCOVER:
+                current = label_of(vertex)
+                self.visited.add(current)
+                self.path.append(current)
+                self.stack.append(current)
+                self.on_stack.add(current)
+                self.discovery_time[current] = self.time_counter
+                self.time_counter += 1
+                frames.set('stack', current)
+                frames.set('visited', current, self.discovery_time[current])
+                if info >= 0:
+                    self.parent[current] = label_of(info)
+                    self.tree_edges.append((label_of(info), current))
+                    frames.set('tree_edges', (label_of(info), current))
+                if current_pass != 1:
+                    self.tree_layout.add(current, self.parent.get(current))
+                    frames.set('tree', current, self.parent.get(current))
+                self.current_vertex = current
+                print(f"   🎯 Vértice {current} visitado!")
+                self.record_step(f"Processando vértice {current}")
+            elif event == FINISH:
+                finished_vertex = self.stack.pop()
+                self.on_stack.discard(finished_vertex)
+                self.finish_time[finished_vertex] = self.time_counter
+                self.time_counter += 1
+                frames.remove('stack', finished_vertex)
+                frames.set('finish', finished_vertex, self.finish_time[finished_vertex])
+                parent_vertex = self.parent.get(finished_vertex)
+                if parent_vertex in self.on_stack:
+                    self.backtrack_edges.append((finished_vertex, parent_vertex))
+                    frames.set('backtrack', (finished_vertex, parent_vertex))
+                self.current_vertex = self.stack[-1] if self.stack else None
+                print(f"   🔙 Backtrack de {finished_vertex}")
+                self.record_step(f"Backtrack de {finished_vertex}")
+            elif event == COMPONENT:
+                members = [label_of(v) for v in info.tolist()]
+                self.components.append(members)
+                frames.set('components', len(self.components) - 1, tuple(members))
+                members_str = ", ".join(map(str, members))
+                print(f"   🔗 CFC {len(self.components)}: {{{members_str}}}")
+                self.record_step(f"CFC {len(self.components)}: {{{members_str}}}")
+        
+        reset()
+        result = engines[method](self.csr, stats=self.stats, on_step=on_step)
+        
+        print(f"\n🎉 {result.num_components} COMPONENTES FORTEMENTE CONEXAS")
+        for i, members in enumerate(result.component_labels()):
+            print(f"   {i}: {{{', '.join(map(str, members))}}}")
+        return result.component_labels()
+    
+    def run_headless(self, start_vertex='A'):
+        """Executa o DFS sem desenho nem pausas (ver grafos.traversal)"""
+        return dfs_traversal(self.csr, self.csr.id_of(start_vertex), stats=self.stats)
+    
+    def run_engine(self, start_vertex='A'):
+        """Executa a DFS iterativa com cursor (grafos.dfs) e preenche o estado do desenho
+        
+        Ao contrário de dfs_algorithm, os tempos e a árvore são os de uma DFS real,
+        e cada aresta recebe sua classificação (árvore, retorno, avanço, cruzamento).
+        """
+        result = iterative_dfs(self.csr, self.csr.id_of(start_vertex), stats=self.stats)
+        self.path = result.path_labels()
+        self.visited = set(self.path)
+        self.stack = []
+        self.on_stack = set()
+        self.parent = result.parent_labels()
+        self.tree_edges = result.tree_edge_labels()
+        self.discovery_time, self.finish_time = result.time_labels()
+        self.time_counter = 2 * len(self.path)
+        self.tree_layout = IncrementalTreeLayout.from_parents(self.path, self.parent, spacing=1.5)
+        self.backtrack_edges = []
+        self.current_vertex = None
         
-        # Legenda
-        from matplotlib.lines import Line2D
-        legend_elements = [
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='red', 
-                   markersize=15, label='Vértice atual'),
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='lightgreen', 
-                   markersize=15, label='Visitados'),
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='orange', 
-                   markersize=15, label='Na pilha'),
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='lightgray', 
-                   markersize=15, label='Não visitados'),
-            Line2D([0], [0], color='green', lw=3, label='Árvore DFS'),
-            Line2D([0], [0], color='red', lw=2, linestyle='--', label='Backtrack')
+        # Classificação das arestas: {(u, v): tipo}
+        label_of = self.csr.label_of
+        sources = self.csr.arc_sources()
+        self.edge_types = {
+            (label_of(u), label_of(v)): EDGE_TYPE_NAMES[t]
+            for u, v, t in zip(sources.tolist(), self.csr.indices.tolist(),
+                               result.edge_types.tolist())
+            if t in EDGE_TYPE_NAMES
+        }
+        return self.path
+    
+    def build_scene(self):
+        """Descreve os três subplots (exploração, informações e árvore) para grafos.export
+        
+        A árvore é criada já completa (depois de record_steps), com vértices,
+        arestas e rótulos invisíveis; cada quadro só revela os já visitados.
+        """
+        edges = self.edge_list()
+        
+        # Legenda (estática, fica no fundo)
+        legend = [
+            dict(marker='o', color='w', markerfacecolor='red', markersize=15, label='Vértice atual'),
+            dict(marker='o', color='w', markerfacecolor='lightgreen', markersize=15, label='Visitados'),
+            dict(marker='o', color='w', markerfacecolor='orange', markersize=15, label='Na pilha'),
+            dict(marker='o', color='w', markerfacecolor='lightgray', markersize=15, label='Não visitados'),
+            dict(color='green', lw=3, label='Árvore DFS'),
+            dict(color='red', lw=2, linestyle='--', label='Backtrack'),
         ]
-        self.ax1.legend(handles=legend_elements, loc='upper right', fontsize=9)
+        tree_vertices = list(self.tree_layout.pos)
+        
+        scene = export.Scene(figsize=(20, 8))
+        scene.add_graph('graph', self.pos, self.vertices, edges, legend=legend,
+                        title=("EXPLORAÇÃO DFS", dict(fontsize=12, fontweight='bold')),
+                        node_size=1200, edge_width=1, edge_alpha=0.5, font_size=10)
+        scene.add_text('info', 0.05, 0.95, fontsize=10, verticalalignment='top',
+                       fontfamily='monospace',
+                       bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.8))
+        scene.add_graph('tree', self.tree_layout.pos, tree_vertices, self.tree_layout.edges(),
+                        title=("ÁRVORE DFS", dict(fontsize=12, fontweight='bold', color='green')),
+                        node_size=800, node_alpha=0.0, edge_alpha=0.0, font_size=9,
+                        margins=(0.15, 0.25), label_text={vertex: '' for vertex in tree_vertices})
+        scene.add_text('tree_info', 0.02, 0.98, panel='tree', fontsize=10,
+                       verticalalignment='top',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7))
+        scene.add_text('tree_message', 0.5, 0.5, panel='tree', fontsize=12, ha='center',
+                       va='center',
+                       bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.5))
+        return scene
+    
+    def setup_renderer(self):
+        """Cria uma única vez os artistas dos três subplots (ver grafos.render)"""
+        for ax in (self.ax1, self.ax2, self.ax3):
+            ax.clear()
+        self.artists = self.build_scene().build(
+            self.fig, axes={'graph': self.ax1, 'info': self.ax2, 'tree': self.ax3})
+        self.renderer = self.artists['graph']
+    
+    def frame_of(self, state):
+        """Quadro dos três subplots a partir de um estado gravado (ver GraphRenderer.apply)"""
+        stack, visited, finish = state['stack'], state['visited'], state['finish']
+        current = state['current']
+        
+        # SUBPLOT 1: Grafo original com estado atual (só muda o estilo dos artistas)
+        # Cores dos vértices: não visitados (cinza, base) < na pilha < visitados < atual
+        nodes = [(list(stack), 'orange', None),
+                 (list(visited), 'lightgreen', None)]
+        if current is not None:
+            nodes.append(([current], 'red', None))
+        
+        # Labels dos vértices com tempos (só os descobertos mudam)
+        labels = {}
+        for vertex, discovery in visited.items():
+            labels[vertex] = f"{vertex}\n{discovery}/{finish.get(vertex, '-')}"
+        
+        # Arestas da árvore que conectam vértices já visitados
+        tree_edges = [edge for edge in state['tree_edges']
+                      if edge[0] in visited and edge[1] in visited]
+        
+        graph = {
+            'nodes': nodes,
+            'edges': [
+                # Arestas da árvore DFS em verde
+                (tree_edges, 'green', 3, 'solid', None),
+                # Arestas de backtrack em vermelho pontilhado
+                (list(state['backtrack']), 'red', 2, 'dashed', 0.7),
+            ],
+            'labels': labels,
+            'title': (f"EXPLORAÇÃO DFS - {state['title']}",
+                      dict(fontsize=12, fontweight='bold')),
+        }
         
         # SUBPLOT 2: Informações do algoritmo
-        self.ax2.axis('off')
-        
         info_text = []
         info_text.append("ESTADO ATUAL DO DFS")
         info_text.append("=" * 25)
         info_text.append("")
         
         # Vértice atual
-        if self.current_vertex:
-            info_text.append(f"🎯 Processando: {self.current_vertex}")
-            if self.current_vertex in self.discovery_time:
-                info_text.append(f"   Descoberta: {self.discovery_time[self.current_vertex]}")
+        if current is not None:
+            info_text.append(f"🎯 Processando: {current}")
+            if current in visited:
+                info_text.append(f"   Descoberta: {visited[current]}")
         info_text.append("")
         
         # Pilha atual
-        if self.stack:
-            stack_str = " ← ".join(reversed(self.stack))  # Mostra do topo para baixo
+        if stack:
+            stack_str = " ← ".join(map(str, reversed(stack)))  # Mostra do topo para baixo
             info_text.append("📚 PILHA (topo → base):")
             info_text.append(f"   {stack_str}")
         else:
             info_text.append("📚 PILHA: Vazia")
         info_text.append("")
         
-        # Visitados
-        if self.visited:
-            visited_str = ", ".join(sorted(self.visited))
-            info_text.append(f"✅ VISITADOS: {visited_str}")
+        # Visitados (quais são aparece em ORDEM DE VISITA; ordenar a cada quadro seria O(V log V))
+        if visited:
+            info_text.append(f"✅ VISITADOS: {len(visited)}")
         else:
             info_text.append("✅ VISITADOS: Nenhum")
         info_text.append("")
         
-        # Caminho
-        if self.path:
-            path_str = " → ".join(self.path)
+        # Caminho (os visitados estão em ordem de visita)
+        if visited:
+            path_str = " → ".join(map(str, visited))
             info_text.append("📋 ORDEM DE VISITA:")
             info_text.append(f"   {path_str}")
         
-        # Tempos
-        if self.discovery_time:
+        # Componentes fortemente conexas (record_scc_steps)
+        if state['components']:
             info_text.append("")
-            info_text.append("⏰ TEMPOS (desc/fin):")
-            for vertex in sorted(self.discovery_time.keys()):
-                discovery = self.discovery_time[vertex]
-                finish = self.finish_time.get(vertex, '-')
-                info_text.append(f"   {vertex}: {discovery}/{finish}")
+            info_text.append("🔗 CFCs:")
+            for members in state['components'].values():
+                info_text.append(f"   {{{', '.join(map(str, members))}}}")
         
-        text_content = "\n".join(info_text)
-        self.ax2.text(0.05, 0.95, text_content, transform=self.ax2.transAxes, fontsize=10,
-                     verticalalignment='top', fontfamily='monospace',
-                     bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.8))
-        
-        # SUBPLOT 3: Árvore DFS
-        self.draw_dfs_tree()
-        
-        plt.tight_layout()
-        plt.draw()
-        plt.pause(0.1)  # Pequena pausa para renderização
-    
-    def draw_dfs_tree(self):
-        """Desenha a árvore DFS no subplot 3"""
-        self.ax3.clear()
-        self.ax3.set_title("ÁRVORE DFS", fontsize=12, fontweight='bold', color='green')
-        self.ax3.axis('off')
+        # Tempos, em ordem de descoberta (a do FrameLog; sem ordenar a cada quadro)
+        if visited:
+            info_text.append("")
+            info_text.append("⏰ TEMPOS (desc/fin):")
+            for vertex in visited:
+                info_text.append(f"   {vertex}: {visited[vertex]}/{finish.get(vertex, '-')}")
         
-        if not self.tree_edges:
+        # SUBPLOT 3: Árvore DFS (só vértices já visitados, nas posições fixas de tree_layout)
+        tree, tree_info, tree_message = {}, "", ""
+        if not state['tree_edges'] or not state['tree']:
             # Se não há árvore ainda, mostra mensagem
-            self.ax3.text(0.5, 0.5, "Árvore será\nconstruída\nconforme DFS\nprogredir", 
-                         transform=self.ax3.transAxes, fontsize=12, ha='center', va='center',
-                         bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.5))
-            return
-        
-        # Cria um grafo da árvore DFS apenas com nós visitados
-        tree_graph = nx.Graph()
-        
-        # Adiciona apenas arestas que conectam nós já visitados
-        for edge in self.tree_edges:
-            if edge[0] in self.visited and edge[1] in self.visited:
-                tree_graph.add_edge(edge[0], edge[1])
-        
-        # Adiciona nós visitados que podem estar isolados
-        for vertex in self.visited:
-            tree_graph.add_node(vertex)
-        
-        if len(tree_graph.nodes()) == 0:
-            return
-        
-        # Usa layout de árvore hierárquico
-        try:
-            # Tenta criar um layout hierárquico
-            root = self.path[0] if self.path else list(self.visited)[0]
-            tree_pos = nx.nx_agraph.graphviz_layout(tree_graph, prog='dot', root=root)
-        except:
-            # Fallback para spring layout
-            tree_pos = nx.spring_layout(tree_graph, k=2, iterations=50)
-        
-        # Desenha as arestas da árvore
-        if len(tree_graph.edges()) > 0:
-            nx.draw_networkx_edges(tree_graph, tree_pos, edge_color='darkgreen', 
-                                 width=2, ax=self.ax3)
-        
-        # Define cores dos nós na árvore
-        tree_node_colors = []
-        for vertex in tree_graph.nodes():
-            if vertex == self.current_vertex:
-                tree_node_colors.append('red')
-            elif vertex in self.visited:
-                tree_node_colors.append('lightgreen')
-            else:
-                tree_node_colors.append('orange')
-        
-        # Desenha os nós da árvore
-        nx.draw_networkx_nodes(tree_graph, tree_pos, node_color=tree_node_colors, 
-                              node_size=800, alpha=0.9, ax=self.ax3)
-        
-        # Adiciona labels com tempos
-        tree_labels = {}
-        for vertex in tree_graph.nodes():
-            if vertex in self.discovery_time and vertex in self.finish_time:
-                tree_labels[vertex] = f"{vertex}\n{self.discovery_time[vertex]}/{self.finish_time[vertex]}"
-            elif vertex in self.discovery_time:
-                tree_labels[vertex] = f"{vertex}\n{self.discovery_time[vertex]}/-"
-            else:
-                tree_labels[vertex] = vertex
-        
-        nx.draw_networkx_labels(tree_graph, tree_pos, tree_labels, font_size=9, 
-                               font_weight='bold', ax=self.ax3)
-        
-        # Adiciona informações sobre a árvore
-        visited_count = len(self.visited)
-        tree_info = f"Nós visitados: {visited_count}\nArestas da árvore: {len(self.tree_edges)}"
-        self.ax3.text(0.02, 0.98, tree_info, transform=self.ax3.transAxes, fontsize=10,
-                     verticalalignment='top',
-                     bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7))
+            tree_message = "Árvore será\nconstruída\nconforme DFS\nprogredir"
+        else:
+            tree_nodes = [(list(state['tree']), 'lightgreen', None)]
+            if current in state['tree']:
+                tree_nodes.append(([current], 'red', None))
+            tree = {
+                'nodes': tree_nodes,
+                'edges': [([(parent, vertex) for vertex, parent in state['tree'].items()
+                            if parent is not None], 'darkgreen', 2, 'solid', None)],
+                'labels': labels,
+            }
+            tree_info = (f"Nós visitados: {len(visited)}\n"
+                         f"Arestas da árvore: {len(state['tree_edges'])}")
+        
+        return {'graph': graph, 'info': "\n".join(info_text), 'tree': tree,
+                'tree_info': tree_info, 'tree_message': tree_message}
+    
+    def record_step(self, title):
+        """Fecha o quadro com os deltas do passo atual do algoritmo DFS"""
+        with phase(self.stats, 'record'):
+            self.frames.commit(title=title, current=self.current_vertex)
+    
+    def show_frame(self, frame):
+        """Desenha um quadro gravado nos três subplots"""
+        if self.renderer is None:
+            self.setup_renderer()
+        export.Scene.apply(self.artists, frame)
+        self.renderer.draw()
+    
+    def play(self, mode='auto', interval=2.0):
+        """Mostra os quadros gravados pelo laço de eventos (ver grafos.stepper)"""
+        frames = self.frames
+        print(f"\n🎬 Mostrando {len(frames)} passos (modo: {mode})...")
+        return Stepper(self.fig, frames, lambda i: self.show_frame(frames[i]),
+                       mode=mode, interval=interval).run()
+    
+    def export_animation(self, path, start_vertex='A', fps=0.5, workers=None, dpi=100):
+        """Grava o DFS e exporta sem abrir janela: .gif, .mp4 ou diretório de PNGs
+        
+        Os quadros são desenhados em paralelo por grafos.export, com os três
+        subplots da visualização.
+        """
+        self.compute_layout()
+        with phase(self.stats, 'main_loop'):
+            self.record_steps(start_vertex)
+        frames = self.frames
+        
+        print(f"\n🎬 Exportando {len(frames)} quadros para {path}...")
+        with phase(self.stats, 'render'):
+            export.export_animation(self.build_scene(), frames, path, fps=fps,
+                                    workers=workers, dpi=dpi)
+        print(f"✅ Animação salva em {path}")
+        return path
     
     def create_final_visualization(self, path):
         """Cria a visualização final do DFS com árvore completa"""
+        # Desliga os artistas persistentes antes de limpar os subplots
+        if self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+        
         # Limpa o conteúdo anterior
         self.ax1.clear()
         self.ax2.clear()
         self.ax3.clear()
         
         # SUBPLOT 1: Grafo original com árvore DFS
-        G = nx.Graph()
-        for vertex, neighbors in self.graph.items():
-            for neighbor in neighbors:
-                G.add_edge(vertex, neighbor)
-        
-        # Desenha todas as arestas em cinza claro
-        nx.draw_networkx_edges(G, self.pos, edge_color='lightgray', width=1, alpha=0.3, ax=self.ax1)
-        
-        # Desenha a árvore DFS em verde
-        if self.tree_edges:
-            tree_graph = nx.Graph()
-            tree_graph.add_edges_from(self.tree_edges)
-            nx.draw_networkx_edges(tree_graph, self.pos, edge_color='green', 
-                                 width=4, ax=self.ax1)
-        
-        # Desenha os vértices - todos visitados em verde
-        nx.draw_networkx_nodes(G, self.pos, node_color='lightgreen', 
-                              node_size=1500, alpha=0.9, ax=self.ax1)
-        
         # Labels dos vértices com tempos
         final_labels = {}
         for vertex in self.vertices:
@@ -477,9 +659,15 @@ class DFSVisualization:
             else:
                 final_labels[vertex] = vertex
         
-        nx.draw_networkx_labels(G, self.pos, final_labels, font_size=12, font_weight='bold', ax=self.ax1)
+        # Todas as arestas em cinza claro e os vértices - todos visitados em verde
+        final = GraphRenderer(self.ax1, self.pos, self.vertices, self.edge_list(),
+                              node_color='lightgreen', node_size=1500, edge_alpha=0.3,
+                              font_size=12, label_text=final_labels, blit=False)
+        
+        # Árvore DFS em verde
+        final.apply({'edges': [(self.tree_edges, 'green', 4, 'solid', None)]})
         
-        self.ax1.set_title(f"GRAFO COM ÁRVORE DFS\nOrdem: {' → '.join(path)}", 
+        self.ax1.set_title(f"GRAFO COM ÁRVORE DFS\nOrdem: {' → '.join(map(str, path))}", 
                           fontsize=14, fontweight='bold', color='darkgreen')
         self.ax1.axis('off')
         
@@ -527,39 +715,19 @@ class DFSVisualization:
         self.ax3.set_title("ÁRVORE DFS COMPLETA", fontsize=14, fontweight='bold', color='darkgreen')
         self.ax3.axis('off')
         
-        # Desenha a árvore completa
+        # Desenha a árvore completa, no layout hierárquico da animação
         if self.tree_edges:
-            tree_graph = nx.Graph()
-            tree_graph.add_edges_from(self.tree_edges)
-            
-            # Adiciona todos os vértices visitados
-            for vertex in self.visited:
-                tree_graph.add_node(vertex)
-            
-            # Layout hierárquico
-            try:
-                root = path[0] if path else 'A'
-                tree_pos = nx.nx_agraph.graphviz_layout(tree_graph, prog='dot', root=root)
-            except:
-                tree_pos = nx.spring_layout(tree_graph, k=2, iterations=50)
-            
-            # Desenha arestas da árvore
-            nx.draw_networkx_edges(tree_graph, tree_pos, edge_color='darkgreen', 
-                                 width=3, ax=self.ax3)
-            
-            # Desenha nós da árvore
-            nx.draw_networkx_nodes(tree_graph, tree_pos, node_color='lightgreen', 
-                                  node_size=1000, alpha=0.9, ax=self.ax3)
-            
             # Labels com tempos
             tree_labels = {}
-            for vertex in tree_graph.nodes():
+            for vertex in self.tree_layout.pos:
                 discovery = self.discovery_time.get(vertex, 'N/A')
                 finish = self.finish_time.get(vertex, 'N/A')
                 tree_labels[vertex] = f"{vertex}\n{discovery}/{finish}"
             
-            nx.draw_networkx_labels(tree_graph, tree_pos, tree_labels, font_size=10, 
-                                   font_weight='bold', ax=self.ax3)
+            GraphRenderer(self.ax3, self.tree_layout.pos, list(self.tree_layout.pos),
+                          self.tree_layout.edges(), node_color='lightgreen', node_size=1000,
+                          edge_color='darkgreen', edge_width=3, edge_alpha=1.0, font_size=10,
+                          label_text=tree_labels, max_edges=None, blit=False)
             
             # Adiciona informação sobre a raiz
             root = path[0] if path else 'A'
@@ -578,15 +746,23 @@ class DFSVisualization:
         plt.ioff()  # Desliga modo interativo
         plt.show()
 
-def main():
-    """Função principal para executar a demonstração"""
+def main(mode='auto', graph_file=None):
+    """Função principal para executar a demonstração
+    
+    mode: 'auto', 'keys' ou 'benchmark' (ver grafos.stepper)
+    graph_file: arquivo do grafo (ver grafos.loaders); sem ele, usa o exemplo A–F
+    """
     print("🚀 Iniciando demonstração do Algoritmo DFS")
     print("⏳ Aguarde... A visualização será exibida passo a passo\n")
     
-    dfs_demo = DFSVisualization()
+    graph = load_graph(graph_file) if graph_file else None
+    dfs_demo = DFSVisualization(graph)
     
     # Executa o algoritmo
-    path = dfs_demo.dfs_algorithm(start_vertex='A')
+    # Num grafo carregado a busca começa no vértice de maior grau (como em
+    # benchmarks/suite.py): o vértice 0 pode estar isolado
+    start_vertex = 'A' if graph is None else graph.label_of(int(np.argmax(graph.degrees())))
+    path = dfs_demo.dfs_algorithm(start_vertex=start_vertex, mode=mode)
     
     # Visualização final
     print(f"\n📊 Criando visualização final...")
@@ -597,4 +773,6 @@ def main():
     print(f"   e mostrando os tempos de descoberta e finalização de cada vértice.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Argumentos opcionais: modo (auto, keys ou benchmark) e arquivo do grafo
+    main(sys.argv[1] if len(sys.argv) > 1 else 'auto',
+         sys.argv[2] if len(sys.argv) > 2 else None)
\ No newline at end of file
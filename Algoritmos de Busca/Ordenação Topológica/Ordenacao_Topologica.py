@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from grafos.csr import CSRGraph
+from grafos.loaders import load_graph
+from grafos.topological import CycleError, dfs_topological_sort, kahn_levels
+
+# Níveis maiores que isso são mostrados só pelo tamanho
+MAX_PRINTED = 12
+
+
+def example_graph():
+    """Exemplo do Readme: a ordem em que as peças de roupa são vestidas"""
+    return CSRGraph.from_adjacency({
+        'cueca': ['calça', 'sapatos'],
+        'calça': ['sapatos', 'cinto'],
+        'camisa': ['cinto', 'gravata'],
+        'gravata': ['paletó'],
+        'cinto': ['paletó'],
+        'meias': ['sapatos'],
+        'relógio': [],
+    }, directed=True)
+
+
+def show_levels(graph):
+    """Mostra os níveis de Kahn à medida que são gerados (cada um pode rodar em paralelo)"""
+    print("🧱 Níveis (tarefas de um mesmo nível podem rodar em paralelo):")
+    start = time.perf_counter()
+    total = 0
+    try:
+        for depth, level in enumerate(kahn_levels(graph)):
+            total += len(level)
+            if len(level) <= MAX_PRINTED:
+                labels = ", ".join(str(graph.label_of(v)) for v in level.tolist())
+            else:
+                labels = f"{len(level)} vértices"
+            print(f"   {depth}: {labels}")
+    except CycleError as error:
+        print(f"\n❌ {error}")
+        print(f"   {total} de {graph.num_vertices} vértices puderam ser ordenados")
+        return False
+    print(f"✅ {total} vértices em {depth + 1 if total else 0} níveis "
+          f"({time.perf_counter() - start:.3f}s)")
+    return True
+
+
+def show_dfs_order(graph):
+    """Mostra a ordem por tempos de término decrescentes (algoritmo do Readme)"""
+    result = dfs_topological_sort(graph)
+    if not result.is_dag():
+        cycle = " → ".join(map(str, result.cycle_labels() + result.cycle_labels()[:1]))
+        print(f"❌ Aresta de retorno encontrada, o grafo tem ciclo: {cycle}")
+        return False
+    order = result.order_labels()
+    if len(order) <= MAX_PRINTED:
+        print(f"📋 Ordem (DFS): {' → '.join(map(str, order))}")
+    else:
+        print(f"📋 Ordem (DFS): {len(order)} vértices, começando por "
+              f"{' → '.join(map(str, order[:MAX_PRINTED]))} ...")
+    return True
+
+
+def main(method='kahn', graph_file=None):
+    """Função principal para executar a demonstração
+
+    method: 'kahn' (níveis) ou 'dfs' (tempos de término; ver grafos.topological)
+    graph_file: arquivo do grafo, lido como dirigido (ver grafos.loaders); um
+        ``.csr`` já guarda se é dirigido
+    """
+    print(f"🚀 Ordenação topológica ({method})")
+    print("=" * 50)
+
+    if graph_file is None:
+        graph = example_graph()
+    elif graph_file.endswith('.csr'):
+        graph = load_graph(graph_file)
+    else:
+        graph = load_graph(graph_file, directed=True)
+
+    if method == 'kahn':
+        return show_levels(graph)
+    if method == 'dfs':
+        return show_dfs_order(graph)
+    raise ValueError(f"método desconhecido: {method}")
+
+
+if __name__ == "__main__":
+    # Argumentos opcionais: método (kahn ou dfs) e arquivo do grafo
+    ok = main(sys.argv[1] if len(sys.argv) > 1 else 'kahn',
+              sys.argv[2] if len(sys.argv) > 2 else None)
+    sys.exit(0 if ok else 1)
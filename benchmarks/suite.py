@@ -0,0 +1,299 @@
+"""
+Suíte de benchmarks de BFS, DFS, Kruskal e Prim em grafos sintéticos.
+
+Roda o núcleo de cálculo que ``bfs_algorithm``, ``dfs_algorithm``,
+``kruskal_algorithm`` e ``run_prim_algorithm`` usam, sem desenho nem pausas:
+
+* ``bfs`` / ``dfs``: ``grafos.traversal`` (mesmos passos dos visualizadores);
+* ``bfs-niveis``: ``grafos.bfs.direction_optimizing_bfs`` (``run_engine`` do BFS);
+* ``dfs-floresta``: ``grafos.dfs.iterative_dfs`` (``run_engine`` do DFS);
+* ``kruskal``, ``prim``, ``boruvka``: ``grafos.mst`` / ``grafos.boruvka``;
+* ``cfc-tarjan``, ``cfc-kosaraju``: ``grafos.scc`` (nos grafos não dirigidos
+  da suíte, as CFCs são as componentes conexas);
+* ``kruskal-nativo``, ``prim-nativo``: ``grafos.native`` (só se a biblioteca
+  estiver compilada). Antes de medir, a suíte roda ``native.check_parity`` e
+  para com erro se alguma MST nativa tiver peso diferente da versão Python.
+
+Os grafos vêm de ``grafos.generators``, em tamanhos de 10^min a 10^max
+arestas e com os graus médios pedidos (densidade). Para cada algoritmo são
+medidos o tempo (mínimo e mediana de ``--repeat`` execuções, sem os caches
+do ``CSRGraph``), o pico de memória alocada (``tracemalloc``, numa execução
+separada, porque o rastreamento deixa o código mais lento) e os passos por
+segundo. BFS, DFS e Prim partem do vértice de maior grau, gravado no JSON
+(``source``). Passos são os passos reportados pelo algoritmo
+(``result.steps``) ou, quando ele não reporta, os arcos que ele varre. No fim,
+o expoente de crescimento do tempo (inclinação log-log) resume a curva de
+escala de cada algoritmo.
+
+O resultado vai para um JSON com o ambiente (versões, commit, máquina), que
+pode ser comparado com uma execução anterior por ``--compare``. Com
+``--counters``, uma execução extra instrumentada (``grafos.instrument``)
+acrescenta a cada caso os contadores de operações e o tempo por fase.
+
+Uso:
+    python benchmarks/suite.py [--families er road rmat] [--min-exp 3] [--max-exp 6]
+                               [--degrees 4 16] [--output resultado.json] [--counters]
+    python benchmarks/suite.py --compare antes.json --output depois.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from grafos import generators, native
+from grafos.bfs import direction_optimizing_bfs
+from grafos.boruvka import boruvka_mst
+from grafos.dfs import iterative_dfs
+from grafos.instrument import Stats
+from grafos.mst import kruskal_mst, prim_mst
+from grafos.scc import kosaraju_scc, tarjan_scc
+from grafos.traversal import bfs_traversal, dfs_traversal
+
+WEIGHTS = (1, 1000)
+
+# Algoritmo -> (função(grafo, origem, stats), passos(grafo, resultado))
+ALGORITHMS = {
+    'bfs': (lambda graph, source, stats=None: bfs_traversal(graph, source, stats=stats),
+            lambda graph, result: result.steps),
+    'bfs-niveis': (lambda graph, source, stats=None:
+                   direction_optimizing_bfs(graph, source, stats=stats),
+                   lambda graph, result: result.steps),
+    'dfs': (lambda graph, source, stats=None: dfs_traversal(graph, source, stats=stats),
+            lambda graph, result: result.steps),
+    'dfs-floresta': (lambda graph, source, stats=None: iterative_dfs(graph, stats=stats),
+                     lambda graph, result: graph.num_vertices + graph.num_arcs),
+    'kruskal': (lambda graph, source, stats=None: kruskal_mst(graph, stats=stats),
+                lambda graph, result: graph.num_edges),
+    'prim': (lambda graph, source, stats=None: prim_mst(graph, source, stats=stats),
+             lambda graph, result: graph.num_arcs),
+    'boruvka': (lambda graph, source, stats=None: boruvka_mst(graph, workers=1, stats=stats),
+                lambda graph, result: graph.num_edges),
+    'cfc-tarjan': (lambda graph, source, stats=None: tarjan_scc(graph, stats=stats),
+                   lambda graph, result: graph.num_vertices + graph.num_arcs),
+    'cfc-kosaraju': (lambda graph, source, stats=None: kosaraju_scc(graph, stats=stats),
+                     lambda graph, result: graph.num_vertices + graph.num_arcs),
+}
+NATIVE_ALGORITHMS = ('kruskal-nativo', 'prim-nativo')
+if native.available():
+    ALGORITHMS['kruskal-nativo'] = (
+        lambda graph, source, stats=None: native.kruskal_mst(graph, stats=stats),
+        lambda graph, result: graph.num_edges)
+    ALGORITHMS['prim-nativo'] = (
+        lambda graph, source, stats=None: native.prim_mst(graph, source, stats=stats),
+        lambda graph, result: graph.num_arcs)
+
+
+def make_graph(family, num_edges, degree, seed):
+    """Grafo da família com cerca de ``num_edges`` arestas e grau médio ``degree``"""
+    num_vertices = max(2, 2 * num_edges // degree)
+    if family == 'er':
+        num_edges = min(num_edges, num_vertices * (num_vertices - 1) // 2)
+        return generators.erdos_renyi(num_vertices, num_edges, seed=seed, weights=WEIGHTS)
+    if family == 'rmat':
+        scale = max(1, int(round(np.log2(num_vertices))))
+        return generators.rmat_graph(scale, num_edges, seed=seed, weights=WEIGHTS)
+    if family == 'ba':
+        return generators.barabasi_albert(num_vertices, max(1, degree // 2), seed=seed,
+                                          weights=WEIGHTS)
+    if family == 'road':
+        side = max(2, int(np.sqrt(num_edges / 1.5)))  # Grau médio ~3, independe de degree
+        return generators.road_graph(side, side, seed=seed)
+    if family == 'grid':
+        side = max(2, int(np.sqrt(num_edges / 2)))
+        return generators.grid_graph(side, side, seed=seed, weights=WEIGHTS)
+    if family == 'complete':
+        n = max(2, int(round((1 + np.sqrt(1 + 8 * num_edges)) / 2)))
+        return generators.complete_graph(n, seed=seed, weights=WEIGHTS)
+    raise ValueError(f"família desconhecida: {family}")
+
+
+def source_vertex(graph):
+    """Origem de BFS, DFS e Prim: o vértice de maior grau
+
+    O vértice 0 não serve: o R-MAT embaralha os ids e deixa quase metade dos
+    vértices isolados, e a busca a partir de um deles não percorre nada.
+    """
+    return int(np.argmax(graph.degrees()))
+
+
+def time_runs(function, graph, source, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        graph.clear_caches()
+        start = time.perf_counter()
+        result = function(graph, source)
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def peak_memory(function, graph, source):
+    """Pico de memória alocada (bytes) durante uma execução, arrays NumPy incluídos"""
+    graph.clear_caches()
+    tracemalloc.start()
+    try:
+        function(graph, source)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def instrumented_run(function, graph, source):
+    """Contadores e fases de uma execução (grafos.instrument)"""
+    graph.clear_caches()
+    stats = Stats()
+    function(graph, source, stats=stats)
+    return stats.as_dict()
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count(),
+        'commit': commit or None,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def scaling_exponents(results):
+    """Inclinação log-log de tempo x arestas para cada (família, grau, algoritmo)"""
+    curves = {}
+    for entry in results:
+        key = (entry['family'], entry['degree'], entry['algorithm'])
+        curves.setdefault(key, []).append((entry['edges'], entry['time_s']))
+    exponents = []
+    for (family, degree, algorithm), points in curves.items():
+        edges, times = np.array(points, dtype=float).T
+        if len(points) < 2 or (times <= 0).any() or (edges <= 0).any():
+            continue
+        slope = np.polyfit(np.log10(edges), np.log10(times), 1)[0]
+        exponents.append({'family': family, 'degree': degree, 'algorithm': algorithm,
+                          'exponent': float(slope)})
+    return exponents
+
+
+def case_key(entry):
+    return (entry['family'], entry['target_edges'], entry['degree'], entry['algorithm'])
+
+
+def compare(previous, results):
+    """Tabela de razões de tempo (anterior / atual) para os casos em comum"""
+    before = {case_key(entry): entry for entry in previous['results']}
+    print("\n⚖️  COMPARAÇÃO (tempo anterior / atual; > 1 = mais rápido agora)")
+    print(f"{'família':>9} {'arestas':>10} {'grau':>5} {'alg':>14} {'antes (s)':>10} "
+          f"{'agora (s)':>10} {'razão':>7}")
+    for entry in results:
+        old = before.get(case_key(entry))
+        if old is None:
+            continue
+        ratio = old['time_s'] / entry['time_s'] if entry['time_s'] else float('inf')
+        print(f"{entry['family']:>9} {entry['target_edges']:>10} {entry['degree'] or '-':>5} "
+              f"{entry['algorithm']:>14} {old['time_s']:>10.4f} {entry['time_s']:>10.4f} "
+              f"{ratio:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de BFS, DFS, Kruskal e Prim")
+    parser.add_argument('--families', nargs='+', default=['er', 'road', 'rmat'],
+                        choices=['er', 'road', 'rmat', 'ba', 'grid', 'complete'])
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS))
+    parser.add_argument('--min-exp', type=int, default=3)
+    parser.add_argument('--max-exp', type=int, default=6)
+    parser.add_argument('--degrees', type=int, nargs='+', default=[4, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-memory', action='store_true',
+                        help="não mede o pico de memória (evita a execução extra)")
+    parser.add_argument('--counters', action='store_true',
+                        help="grava contadores de operações e tempo por fase (execução extra)")
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--compare', help="JSON de uma execução anterior")
+    args = parser.parse_args()
+
+    sizes = [10 ** e for e in range(args.min_exp, args.max_exp + 1)]
+    results = []
+
+    if any(name in NATIVE_ALGORITHMS for name in args.algorithms):
+        print("🔍 Conferindo o backend nativo com grafos.mst...")
+        if not native.check_parity(verbose=False):
+            sys.exit("❌ O backend nativo diverge de grafos.mst: rode 'python -m grafos.native'")
+
+    print("🏁 SUÍTE DE BENCHMARKS")
+    print("=" * 87)
+    print(f"{'família':>9} {'arestas':>10} {'vértices':>10} {'grau':>5} {'alg':>14} "
+          f"{'tempo (s)':>10} {'pico (MB)':>10} {'passos/s':>12}")
+
+    for family in args.families:
+        # Road, grid e completo têm densidade fixa
+        degrees = args.degrees if family in ('er', 'rmat', 'ba') else [None]
+        for degree in degrees:
+            for num_edges in sizes:
+                graph = make_graph(family, num_edges, degree or 4, args.seed)
+                source = source_vertex(graph)
+                for name in args.algorithms:
+                    function, count_steps = ALGORITHMS[name]
+                    times, result = time_runs(function, graph, source, args.repeat)
+                    best = min(times)
+                    steps = int(count_steps(graph, result))
+                    peak = None if args.no_memory else peak_memory(function, graph, source)
+                    stats = instrumented_run(function, graph, source) if args.counters else None
+                    entry = {
+                        'family': family,
+                        'target_edges': num_edges,
+                        'degree': degree,
+                        'vertices': graph.num_vertices,
+                        'edges': graph.num_edges,
+                        'source': source,
+                        'algorithm': name,
+                        'time_s': best,
+                        'median_s': float(np.median(times)),
+                        'times_s': times,
+                        'peak_bytes': peak,
+                        'steps': steps,
+                        'steps_per_s': steps / best if best else None,
+                        'stats': stats,
+                    }
+                    results.append(entry)
+                    peak_text = '-' if peak is None else f"{peak / 2 ** 20:.1f}"
+                    print(f"{family:>9} {num_edges:>10} {graph.num_vertices:>10} "
+                          f"{degree or '-':>5} {name:>14} {best:>10.4f} {peak_text:>10} "
+                          f"{entry['steps_per_s'] or 0:>12.0f}")
+
+    exponents = scaling_exponents(results)
+    if exponents:
+        print("-" * 87)
+        print("📈 Expoente de crescimento do tempo (1.00 = linear no número de arestas)")
+        for curve in exponents:
+            print(f"{curve['family']:>9} {curve['degree'] or '-':>5} {curve['algorithm']:>14} "
+                  f"{curve['exponent']:>6.2f}")
+
+    report = {'environment': environment(), 'arguments': vars(args), 'results': results,
+              'scaling': exponents}
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f"\n💾 Resultados gravados em {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(json.load(file), results)
+
+
+if __name__ == "__main__":
+    main()
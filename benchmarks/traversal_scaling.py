@@ -0,0 +1,73 @@
+"""
+Benchmark de escala das travessias headless (grafos.traversal).
+
+Mede BFS e DFS em grafos aleatórios de 10³ a 10⁷ arestas e estima o expoente
+de crescimento do tempo (inclinação em escala log-log). Um expoente próximo de
+1 indica tempo linear em V + E.
+
+Uso:
+    python benchmarks/traversal_scaling.py [--max-exp 7] [--seed 42]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from grafos.csr import CSRGraph
+from grafos.traversal import bfs_traversal, dfs_traversal
+
+
+def random_graph(num_edges, rng, avg_degree=8):
+    """Grafo aleatório não dirigido com ``num_edges`` arestas"""
+    num_vertices = max(2, 2 * num_edges // avg_degree)
+    src = rng.integers(0, num_vertices, size=num_edges)
+    dst = rng.integers(0, num_vertices, size=num_edges)
+    # Garante que o vértice 0 alcança boa parte do grafo
+    src[:num_vertices - 1] = np.arange(num_vertices - 1)
+    dst[:num_vertices - 1] = np.arange(1, num_vertices)
+    return CSRGraph.from_arrays(src, dst, num_vertices=num_vertices)
+
+
+def measure(function, graph):
+    start = time.perf_counter()
+    result = function(graph, 0)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escala das travessias BFS/DFS headless")
+    parser.add_argument('--min-exp', type=int, default=3)
+    parser.add_argument('--max-exp', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    sizes = [10 ** e for e in range(args.min_exp, args.max_exp + 1)]
+    timings = {'BFS': [], 'DFS': []}
+
+    print("📈 ESCALA DAS TRAVESSIAS HEADLESS")
+    print("=" * 60)
+    print(f"{'arestas':>12} {'vértices':>12} {'alg':>5} {'tempo (s)':>10} {'ns/aresta':>10} {'passos':>10}")
+
+    for num_edges in sizes:
+        graph = random_graph(num_edges, rng)
+        for name, function in (('BFS', bfs_traversal), ('DFS', dfs_traversal)):
+            elapsed, result = measure(function, graph)
+            timings[name].append(elapsed)
+            per_edge = elapsed / graph.num_arcs * 1e9
+            print(f"{num_edges:>12} {graph.num_vertices:>12} {name:>5} {elapsed:>10.4f} "
+                  f"{per_edge:>10.1f} {result.steps:>10}")
+
+    if len(sizes) > 1:
+        print("-" * 60)
+        for name, values in timings.items():
+            slope = np.polyfit(np.log10(sizes), np.log10(values), 1)[0]
+            print(f"{name}: expoente de crescimento ≈ {slope:.2f} (1.00 = linear)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Núcleo compartilhado das visualizações em Python.
+
+Os scripts de visualização (BFS, DFS, Prim e Kruskal) ficam em pastas com
+espaços e acentos, que não podem ser importadas como pacotes. Por isso o código
+reutilizável fica neste pacote, na raiz do repositório, e cada script adiciona a
+raiz ao ``sys.path`` antes de importá-lo.
+"""
+
+from grafos.bfs import direction_optimizing_bfs
+from grafos.boruvka import boruvka_mst
+from grafos.csr import CSRGraph, deduplicate_edges
+from grafos.dfs import DFSResult, iterative_dfs
+from grafos.edge_sort import sorted_edges
+from grafos.indexed_heap import IndexedHeap
+from grafos.instrument import Stats
+from grafos.loaders import load_dimacs, load_edge_list, load_graph, load_matrix_market
+from grafos.mst import kruskal_mst, mst_labels, prim_mst
+from grafos.scc import SCCResult, kosaraju_scc, tarjan_scc
+from grafos.state_log import FrameLog, StateLog
+from grafos.topological import (CycleError, TopologicalResult, dfs_topological_sort,
+                                 kahn_levels, kahn_topological_sort)
+from grafos.traversal import TraversalResult, bfs_traversal, dfs_traversal
+from grafos.union_find import UnionFind
+
+__all__ = [
+    'CSRGraph',
+    'CycleError',
+    'DFSResult',
+    'FrameLog',
+    'IndexedHeap',
+    'SCCResult',
+    'StateLog',
+    'Stats',
+    'TopologicalResult',
+    'TraversalResult',
+    'UnionFind',
+    'bfs_traversal',
+    'boruvka_mst',
+    'deduplicate_edges',
+    'dfs_topological_sort',
+    'dfs_traversal',
+    'direction_optimizing_bfs',
+    'iterative_dfs',
+    'kahn_levels',
+    'kahn_topological_sort',
+    'kosaraju_scc',
+    'kruskal_mst',
+    'load_dimacs',
+    'load_edge_list',
+    'load_graph',
+    'load_matrix_market',
+    'mst_labels',
+    'prim_mst',
+    'sorted_edges',
+    'tarjan_scc',
+]
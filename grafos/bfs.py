@@ -0,0 +1,221 @@
+"""
+BFS síncrono por níveis com otimização de direção (direction-optimizing BFS).
+
+Cada nível é processado inteiro como arrays NumPy, sem laço Python por vértice.
+A expansão alterna entre duas estratégias (Beamer et al.):
+
+* top-down: percorre os arcos que saem da fronteira atual;
+* bottom-up: percorre os arcos que chegam nos vértices ainda não visitados,
+  procurando um pai na fronteira.
+
+Em grafos de diâmetro pequeno (redes sociais) a fronteira do meio da busca
+cobre quase o grafo inteiro, e o bottom-up examina bem menos arcos.
+
+Com ``exact_parents=True`` (padrão) o resultado é idêntico ao do
+``BFSVisualization.bfs_algorithm``: mesmos ``levels``, mesmo ``parent`` e
+mesma ordem de ``tree_edges``. Com ``exact_parents=False`` o bottom-up para no
+primeiro pai encontrado; os níveis continuam exatos, mas o pai escolhido pode
+ser outro vértice da fronteira.
+"""
+
+import numpy as np
+
+from grafos.instrument import phase
+from grafos.traversal import TraversalResult
+
+TOP_DOWN = 'top-down'
+BOTTOM_UP = 'bottom-up'
+
+# Rodadas de busca "primeiro pai encontrado" antes de varrer o restante de uma vez
+EARLY_EXIT_ROUNDS = 4
+
+
+def expand_ranges(starts, counts):
+    """Concatena os intervalos ``[starts[i], starts[i] + counts[i])`` em um array"""
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(total, dtype=np.int64)
+
+
+def top_down_step(graph, frontier, levels):
+    """Expande os arcos da fronteira; retorna ``(novos, pais)`` na ordem da fila"""
+    starts = graph.indptr[frontier]
+    counts = graph.indptr[frontier + 1] - starts
+    arcs = expand_ranges(starts, counts)
+    targets = graph.indices[arcs].astype(np.int64)
+    sources = np.repeat(frontier, counts)
+
+    mask = levels[targets] < 0
+    targets, sources = targets[mask], sources[mask]
+
+    # A primeira ocorrência de cada vértice define o pai e a posição na fila
+    _, first = np.unique(targets, return_index=True)
+    first.sort()
+    return targets[first], sources[first]
+
+
+def bottom_up_step_exact(graph, in_frontier, unvisited, arc_rank):
+    """Procura pais para ``unvisited`` varrendo todos os seus arcos de entrada
+
+    ``arc_rank[p] + arco`` é a posição que o arco teria na expansão top-down da
+    fronteira; o menor valor por vértice reproduz exatamente o pai e a ordem
+    da BFS sequencial.
+    """
+    in_indptr, in_sources, in_arcs = graph.incoming()
+    starts = in_indptr[unvisited]
+    counts = in_indptr[unvisited + 1] - starts
+    arcs = expand_ranges(starts, counts)
+    sources = in_sources[arcs].astype(np.int64)
+    targets = np.repeat(unvisited, counts)
+
+    mask = in_frontier[sources]
+    sources, targets = sources[mask], targets[mask]
+    keys = arc_rank[sources] + in_arcs[arcs[mask]]
+
+    by_key = np.argsort(keys, kind='stable')
+    targets, sources = targets[by_key], sources[by_key]
+    _, first = np.unique(targets, return_index=True)
+    first.sort()
+    return targets[first], sources[first]
+
+
+def bottom_up_step_early_exit(graph, in_frontier, unvisited, stats=None):
+    """Procura pais para ``unvisited`` parando no primeiro vizinho da fronteira
+
+    As primeiras rodadas testam um arco de entrada por vértice de cada vez;
+    quem sobra depois de ``EARLY_EXIT_ROUNDS`` rodadas tem os arcos restantes
+    varridos de uma só vez, para que vértices de grau muito alto não gerem
+    milhares de rodadas.
+    """
+    in_indptr, in_sources, _ = graph.incoming()
+    found_vertices = []
+    found_parents = []
+
+    remaining = unvisited
+    cursor = in_indptr[remaining]
+    for _ in range(EARLY_EXIT_ROUNDS):
+        alive = cursor < in_indptr[remaining + 1]
+        remaining, cursor = remaining[alive], cursor[alive]
+        if remaining.size == 0:
+            break
+        if stats is not None:
+            stats.add('edges_scanned', remaining.size)
+        sources = in_sources[cursor].astype(np.int64)
+        hit = in_frontier[sources]
+        found_vertices.append(remaining[hit])
+        found_parents.append(sources[hit])
+        remaining, cursor = remaining[~hit], cursor[~hit] + 1
+
+    if remaining.size:
+        counts = in_indptr[remaining + 1] - cursor
+        arcs = expand_ranges(cursor, counts)
+        if stats is not None:
+            stats.add('edges_scanned', len(arcs))
+        sources = in_sources[arcs].astype(np.int64)
+        targets = np.repeat(remaining, counts)
+        hit = in_frontier[sources]
+        targets, sources = targets[hit], sources[hit]
+        _, first = np.unique(targets, return_index=True)
+        found_vertices.append(targets[first])
+        found_parents.append(sources[first])
+
+    if not found_vertices:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    vertices = np.concatenate(found_vertices)
+    parents = np.concatenate(found_parents)
+    order = np.argsort(vertices, kind='stable')
+    return vertices[order], parents[order]
+
+
+def direction_optimizing_bfs(graph, start, alpha=None, beta=24, exact_parents=True,
+                             stats=None):
+    """BFS por níveis a partir do id ``start``
+
+    Muda para bottom-up quando os arcos da fronteira superam ``1/alpha`` dos
+    arcos que ainda chegam em vértices não visitados, e volta para top-down
+    quando a fronteira tem menos de ``n/beta`` vértices. O ``alpha`` padrão é
+    14 (valor de Beamer et al.) no modo com parada antecipada e 1 no modo
+    exato, que sempre varre todos os arcos de entrada dos não visitados.
+
+    Retorna um ``TraversalResult`` com ``levels``, ``parent`` e a ordem de
+    visitação; ``result.directions`` guarda a estratégia usada em cada nível.
+    Com ``stats`` (grafos.instrument), ``edges_scanned`` conta os arcos
+    realmente examinados em cada direção, e os contadores são enviados a cada
+    nível.
+    """
+    if alpha is None:
+        alpha = 1 if exact_parents else 14
+
+    n = graph.num_vertices
+    degrees = graph.degrees()
+    with phase(stats, 'transpose'):
+        in_indptr = graph.incoming()[0]
+    in_degrees = np.diff(in_indptr)
+
+    parent = np.full(n, -1, dtype=np.int64)
+    levels = np.full(n, -1, dtype=np.int64)
+    in_frontier = np.zeros(n, dtype=bool)
+    arc_rank = np.zeros(n, dtype=np.int64)
+
+    frontier = np.array([start], dtype=np.int64)
+    levels[start] = 0
+    order = [frontier]
+    directions = []
+    unvisited_arcs = int(in_indptr[-1] - in_degrees[start])
+    bottom_up = False
+    level = 0
+    if stats is not None:
+        scanned_before = stats.counters.get('edges_scanned', 0)
+        stats.add('enqueues')  # Vértice inicial
+
+    with phase(stats, 'main_loop'):
+        while frontier.size:
+            frontier_arcs = int(degrees[frontier].sum())
+            if not bottom_up and frontier_arcs * alpha > unvisited_arcs:
+                bottom_up = True
+            elif bottom_up and frontier.size * beta < n:
+                bottom_up = False
+
+            if not bottom_up:
+                directions.append(TOP_DOWN)
+                new, parents = top_down_step(graph, frontier, levels)
+                scanned = frontier_arcs
+            else:
+                directions.append(BOTTOM_UP)
+                unvisited = np.flatnonzero(levels < 0)
+                in_frontier[frontier] = True
+                if exact_parents:
+                    # Deslocamento que leva um arco à sua posição na expansão top-down
+                    arc_rank[frontier] = (np.cumsum(degrees[frontier]) - degrees[frontier]
+                                          - graph.indptr[frontier])
+                    new, parents = bottom_up_step_exact(graph, in_frontier, unvisited, arc_rank)
+                    scanned = in_degrees[unvisited].sum() if stats is not None else 0
+                else:
+                    new, parents = bottom_up_step_early_exit(graph, in_frontier, unvisited, stats)
+                    scanned = 0  # Somado dentro do passo
+                in_frontier[frontier] = False
+
+            level += 1
+            levels[new] = level
+            parent[new] = parents
+            unvisited_arcs -= int(in_degrees[new].sum())
+            if new.size:
+                order.append(new)
+            frontier = new
+
+            if stats is not None:
+                stats.add('edges_scanned', scanned)
+                stats.add('enqueues', new.size)
+                stats.add('levels_top_down' if not bottom_up else 'levels_bottom_up')
+                stats.flush()
+
+        order = np.concatenate(order)
+        if stats is not None:
+            scanned = stats.counters['edges_scanned'] - scanned_before
+            stats.add('revisits', scanned - (len(order) - 1))
+
+    result = TraversalResult(graph, order, parent, len(order) + 1, levels=levels)
+    result.directions = directions
+    return result
@@ -0,0 +1,164 @@
+"""
+Formato binário do ``CSRGraph``, aberto com ``numpy.memmap`` sem cópia.
+
+Converter um grafo de texto grande (``grafos.loaders``) leva minutos. Depois
+disso, ``save_binary`` grava os arrays do CSR num único arquivo, e
+``load_binary`` o reabre em milissegundos: os arrays são mapeados do disco
+(somente leitura) e entregues direto ao ``CSRGraph``, sem parsing nem cópia.
+Só as páginas tocadas pelo algoritmo são lidas. Vários processos que abrem o
+mesmo arquivo compartilham uma única cópia no cache de páginas do sistema.
+
+Layout do arquivo:
+
+* ``MAGIC`` (8 bytes), versão e tamanho do cabeçalho (``uint32`` little-endian);
+* cabeçalho JSON: ``directed``, ``num_vertices``, tipo dos rótulos e, para cada
+  array, ``dtype``, ``shape`` e ``offset`` (a partir do fim do cabeçalho,
+  arredondado para ``ALIGNMENT``);
+* os arrays ``indptr``, ``indices`` e (se houver) ``weights``, cada um
+  começando num múltiplo de ``ALIGNMENT`` bytes;
+* a tabela de rótulos, se houver. Rótulos inteiros viram o array
+  ``labels``. Rótulos de texto viram ``label_data`` (UTF-8 concatenado) mais
+  ``label_offsets``.
+
+Os arrays são gravados com os mesmos tipos que o ``CSRGraph`` usa
+internamente (``indices`` em int32 quando cabe, pesos em int64/float64),
+então o construtor não converte nada. A tabela de rótulos é a única parte
+convertida em objetos Python na abertura, porque o ``CSRGraph`` precisa do
+dicionário rótulo -> id. Grafos cujo rótulo é o próprio id (como os
+DIMACS) não têm tabela nem esse custo.
+
+Uso pela linha de comando, para converter um arquivo de texto uma vez::
+
+    python -m grafos.binary USA-road-d.USA.gr.gz USA.csr
+"""
+
+import json
+import os
+import struct
+import sys
+import tempfile
+
+import numpy as np
+
+from grafos.csr import CSRGraph
+
+MAGIC = b'GRAFOCSR'
+FORMAT_VERSION = 1
+ALIGNMENT = 64  # Início de cada array (linha de cache / vetorização)
+PREAMBLE = struct.Struct('<8sII')  # Magic, versão, tamanho do cabeçalho
+
+
+def aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def label_arrays(labels):
+    """Tabela de rótulos como arrays: ``(tipo, {nome: array})``"""
+    if labels is None:
+        return 'none', {}
+    if all(isinstance(label, (int, np.integer)) and not isinstance(label, bool)
+           for label in labels):
+        return 'int', {'labels': np.asarray(labels, dtype=np.int64)}
+    if all(isinstance(label, str) for label in labels):
+        encoded = [label.encode('utf-8') for label in labels]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        return 'str', {'label_data': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+                       'label_offsets': offsets}
+    raise ValueError("rótulos devem ser todos inteiros ou todos texto")
+
+
+def save_binary(graph, path):
+    """Grava ``graph`` no formato binário (via arquivo temporário + rename)"""
+    arrays = {'indptr': graph.indptr, 'indices': graph.indices}
+    if graph.weights is not None:
+        arrays['weights'] = graph.weights
+    label_kind, labels = label_arrays(graph.labels)
+    arrays.update(labels)
+
+    # Offsets relativos ao início dos dados, que vem logo depois do cabeçalho alinhado
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        entries[name] = {'dtype': array.dtype.newbyteorder('<').str,
+                         'shape': list(array.shape), 'offset': offset}
+        offset = aligned(offset + array.nbytes)
+    header = {'directed': graph.directed, 'num_vertices': graph.num_vertices,
+              'labels': label_kind, 'arrays': entries}
+    encoded = json.dumps(header).encode()
+    data_start = aligned(PREAMBLE.size + len(encoded))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp = tempfile.mkstemp(suffix='.csr', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+            file.write(encoded)
+            for name, array in arrays.items():
+                file.write(b'\0' * (data_start + entries[name]['offset'] - file.tell()))
+                np.ascontiguousarray(array, dtype=entries[name]['dtype']).tofile(file)
+        os.chmod(temp, 0o644)  # mkstemp cria com 0600; o arquivo é para ser compartilhado
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def read_header(file, path):
+    """Cabeçalho JSON e posição onde começam os arrays"""
+    magic, version, length = PREAMBLE.unpack(file.read(PREAMBLE.size))
+    if magic != MAGIC:
+        raise ValueError(f"{path}: não é um arquivo de grafo binário")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path}: versão {version} não suportada (esperada {FORMAT_VERSION})")
+    return json.loads(file.read(length)), aligned(PREAMBLE.size + length)
+
+
+def load_binary(path, mmap=True):
+    """Abre um grafo gravado por ``save_binary``
+
+    Com ``mmap=True`` os arrays são mapeados do arquivo (somente leitura, sem
+    cópia). Com ``mmap=False`` eles são lidos para a memória e podem ser
+    alterados.
+    """
+    with open(path, 'rb') as file:
+        header, data_start = read_header(file, path)
+    size = os.path.getsize(path)
+    data = np.memmap(path, dtype=np.uint8, mode='r') if mmap else None
+
+    arrays = {}
+    for name, entry in header['arrays'].items():
+        dtype = np.dtype(entry['dtype'])
+        shape = tuple(entry['shape'])
+        count = int(np.prod(shape))
+        start = data_start + entry['offset']
+        end = start + count * dtype.itemsize
+        if end > size:
+            raise ValueError(f"{path}: arquivo truncado (array '{name}')")
+        if data is not None:
+            arrays[name] = data[start:end].view(dtype).reshape(shape)
+        else:
+            arrays[name] = np.fromfile(path, dtype=dtype, count=count,
+                                       offset=start).reshape(shape)
+
+    labels = None
+    if header['labels'] == 'int':
+        labels = arrays['labels'].tolist()
+    elif header['labels'] == 'str':
+        blob = arrays['label_data'].tobytes()
+        offsets = arrays['label_offsets'].tolist()
+        labels = [blob[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+
+    return CSRGraph(arrays['indptr'], arrays['indices'], arrays.get('weights'),
+                    labels=labels, directed=header['directed'])
+
+
+if __name__ == '__main__':
+    from grafos.loaders import load_graph
+
+    if len(sys.argv) != 3:
+        print("uso: python -m grafos.binary <grafo de entrada> <saída.csr>")
+        sys.exit(1)
+    grafo = load_graph(sys.argv[1])
+    save_binary(grafo, sys.argv[2])
+    print(f"💾 {grafo} gravado em {sys.argv[2]}")
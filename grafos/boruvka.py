@@ -0,0 +1,186 @@
+"""
+Árvore geradora mínima pelo algoritmo de Borůvka, em paralelo.
+
+Cada rodada escolhe, para cada componente, a aresta mais barata que sai dele,
+adiciona essas arestas à árvore e contrai os componentes. O número de
+componentes cai pelo menos pela metade a cada rodada, então são O(log V)
+rodadas.
+
+A parte cara de cada rodada (varrer todas as arestas) é dividida em blocos
+processados por um pool de processos. As arestas e o rótulo de componente de
+cada vértice ficam em memória compartilhada (``multiprocessing.shared_memory``),
+então os processos não recebem cópias dos arrays a cada rodada.
+
+Empates de peso são desfeitos pela posição da aresta na ordem estável de
+``grafos.edge_sort``, o que garante que as arestas escolhidas numa rodada
+nunca formem ciclo.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from grafos.edge_sort import sorted_edges
+from grafos.instrument import phase
+from grafos.union_find import UnionFind
+
+# Abaixo disso o custo de criar o pool supera o ganho
+MIN_EDGES_PER_WORKER = 1 << 18
+
+# Marca "nenhuma aresta encontrada" nos vetores de melhor candidato
+NO_EDGE = np.iinfo(np.int64).max
+
+
+class SharedArrays:
+    """Conjunto de arrays NumPy em memória compartilhada, identificados por nome"""
+
+    def __init__(self):
+        self.blocks = {}
+        self.specs = {}
+
+    def add(self, name, array):
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        self.blocks[name] = block
+        self.specs[name] = (block.name, array.shape, array.dtype.str)
+        return view
+
+    def close(self):
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks.clear()
+
+
+def attach(specs):
+    """Abre (no processo trabalhador) os arrays descritos por ``SharedArrays.specs``"""
+    blocks = []
+    arrays = {}
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return blocks, arrays
+
+
+def cheapest_per_component(component, u, v, ranks, num_vertices):
+    """Aresta mais barata que sai de cada componente, dentro de um bloco
+
+    As arestas estão em ordem estável de peso, então "mais barata" é
+    simplesmente a de menor posição (``ranks``). Retorna
+    ``(componentes, posições)``.
+    """
+    cu = component[u]
+    cv = component[v]
+    crossing = cu != cv
+    best = np.full(num_vertices, NO_EDGE, dtype=np.int64)
+    ids = ranks[crossing]
+    # Cada aresta concorre pelos dois componentes que liga
+    np.minimum.at(best, cu[crossing], ids)
+    np.minimum.at(best, cv[crossing], ids)
+    components = np.flatnonzero(best != NO_EDGE)
+    return components, best[components]
+
+
+def chunk_worker(specs, begin, end):
+    """Executado no pool: aplica ``cheapest_per_component`` a um bloco de arestas"""
+    blocks, arrays = attach(specs)
+    try:
+        component = arrays['component']
+        return cheapest_per_component(component, arrays['u'][begin:end],
+                                      arrays['v'][begin:end],
+                                      arrays['rank'][begin:end], len(component))
+    finally:
+        del arrays, component
+        for block in blocks:
+            block.close()
+
+
+def boruvka_mst(graph, workers=None, chunk_size=None, stats=None):
+    """Borůvka paralelo; retorna ``(mst, total_weight)`` como ``grafos.mst.kruskal_mst``
+
+    ``workers`` é o número de processos (padrão: ``os.cpu_count()``); com
+    ``workers=1`` ou grafos pequenos tudo roda no processo atual. Em grafos
+    desconexos o resultado é a floresta geradora mínima.
+
+    As arestas vêm de ``sorted_edges`` (ordem estável de peso, em cache no
+    grafo), então comparar arestas é comparar posições. Ao fim de cada rodada
+    as arestas internas a um componente são descartadas, e as rodadas
+    seguintes varrem só as que ainda cruzam componentes.
+
+    ``stats`` (grafos.instrument) recebe as contagens do union-find,
+    ``rounds`` e ``edges_scanned`` (arestas varridas somando as rodadas).
+    """
+    with phase(stats, 'sort'):
+        edges = sorted_edges(graph)
+    num_edges = len(edges)
+    n = graph.num_vertices
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, num_edges // MIN_EDGES_PER_WORKER))
+
+    union_find = UnionFind(n, stats)
+    selected = []
+    shared = SharedArrays()
+    pool = None
+    u = v = rank = component = None
+    try:
+        u = shared.add('u', edges['u'])
+        v = shared.add('v', edges['v'])
+        rank = shared.add('rank', np.arange(num_edges, dtype=np.int64))
+        component = shared.add('component', np.arange(n, dtype=np.int64))
+        alive = num_edges
+        if workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+
+        with phase(stats, 'main_loop'):
+            while alive:
+                if stats is not None:
+                    stats.add('edges_scanned', alive)
+                # Candidatos por bloco (em paralelo quando há pool)
+                if pool is None:
+                    partial = [cheapest_per_component(component, u[:alive], v[:alive],
+                                                      rank[:alive], n)]
+                else:
+                    size = chunk_size or max(1, -(-alive // workers))
+                    futures = [pool.submit(chunk_worker, shared.specs, begin,
+                                           min(begin + size, alive))
+                               for begin in range(0, alive, size)]
+                    partial = [future.result() for future in futures]
+
+                # Redução final: melhor candidato de cada componente entre os blocos
+                best = np.full(n, NO_EDGE, dtype=np.int64)
+                for components, ranks in partial:
+                    np.minimum.at(best, components, ranks)
+                chosen = np.unique(best[best != NO_EDGE])
+                if len(chosen) == 0:
+                    break
+
+                selected.append(chosen)
+                union_find.link_many(edges['u'][chosen], edges['v'][chosen])
+                component[:] = union_find.component_labels()
+
+                # Contração: mantém no prefixo só as arestas que ainda cruzam componentes
+                crossing = component[u[:alive]] != component[v[:alive]]
+                kept = int(np.count_nonzero(crossing))
+                u[:kept] = u[:alive][crossing]
+                v[:kept] = v[:alive][crossing]
+                rank[:kept] = rank[:alive][crossing]
+                alive = kept
+
+                if stats is not None:
+                    stats.add('rounds')
+                    stats.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        # As visões precisam sumir antes de liberar a memória compartilhada
+        u = v = rank = component = None
+        shared.close()
+
+    chosen = np.sort(np.concatenate(selected)) if selected else np.empty(0, dtype=np.int64)
+    mst = edges[chosen]
+    return mst, mst['w'].sum().item()
@@ -0,0 +1,344 @@
+"""
+Representação de grafos em formato CSR (Compressed Sparse Row).
+
+Os vizinhos do vértice ``v`` ficam em ``indices[indptr[v]:indptr[v + 1]]`` e os
+pesos correspondentes em ``weights`` na mesma faixa. Os vértices são inteiros
+``0..n-1``; a tabela ``labels`` traduz esses ids para os rótulos usados nas
+visualizações ('A', 'B', ...). Quando ``labels`` é ``None`` o rótulo de cada
+vértice é o próprio id, o que evita guardar milhões de strings.
+"""
+
+import numpy as np
+
+from grafos.edge_sort import radix_argsort
+
+
+def index_dtype(n):
+    """Menor tipo inteiro capaz de indexar ``n`` posições"""
+    return np.int32 if n < np.iinfo(np.int32).max else np.int64
+
+
+def weight_array(weights):
+    """Converte pesos para array, mantendo inteiros como int64 quando possível"""
+    weights = np.asarray(weights)
+    if weights.dtype.kind in 'iub':
+        return weights.astype(np.int64, copy=False)
+    return weights.astype(np.float64, copy=False)
+
+
+def deduplicate_edges(src, dst, weights=None):
+    """Remove arestas não dirigidas repetidas em tempo linear (sem laços Python)
+
+    Cada aresta é identificada pela chave canônica ``(min(u, v), max(u, v))``,
+    agrupada por radix sort (``grafos.edge_sort.radix_argsort``); fica a
+    primeira ocorrência de cada chave, com a orientação e a posição originais.
+    Retorna ``(src, dst, weights, conflicts)``, em que ``conflicts`` são as
+    posições (na entrada) das arestas paralelas cujo peso difere do da
+    primeira ocorrência, uma por par ``(chave, peso)``.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    if len(src) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return src, dst, weights, empty
+    low = np.minimum(src, dst)
+    high = np.maximum(src, dst)
+    keys = low * (int(high.max()) + 1) + high
+
+    # Ordenação estável: dentro de cada chave a primeira ocorrência vem antes
+    order = radix_argsort(keys)
+    sorted_keys = keys[order]
+    group_start = np.ones(len(keys), dtype=bool)
+    group_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    first = order[group_start]
+
+    conflicts = np.empty(0, dtype=np.int64)
+    if weights is not None:
+        weights = weight_array(weights)
+        # Peso da primeira ocorrência de cada grupo, espalhado pelo grupo
+        group = np.cumsum(group_start) - 1
+        first_weight = weights[first][group]
+        conflicts = order[weights[order] != first_weight]
+        # Cada par (chave, peso) é avisado uma vez (os dois sentidos de uma
+        # aresta não dirigida, por exemplo, conflitam juntos)
+        by_pair = np.lexsort((conflicts, weights[conflicts], keys[conflicts]))
+        conflicts = conflicts[by_pair]
+        pair_start = np.ones(len(conflicts), dtype=bool)
+        pair_start[1:] = ((keys[conflicts[1:]] != keys[conflicts[:-1]]) |
+                          (weights[conflicts[1:]] != weights[conflicts[:-1]]))
+        conflicts = np.sort(conflicts[pair_start])
+
+    kept = np.sort(first)
+    return (src[kept], dst[kept], None if weights is None else weights[kept],
+            conflicts)
+
+
+class CSRGraph:
+    def __init__(self, indptr, indices, weights=None, labels=None, directed=False):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        num_vertices = len(self.indptr) - 1
+        self.indices = np.asarray(indices, dtype=index_dtype(num_vertices))
+        self.weights = None if weights is None else weight_array(weights)
+        self.directed = directed
+        self._incoming = None      # Cache da transposta (ver incoming)
+        self._sorted_edges = None  # Cache das arestas ordenadas por peso (ver edge_sort)
+        self._native_arrays = {}   # Cache dos arrays no formato do C (ver native)
+
+        if self.weights is not None and len(self.weights) != len(self.indices):
+            raise ValueError("weights deve ter o mesmo tamanho de indices")
+
+        # Tabela id <-> rótulo
+        self.labels = None if labels is None else list(labels)
+        self._label_index = None
+        if self.labels is not None:
+            if len(self.labels) != num_vertices:
+                raise ValueError("labels deve ter um rótulo por vértice")
+            self._label_index = {label: i for i, label in enumerate(self.labels)}
+
+    # =========================================================================
+    # Construção
+    # =========================================================================
+
+    @classmethod
+    def from_arrays(cls, src, dst, weights=None, num_vertices=None, labels=None,
+                    directed=False):
+        """Constrói o CSR a partir de arrays de origem/destino (sem laços Python)
+
+        Em grafos não dirigidos cada aresta é armazenada nos dois sentidos. A
+        ordenação é estável, então a ordem de entrada dos vizinhos de cada
+        vértice é preservada.
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if len(src) != len(dst):
+            raise ValueError("src e dst devem ter o mesmo tamanho")
+        if weights is not None:
+            weights = weight_array(weights)
+            if len(weights) != len(src):
+                raise ValueError("weights deve ter o mesmo tamanho de src")
+
+        if num_vertices is None:
+            if labels is not None:
+                num_vertices = len(labels)
+            elif len(src):
+                num_vertices = int(max(src.max(), dst.max())) + 1
+            else:
+                num_vertices = 0
+
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+
+        order = np.argsort(src, kind='stable')
+        counts = np.bincount(src, minlength=num_vertices)
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return cls(indptr, dst[order],
+                   None if weights is None else weights[order],
+                   labels=labels, directed=directed)
+
+    @classmethod
+    def from_adjacency(cls, adjacency, directed=False):
+        """Constrói a partir do formato usado pelas visualizações
+
+        Aceita ``{vértice: [vizinhos]}`` (BFS/DFS) ou
+        ``{vértice: [(vizinho, peso)]}`` (Prim). As listas já trazem os dois
+        sentidos de cada aresta, então nada é espelhado aqui.
+        """
+        labels = list(adjacency.keys())
+        label_index = {label: i for i, label in enumerate(labels)}
+        # Vizinhos que não aparecem como chave também viram vértices
+        for neighbors in adjacency.values():
+            for item in neighbors:
+                neighbor = item[0] if isinstance(item, tuple) else item
+                if neighbor not in label_index:
+                    label_index[neighbor] = len(labels)
+                    labels.append(neighbor)
+
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        indices = []
+        weights = []
+        weighted = False
+        for label in labels:
+            for item in adjacency.get(label, []):
+                if isinstance(item, tuple):
+                    neighbor, weight = item
+                    weighted = True
+                else:
+                    neighbor, weight = item, 1
+                indices.append(label_index[neighbor])
+                weights.append(weight)
+            indptr[label_index[label] + 1] = len(indices)
+
+        return cls(indptr, indices, weights if weighted else None,
+                   labels=labels, directed=directed)
+
+    @classmethod
+    def from_edge_list(cls, edges, directed=False):
+        """Constrói a partir de uma lista ``[(u, v)]`` ou ``[(u, v, peso)]`` (Kruskal)"""
+        labels = []
+        label_index = {}
+        src = np.empty(len(edges), dtype=np.int64)
+        dst = np.empty(len(edges), dtype=np.int64)
+        weights = []
+        for i, edge in enumerate(edges):
+            for endpoint in edge[:2]:
+                if endpoint not in label_index:
+                    label_index[endpoint] = len(labels)
+                    labels.append(endpoint)
+            src[i] = label_index[edge[0]]
+            dst[i] = label_index[edge[1]]
+            if len(edge) > 2:
+                weights.append(edge[2])
+
+        if weights and len(weights) != len(edges):
+            raise ValueError("todas as arestas devem ter peso, ou nenhuma")
+
+        return cls.from_arrays(src, dst, weights if weights else None,
+                               num_vertices=len(labels), labels=labels,
+                               directed=directed)
+
+    # =========================================================================
+    # Consultas
+    # =========================================================================
+
+    @property
+    def num_vertices(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_arcs(self):
+        """Número de entradas armazenadas (cada aresta não dirigida conta duas vezes)"""
+        return len(self.indices)
+
+    @property
+    def num_edges(self):
+        return self.num_arcs if self.directed else self.num_arcs // 2
+
+    @property
+    def is_weighted(self):
+        return self.weights is not None
+
+    def degree(self, v):
+        return int(self.indptr[v + 1] - self.indptr[v])
+
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    def neighbors(self, v):
+        """Vizinhos de ``v`` como fatia (sem cópia) de ``indices``"""
+        return self.indices[self.indptr[v]:self.indptr[v + 1]]
+
+    def neighbor_weights(self, v):
+        if self.weights is None:
+            return np.ones(self.degree(v), dtype=np.int64)
+        return self.weights[self.indptr[v]:self.indptr[v + 1]]
+
+    def arc_sources(self):
+        """Origem de cada entrada de ``indices`` (expande ``indptr``)"""
+        return np.repeat(np.arange(self.num_vertices, dtype=self.indices.dtype),
+                         self.degrees())
+
+    def incoming(self):
+        """Arcos de entrada de cada vértice (transposta), calculados uma única vez
+
+        Retorna ``(in_indptr, in_sources, in_arcs)``: as origens dos arcos que
+        chegam em ``v`` ficam em ``in_sources[in_indptr[v]:in_indptr[v + 1]]`` e
+        ``in_arcs`` guarda a posição de cada um desses arcos em ``indices``.
+        """
+        if self._incoming is None:
+            in_arcs = np.argsort(self.indices, kind='stable')
+            counts = np.bincount(self.indices, minlength=self.num_vertices)
+            in_indptr = np.zeros(self.num_vertices + 1, dtype=np.int64)
+            np.cumsum(counts, out=in_indptr[1:])
+            in_sources = self.arc_sources()[in_arcs]
+            self._incoming = (in_indptr, in_sources, in_arcs)
+        return self._incoming
+
+    def clear_caches(self):
+        """Descarta a transposta, as arestas ordenadas e os arrays do backend nativo
+
+        (benchmarks medem sem cache)
+        """
+        self._incoming = None
+        self._sorted_edges = None
+        self._native_arrays = {}
+
+    def edge_arrays(self):
+        """Arestas como arrays ``(u, v, peso)``, uma vez por aresta não dirigida"""
+        src = self.arc_sources()
+        dst = self.indices
+        weights = self.weights
+        if weights is None:
+            weights = np.ones(len(dst), dtype=np.int64)
+        if not self.directed:
+            mask = src < dst
+            src, dst, weights = src[mask], dst[mask], weights[mask]
+        return src, dst, weights
+
+    def unique_edges(self):
+        """Arestas sem repetição, via ``deduplicate_edges``, na ordem dos arcos
+
+        Em grafos não dirigidos os dois sentidos de cada aresta viram uma só
+        (a que aparece primeiro, como ``(u, v)``); arestas paralelas de mesmo
+        peso também. Retorna ``(src, dst, weights, conflicts)``, com
+        ``conflicts`` indexando os arcos (``arc_sources()``/``indices``) das
+        arestas paralelas de peso diferente, que não entram no resultado.
+        """
+        src = self.arc_sources()
+        weights = self.weights
+        if weights is None:
+            weights = np.ones(len(self.indices), dtype=np.int64)
+        if self.directed:
+            return src, self.indices, weights, np.empty(0, dtype=np.int64)
+        return deduplicate_edges(src, self.indices, weights)
+
+    # =========================================================================
+    # Rótulos
+    # =========================================================================
+
+    def label_of(self, v):
+        return int(v) if self.labels is None else self.labels[v]
+
+    def id_of(self, label):
+        """Id do vértice ``label``; ``KeyError`` se ele não existe"""
+        if self._label_index is None:
+            vertex = int(label)
+            if not 0 <= vertex < self.num_vertices:
+                raise KeyError(label)
+            return vertex
+        return self._label_index[label]
+
+    def vertex_labels(self):
+        if self.labels is None:
+            return list(range(self.num_vertices))
+        return list(self.labels)
+
+    # =========================================================================
+    # Conversão para os formatos das visualizações
+    # =========================================================================
+
+    def to_adjacency(self):
+        """Formato ``{vértice: [vizinhos]}`` usado por BFS e DFS"""
+        return {self.label_of(v): [self.label_of(u) for u in self.neighbors(v)]
+                for v in range(self.num_vertices)}
+
+    def to_weighted_adjacency(self):
+        """Formato ``{vértice: [(vizinho, peso)]}`` usado por Prim"""
+        return {self.label_of(v): [(self.label_of(u), w.item())
+                                   for u, w in zip(self.neighbors(v),
+                                                   self.neighbor_weights(v))]
+                for v in range(self.num_vertices)}
+
+    def to_edge_list(self):
+        """Formato ``[(u, v, peso)]`` usado por Kruskal"""
+        src, dst, weights = self.edge_arrays()
+        return [(self.label_of(u), self.label_of(v), w.item())
+                for u, v, w in zip(src, dst, weights)]
+
+    def __repr__(self):
+        kind = 'dirigido' if self.directed else 'não dirigido'
+        return (f"CSRGraph({self.num_vertices} vértices, {self.num_edges} arestas, "
+                f"{kind})")
@@ -0,0 +1,186 @@
+"""
+DFS iterativo com pilha explícita, tempos de descoberta/finalização e
+classificação de arestas.
+
+Diferente de ``DFSVisualization.dfs_algorithm`` (que empilha todos os vizinhos
+de uma vez e define o pai no momento do empilhamento), aqui cada vértice da
+pilha guarda um cursor para o próximo vizinho a examinar. Assim o vértice só
+desce para um vizinho quando ele é de fato explorado, e os tempos e a árvore
+são os de uma DFS real (CLRS). Não há recursão, então o limite de recursão do
+Python nunca é atingido, mesmo com milhões de vértices.
+"""
+
+from array import array
+
+import numpy as np
+
+from grafos.instrument import count_traversal, phase
+
+# Tipos de aresta (mesma ordem do enum TipoAresta de DFS.h)
+TREE_EDGE = 0      # ARESTA_ARVORE
+BACK_EDGE = 1      # ARESTA_RETORNO
+FORWARD_EDGE = 2   # ARESTA_AVANCO
+CROSS_EDGE = 3     # ARESTA_CRUZAMENTO
+UNCLASSIFIED = 255
+
+EDGE_TYPE_NAMES = {
+    TREE_EDGE: 'árvore',
+    BACK_EDGE: 'retorno',
+    FORWARD_EDGE: 'avanço',
+    CROSS_EDGE: 'cruzamento',
+}
+
+# Cores da DFS
+WHITE, GRAY, BLACK = 0, 1, 2
+
+# Eventos de passo (on_step), os mesmos passos de DFSVisualization.record_steps
+DISCOVER = 'discover'  # on_step(DISCOVER, v, pai): "Processando vértice v" (pai -1 se raiz)
+FINISH = 'finish'      # on_step(FINISH, v, None): "Backtrack de v"
+
+
+class DFSResult:
+    """Resultado da DFS, com vértices identificados por id inteiro"""
+
+    def __init__(self, graph, order, parent, discovery_time, finish_time, edge_types,
+                 finish_order):
+        self.graph = graph
+        self.order = order                    # Ordem de descoberta
+        self.parent = parent                  # parent[v] = pai na floresta DFS (-1 se raiz)
+        self.discovery_time = discovery_time  # v.d
+        self.finish_time = finish_time        # v.f
+        self.edge_types = edge_types          # Tipo de cada arco, alinhado com graph.indices
+        self.finish_order = finish_order      # Vértices em ordem de finalização
+
+    def tree_edges(self):
+        """Arestas da árvore ``(pai, filho)`` na ordem de descoberta"""
+        children = self.order[self.parent[self.order] >= 0]
+        return list(zip(self.parent[children].tolist(), children.tolist()))
+
+    def edges_of_type(self, edge_type):
+        """Arcos ``(u, v)`` de um tipo (TREE_EDGE, BACK_EDGE, ...)"""
+        arcs = np.flatnonzero(self.edge_types == edge_type)
+        sources = self.graph.arc_sources()[arcs]
+        return list(zip(sources.tolist(), self.graph.indices[arcs].tolist()))
+
+    def has_cycle(self):
+        """Um grafo tem ciclo se e somente se a DFS encontra aresta de retorno"""
+        return bool((self.edge_types == BACK_EDGE).any())
+
+    def path_labels(self):
+        return [self.graph.label_of(v) for v in self.order]
+
+    def parent_labels(self):
+        label_of = self.graph.label_of
+        return {label_of(child): label_of(parent) for parent, child in self.tree_edges()}
+
+    def tree_edge_labels(self):
+        label_of = self.graph.label_of
+        return [(label_of(parent), label_of(child)) for parent, child in self.tree_edges()]
+
+    def time_labels(self):
+        """``(discovery_time, finish_time)`` como dicionários rotulados"""
+        label_of = self.graph.label_of
+        discovery = {label_of(v): int(self.discovery_time[v]) for v in self.order}
+        finish = {label_of(v): int(self.finish_time[v]) for v in self.order}
+        return discovery, finish
+
+
+def iterative_dfs(graph, start=None, roots=None, stats=None, on_step=None):
+    """DFS a partir do id ``start``, ou floresta DFS completa se ``start`` é None
+
+    ``roots`` define a ordem em que novas árvores são iniciadas na floresta
+    (padrão: ``0..n-1``). Em grafos não dirigidos cada aresta recebe o mesmo
+    tipo nos dois sentidos, e só existem arestas de árvore e de retorno.
+    ``stats``: ver grafos.instrument. ``on_step`` recebe os eventos
+    ``DISCOVER``/``FINISH`` na ordem em que acontecem.
+    """
+    n = graph.num_vertices
+    indptr = memoryview(np.ascontiguousarray(graph.indptr))
+    indices = memoryview(np.ascontiguousarray(graph.indices))
+    directed = graph.directed
+
+    color = bytearray(n)
+    cursor = array('q', graph.indptr[:-1].tolist())
+    parent = array('q', [-1]) * n
+    discovery = array('q', [-1]) * n
+    finish = array('q', [-1]) * n
+    edge_types = bytearray([UNCLASSIFIED]) * len(graph.indices)
+    parent_arc_skipped = bytearray(n)  # Não dirigido: arco de volta ao pai já visto
+    order = array('q')
+    finish_order = array('q')
+    stack = array('q')
+    time_counter = 0
+
+    if start is not None:
+        roots = [start]
+    elif roots is None:
+        roots = range(n)
+
+    with phase(stats, 'main_loop'):
+        for root in roots:
+            if color[root] != WHITE:
+                continue
+            color[root] = GRAY
+            discovery[root] = time_counter
+            time_counter += 1
+            order.append(root)
+            stack.append(root)
+            if on_step is not None:
+                on_step(DISCOVER, root, -1)
+
+            while stack:
+                v = stack[-1]
+                arc = cursor[v]
+                if arc == indptr[v + 1]:
+                    # Todos os vizinhos examinados: finaliza v
+                    stack.pop()
+                    color[v] = BLACK
+                    finish[v] = time_counter
+                    time_counter += 1
+                    finish_order.append(v)
+                    if on_step is not None:
+                        on_step(FINISH, v, None)
+                    continue
+
+                cursor[v] = arc + 1
+                u = indices[arc]
+                state = color[u]
+
+                if state == WHITE:
+                    edge_types[arc] = TREE_EDGE
+                    parent[u] = v
+                    color[u] = GRAY
+                    discovery[u] = time_counter
+                    time_counter += 1
+                    order.append(u)
+                    stack.append(u)
+                    if on_step is not None:
+                        on_step(DISCOVER, u, v)
+                elif not directed:
+                    if u == parent[v] and not parent_arc_skipped[v]:
+                        # Volta pela própria aresta de árvore
+                        parent_arc_skipped[v] = 1
+                        edge_types[arc] = TREE_EDGE
+                    else:
+                        edge_types[arc] = BACK_EDGE
+                elif state == GRAY:
+                    edge_types[arc] = BACK_EDGE
+                elif discovery[v] < discovery[u]:
+                    edge_types[arc] = FORWARD_EDGE
+                else:
+                    edge_types[arc] = CROSS_EDGE
+
+        if stats is not None:
+            parent_array = np.frombuffer(parent, dtype=np.int64)
+            count_traversal(stats, graph, order,
+                            num_roots=int(np.count_nonzero(parent_array[order] < 0)))
+
+    return DFSResult(
+        graph,
+        np.frombuffer(order, dtype=np.int64),
+        np.frombuffer(parent, dtype=np.int64),
+        np.frombuffer(discovery, dtype=np.int64),
+        np.frombuffer(finish, dtype=np.int64),
+        np.frombuffer(edge_types, dtype=np.uint8),
+        np.frombuffer(finish_order, dtype=np.int64),
+    )
@@ -0,0 +1,76 @@
+"""
+Etapa de ordenação de arestas para Kruskal.
+
+As arestas ficam em um array estruturado NumPy (campos ``u``, ``v`` e ``w``)
+em vez de uma lista de tuplas. A ordem por peso é sempre estável (empates
+mantêm a ordem original, como ``sorted`` faz em ``kruskal_algorithm``) e fica
+guardada no próprio grafo, então execuções repetidas não reordenam nada.
+
+* Pesos inteiros com amplitude de até 2³²: radix sort LSD com dígitos de
+  16 bits (cada passada usa o sort estável de NumPy para ``uint16``, que é
+  linear).
+* Demais pesos (float ou inteiros muito espalhados): ``argsort`` estável.
+"""
+
+import numpy as np
+
+RADIX_BITS = 16
+RADIX_MAX_RANGE = 1 << 32
+
+
+def edge_dtype(graph):
+    """Tipo estruturado ``(u, v, w)`` compatível com os arrays do grafo"""
+    weight_type = np.int64 if graph.weights is None else graph.weights.dtype
+    return np.dtype([('u', graph.indices.dtype), ('v', graph.indices.dtype),
+                     ('w', weight_type)])
+
+
+def edge_records(graph):
+    """Arestas do grafo como array estruturado, uma vez por aresta não dirigida"""
+    src, dst, weights = graph.edge_arrays()
+    records = np.empty(len(src), dtype=edge_dtype(graph))
+    records['u'] = src
+    records['v'] = dst
+    records['w'] = weights
+    return records
+
+
+def radix_argsort(keys):
+    """Argsort estável de inteiros não negativos de até 64 bits (qualquer valor ``uint64``)
+
+    Faz uma passada de 16 bits por dígito do maior valor: duas para chaves
+    menores que 2³², o caso de ``stable_weight_order``, e até quatro para as
+    chaves ``min(u, v) * (maior id + 1) + max(u, v)`` de
+    ``grafos.csr.deduplicate_edges``, que passam de 2³² com ids acima de 65 535.
+    """
+    keys = np.asarray(keys, dtype=np.uint64)
+    order = np.arange(len(keys), dtype=np.int64)
+    mask = (1 << RADIX_BITS) - 1
+    max_key = int(keys.max()) if len(keys) else 0
+    shift = 0
+    while True:
+        digit = ((keys[order] >> np.uint64(shift)) & np.uint64(mask)).astype(np.uint16)
+        order = order[np.argsort(digit, kind='stable')]
+        shift += RADIX_BITS
+        if max_key >> shift == 0:
+            return order
+
+
+def stable_weight_order(weights):
+    """Permutação estável que ordena ``weights``, escolhendo o método pelo tipo"""
+    weights = np.asarray(weights)
+    if len(weights) and weights.dtype.kind in 'iub':
+        low = int(weights.min())
+        span = int(weights.max()) - low
+        if span < RADIX_MAX_RANGE:
+            return radix_argsort(weights.astype(np.int64) - low)
+    return np.argsort(weights, kind='stable')
+
+
+def sorted_edges(graph):
+    """Arestas ordenadas por peso (estável), calculadas uma vez e guardadas no grafo"""
+    if graph._sorted_edges is None:
+        records = edge_records(graph)
+        order = stable_weight_order(records['w'])
+        graph._sorted_edges = records[order]
+    return graph._sorted_edges
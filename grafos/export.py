@@ -0,0 +1,201 @@
+"""
+Exportação headless das animações: GIF, MP4 ou sequência de PNGs.
+
+Em vez de desenhar cada passo numa janela com ``plt.pause``, a visualização
+grava uma vez a sequência de quadros como dados (``frames``) e descreve a
+figura em uma ``Scene``. Os quadros são então desenhados no backend Agg por
+um pool de processos: cada processo monta a figura uma única vez (ver
+``grafos.render``) e salva um bloco contíguo de quadros como PNG. No fim os
+PNGs são codificados em GIF (Pillow, que já acompanha o matplotlib) ou MP4
+(``ffmpeg``), ou ficam como estão.
+
+Um quadro é um dicionário ``{nome do painel: conteúdo}``. Para painéis de
+grafo o conteúdo é o que ``GraphRenderer.apply`` aceita; para painéis de
+texto, a própria string.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from grafos.render import GraphRenderer
+
+FRAME_NAME = 'quadro_{:05d}.png'
+
+
+class Scene:
+    """Descrição (serializável) dos painéis de uma figura de animação"""
+
+    def __init__(self, figsize=(12, 8), suptitle=None):
+        self.figsize = figsize
+        self.suptitle = suptitle  # (texto, kwargs) ou None
+        self.panels = []          # (nome, tipo, opções)
+
+    def add_graph(self, name, pos, vertices, edges, legend=None, title=None, **options):
+        """Painel de grafo; ``legend`` é uma lista de kwargs de ``Line2D`` e ``title``
+        um título provisório ``(texto, kwargs)`` que reserva espaço no layout"""
+        self.panels.append((name, 'graph', dict(pos=pos, vertices=list(vertices),
+                                                 edges=list(edges), legend=legend,
+                                                 title=title, options=options)))
+
+    def add_text(self, name, x=0.05, y=0.95, panel=True, **options):
+        """Texto atualizado a cada quadro, num painel próprio, na figura (``panel=False``)
+        ou sobre outro painel (``panel`` = nome dele, coordenadas relativas aos eixos)"""
+        self.panels.append((name, 'text', dict(x=x, y=y, panel=panel, options=options)))
+
+    def build(self, fig, axes=None, blit=True):
+        """Cria os artistas na figura; retorna ``{nome: GraphRenderer ou Text}``
+
+        ``axes`` pode indicar os eixos de cada painel; os que faltarem são
+        criados lado a lado.
+        """
+        from matplotlib.lines import Line2D
+
+        axes = dict(axes or {})
+        missing = [name for name, kind, spec in self.panels
+                   if name not in axes and (kind == 'graph' or spec['panel'] is True)]
+        if missing:
+            created = fig.subplots(1, len(missing), squeeze=False)[0]
+            axes.update(zip(missing, created))
+        if self.suptitle is not None:
+            text, kwargs = self.suptitle
+            fig.suptitle(text, **kwargs)
+
+        artists = {}
+        renderers = []
+        for name, kind, spec in self.panels:
+            if kind == 'graph':
+                ax = axes[name]
+                renderer = GraphRenderer(ax, spec['pos'], spec['vertices'], spec['edges'],
+                                         blit=blit, **spec['options'])
+                if spec['legend']:
+                    ax.legend(handles=[Line2D([0], [0], **handle) for handle in spec['legend']],
+                              loc='upper right', fontsize=9)
+                if spec['title'] is not None:
+                    text, kwargs = spec['title']
+                    ax.set_title(text, **kwargs)
+                artists[name] = renderer
+                renderers.append(renderer)
+            elif spec['panel']:
+                if spec['panel'] is True:
+                    ax = axes[name]
+                    ax.axis('off')
+                else:
+                    ax = axes[spec['panel']]
+                artists[name] = ax.text(spec['x'], spec['y'], '', transform=ax.transAxes,
+                                        **spec['options'])
+            else:
+                artists[name] = fig.text(spec['x'], spec['y'], '', **spec['options'])
+
+        # Textos e demais grafos são redesenhados junto com o primeiro grafo
+        # (ver GraphRenderer.track e GraphRenderer.attach)
+        if renderers:
+            for renderer in renderers[1:]:
+                renderers[0].attach(renderer)
+            for name, kind, _ in self.panels:
+                if kind == 'text':
+                    renderers[0].track(artists[name])
+        return artists
+
+    @staticmethod
+    def apply(artists, frame):
+        """Aplica um quadro aos artistas criados por ``build``
+
+        Chaves do quadro sem painel na cena (desenhadas à parte pela
+        visualização) são ignoradas.
+        """
+        for name, content in frame.items():
+            target = artists.get(name)
+            if target is None:
+                continue
+            if isinstance(target, GraphRenderer):
+                target.apply(content)
+            else:
+                target.set_text(content)
+
+
+def render_frames(scene, frames, first_index, directory, dpi=100):
+    """Executado no pool: desenha um bloco de quadros no Agg e salva como PNG"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=scene.figsize)
+    FigureCanvasAgg(fig)
+    artists = scene.build(fig, blit=False)
+    fig.tight_layout()
+    paths = []
+    for offset, frame in enumerate(frames):
+        Scene.apply(artists, frame)
+        path = os.path.join(directory, FRAME_NAME.format(first_index + offset))
+        fig.savefig(path, dpi=dpi)
+        paths.append(path)
+    return paths
+
+
+def render_all(scene, frames, directory, workers=None, dpi=100):
+    """Desenha todos os quadros em ``directory``, em blocos contíguos por processo"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(frames)))
+    if workers == 1:
+        return render_frames(scene, frames, 0, directory, dpi)
+
+    size = -(-len(frames) // workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_frames, scene, frames[begin:begin + size], begin,
+                               directory, dpi)
+                   for begin in range(0, len(frames), size)]
+        return [path for future in futures for path in future.result()]
+
+
+def encode_gif(paths, output, fps):
+    from PIL import Image
+
+    images = [Image.open(path).convert('RGB') for path in paths]
+    images[0].save(output, save_all=True, append_images=images[1:],
+                   duration=int(1000 / fps), loop=0)
+
+
+def find_ffmpeg():
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg não encontrado; exporte como .gif ou como sequência de PNGs")
+    return ffmpeg
+
+
+def encode_mp4(directory, output, fps):
+    ffmpeg = find_ffmpeg()
+    subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-framerate', str(fps),
+                    '-i', os.path.join(directory, FRAME_NAME.replace('{:05d}', '%05d')),
+                    '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-c:v', 'libx264',
+                    '-pix_fmt', 'yuv420p', output], check=True)
+
+
+def export_animation(scene, frames, output, fps=1, workers=None, dpi=100):
+    """Desenha ``frames`` e grava em ``output``
+
+    O formato vem da extensão: ``.gif``, ``.mp4`` ou, sem extensão, um
+    diretório com a sequência de PNGs. Retorna o caminho gravado.
+    """
+    if not frames:
+        raise ValueError("nenhum quadro para exportar")
+    extension = os.path.splitext(output)[1].lower()
+    if extension not in ('', '.gif', '.mp4'):
+        raise ValueError(f"formato não suportado: {extension} (use .gif, .mp4 ou um diretório)")
+    if extension == '.mp4':
+        find_ffmpeg()  # Falha antes de desenhar os quadros
+
+    if extension == '':
+        os.makedirs(output, exist_ok=True)
+        render_all(scene, frames, output, workers, dpi)
+        return output
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = render_all(scene, frames, directory, workers, dpi)
+        if extension == '.gif':
+            encode_gif(paths, output, fps)
+        else:
+            encode_mp4(directory, output, fps)
+    return output
@@ -0,0 +1,191 @@
+"""
+Geradores de grafos sintéticos para benchmarks, vetorizados com NumPy.
+
+Cada gerador devolve um ``CSRGraph`` não dirigido, sem laços e sem arestas
+repetidas, que as visualizações (BFS, DFS, Prim e Kruskal) e os motores
+headless aceitam direto. As arestas são sorteadas em arrays, sem laços
+Python por aresta, e chegam a 10⁸ arestas (limitado pela memória: cerca de
+16 bytes por aresta durante a geração).
+
+Todos recebem ``seed`` (mesma semente, mesmo grafo) e, exceto ``road_graph``
+(cujo peso é o comprimento das vias), ``weights``:
+
+* ``None``: grafo sem pesos;
+* ``(low, high)`` inteiros: pesos inteiros uniformes em ``[low, high]``;
+* ``(low, high)`` com algum float: pesos reais uniformes em ``[low, high)``.
+
+Os vértices são os ids ``0..n-1`` (sem tabela de rótulos).
+"""
+
+import numpy as np
+
+from grafos.bfs import expand_ranges
+from grafos.csr import CSRGraph, deduplicate_edges
+from grafos.mst import kruskal_mst
+
+# Parâmetros R-MAT do Graph500 (probabilidades dos quadrantes a, b, c; d = resto)
+RMAT_PROBABILITIES = (0.57, 0.19, 0.19)
+
+
+def random_weights(rng, count, weights):
+    if weights is None:
+        return None
+    low, high = weights
+    if isinstance(low, (int, np.integer)) and isinstance(high, (int, np.integer)):
+        return rng.integers(low, high, size=count, endpoint=True)
+    return rng.uniform(low, high, size=count)
+
+
+def simple_graph(src, dst, num_vertices, rng, weights):
+    """Descarta laços e repetições e monta o CSR com pesos sorteados"""
+    keep = src != dst
+    src, dst, _, _ = deduplicate_edges(src[keep], dst[keep])
+    return CSRGraph.from_arrays(src, dst, random_weights(rng, len(src), weights),
+                                num_vertices=num_vertices)
+
+
+def triangle_pairs(index, n):
+    """Converte posições no triângulo superior (linha a linha) em pares ``(i, j)``, ``i < j``"""
+    def start(row):
+        return row * (2 * n - row - 1) // 2  # Posição do primeiro par da linha
+
+    index = np.asarray(index, dtype=np.int64)
+    row = ((2 * n - 1 - np.sqrt((2 * n - 1) ** 2 - 8 * index.astype(np.float64))) // 2)
+    row = row.astype(np.int64)
+    # Corrige o arredondamento da raiz
+    row -= start(row) > index
+    row += start(row + 1) <= index
+    return row, index - start(row) + row + 1
+
+
+# =============================================================================
+# Geradores
+# =============================================================================
+
+def erdos_renyi(num_vertices, num_edges=None, p=None, seed=None, weights=None):
+    """Grafo aleatório G(n, m) (ou G(n, p), se ``p`` for dado no lugar de ``num_edges``)
+
+    Grafos densos sorteiam ``m`` posições distintas do triângulo superior.
+    Os esparsos sorteiam pares com folga e descartam laços e repetições até
+    ter ``m`` arestas.
+    """
+    rng = np.random.default_rng(seed)
+    n = num_vertices
+    max_edges = n * (n - 1) // 2
+    if (num_edges is None) == (p is None):
+        raise ValueError("informe num_edges ou p (apenas um)")
+    if p is not None:
+        num_edges = int(rng.binomial(max_edges, p))
+    if num_edges > max_edges:
+        raise ValueError(f"{num_edges} arestas não cabem em {n} vértices (máximo {max_edges})")
+
+    if 4 * num_edges >= max_edges:
+        src, dst = triangle_pairs(rng.choice(max_edges, num_edges, replace=False), n)
+        return CSRGraph.from_arrays(src, dst, random_weights(rng, num_edges, weights),
+                                    num_vertices=n)
+
+    src = dst = np.empty(0, dtype=np.int64)
+    while len(src) < num_edges:
+        extra = int((num_edges - len(src)) * 1.1) + 16
+        src = np.concatenate([src, rng.integers(0, n, size=extra)])
+        dst = np.concatenate([dst, rng.integers(0, n, size=extra)])
+        keep = src != dst
+        src, dst, _, _ = deduplicate_edges(src[keep], dst[keep])
+    # A ordem de sorteio é aleatória, então as primeiras m arestas são uma amostra uniforme
+    src, dst = src[:num_edges], dst[:num_edges]
+    return CSRGraph.from_arrays(src, dst, random_weights(rng, num_edges, weights),
+                                num_vertices=n)
+
+
+def grid_graph(rows, cols, seed=None, weights=None):
+    """Grade 2D ``rows x cols``; o vértice da posição ``(r, c)`` é ``r * cols + c``"""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return CSRGraph.from_arrays(src, dst, random_weights(rng, len(src), weights),
+                                num_vertices=rows * cols)
+
+
+def road_graph(rows, cols, keep=0.5, jitter=0.3, seed=None, scale=100):
+    """Grafo "rodoviário": grade com cruzamentos deslocados e vias removidas
+
+    As interseções ficam na grade deslocadas até ``jitter`` em cada eixo. Uma
+    árvore geradora aleatória da grade sempre fica, o que garante que o grafo
+    é conexo. Das outras vias, cada uma fica com probabilidade ``keep``. O peso
+    é o comprimento da via vezes ``scale``, arredondado (inteiro, como nos
+    mapas DIMACS). Assim o grau médio fica perto de 3 e o diâmetro é grande,
+    como em redes viárias reais.
+    """
+    rng = np.random.default_rng(seed)
+    grid = grid_graph(rows, cols, seed=rng, weights=(0.0, 1.0))
+    tree, _ = kruskal_mst(grid)  # MST de pesos aleatórios: árvore geradora aleatória
+    src, dst, _ = grid.edge_arrays()
+    extra = rng.random(len(src)) < keep
+    src, dst, _, _ = deduplicate_edges(np.concatenate([tree['u'], src[extra]]),
+                                       np.concatenate([tree['v'], dst[extra]]))
+
+    xy = np.stack(np.divmod(np.arange(rows * cols), cols), axis=1)[:, ::-1].astype(float)
+    xy += rng.uniform(-jitter, jitter, size=xy.shape)
+    length = np.hypot(*(xy[src] - xy[dst]).T)
+    lengths = np.maximum(1, np.rint(length * scale)).astype(np.int64)
+    return CSRGraph.from_arrays(src, dst, lengths, num_vertices=rows * cols)
+
+
+def barabasi_albert(num_vertices, m, seed=None, weights=None):
+    """Grafo de lei de potência por ligação preferencial (Barabási–Albert)
+
+    Usa o algoritmo de Batagelj e Brandes. Cada novo vértice ``v`` cria ``m``
+    arestas, e o outro extremo de cada uma é copiado de uma posição anterior
+    sorteada na lista de extremos. Escolher uma posição ao acaso nessa lista
+    é escolher um vértice com probabilidade proporcional ao grau. As cópias
+    formam cadeias de posições ímpares. Essas cadeias são resolvidas em
+    conjunto, e cada rodada segue um elo de todas ao mesmo tempo
+    (O(log E) rodadas). Laços e repetições são descartados, então o número
+    de arestas fica um pouco abaixo de ``n * m``.
+    """
+    rng = np.random.default_rng(seed)
+    total = num_vertices * m
+    # Posição 2k guarda a origem da aresta k; 2k + 1 aponta para uma posição em [0, 2k]
+    source = np.repeat(np.arange(num_vertices, dtype=np.int64), m)
+    link = (rng.random(total) * (2 * np.arange(total) + 1)).astype(np.int64)
+    target = link.copy()
+    pending = np.flatnonzero(target % 2 == 1)
+    while len(pending):
+        target[pending] = link[target[pending] // 2]
+        pending = pending[target[pending] % 2 == 1]
+    return simple_graph(source, source[target // 2], num_vertices, rng, weights)
+
+
+def rmat_graph(scale, num_edges, probabilities=RMAT_PROBABILITIES, seed=None, weights=None):
+    """Grafo R-MAT com ``2**scale`` vértices (gerador do Graph500)
+
+    Cada aresta desce ``scale`` níveis da matriz de adjacência escolhendo um
+    quadrante com probabilidades ``(a, b, c, 1 - a - b - c)``. Todas as arestas
+    descem juntas, um nível (bit) por vez. Os ids são embaralhados no fim, para
+    que os vértices de grau alto não fiquem todos no começo.
+    """
+    rng = np.random.default_rng(seed)
+    a, b, c = probabilities
+    src = np.zeros(num_edges, dtype=np.int64)
+    dst = np.zeros(num_edges, dtype=np.int64)
+    for bit in range(scale):
+        draw = rng.random(num_edges)
+        right = ((draw >= a) & (draw < a + b)) | (draw >= a + b + c)  # Quadrantes b e d
+        down = draw >= a + b                                         # Quadrantes c e d
+        src |= down.astype(np.int64) << bit
+        dst |= right.astype(np.int64) << bit
+    permutation = rng.permutation(1 << scale)
+    return simple_graph(permutation[src], permutation[dst], 1 << scale, rng, weights)
+
+
+def complete_graph(num_vertices, seed=None, weights=(1, 100)):
+    """Grafo completo com pesos aleatórios (``n(n-1)/2`` arestas)"""
+    rng = np.random.default_rng(seed)
+    n = num_vertices
+    vertices = np.arange(n, dtype=np.int64)
+    counts = n - 1 - vertices
+    src = np.repeat(vertices, counts)
+    dst = expand_ranges(vertices + 1, counts)
+    return CSRGraph.from_arrays(src, dst, random_weights(rng, len(src), weights),
+                                num_vertices=n)
@@ -0,0 +1,146 @@
+"""
+Heap mínima indexada (binária ou d-ária) com diminuição de chave.
+
+Mesma ideia da ``HeapMinima`` de ``Alg_Prim.c``: além do vetor da heap há um
+vetor ``position`` (``posicao`` no C) com a posição de cada vértice na heap,
+o que permite ``decrease_key`` (``diminuirChave``) e ``__contains__``
+(``verticeNaHeap``) em O(log n). Cada vértice aparece no máximo uma vez, então
+a heap nunca passa de V entradas, ao contrário do ``heapq`` preguiçoso, que
+acumula O(E) entradas obsoletas.
+
+Com ``stats`` (grafos.instrument), a instância conta ``heap_pushes``,
+``heap_pops`` e ``heap_decrease_keys``. ``heap_stale_pops`` fica em 0:
+aqui não existem entradas obsoletas para descartar.
+"""
+
+from array import array
+
+NOT_IN_HEAP = -1
+
+
+class IndexedHeap:
+    def __init__(self, capacity, arity=2, stats=None):
+        if arity < 2:
+            raise ValueError("arity deve ser pelo menos 2")
+        self.arity = arity
+        self.heap = []                                    # Vértices, em ordem de heap
+        self.keys = [None] * capacity                     # Chave atual de cada vértice
+        self.position = array('q', [NOT_IN_HEAP]) * capacity
+
+        self.stats = stats
+        if stats is not None:
+            # Atributos da instância têm precedência sobre os métodos da classe
+            self.push = self._counted_push
+            self.decrease_key = self._counted_decrease_key
+            self.pop = self._counted_pop
+            stats.add('heap_stale_pops', 0)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def __contains__(self, vertex):
+        return self.position[vertex] != NOT_IN_HEAP
+
+    def key(self, vertex):
+        return self.keys[vertex]
+
+    def peek(self):
+        """Vértice de menor chave, sem remover"""
+        vertex = self.heap[0]
+        return vertex, self.keys[vertex]
+
+    def push(self, vertex, key):
+        """Insere um vértice que ainda não está na heap"""
+        if self.position[vertex] != NOT_IN_HEAP:
+            raise KeyError(f"vértice {vertex} já está na heap")
+        self.keys[vertex] = key
+        self.position[vertex] = len(self.heap)
+        self.heap.append(vertex)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, vertex, key):
+        """Diminui a chave de um vértice que está na heap"""
+        if key > self.keys[vertex]:
+            raise ValueError("a nova chave é maior que a atual")
+        self.keys[vertex] = key
+        self._sift_up(self.position[vertex])
+
+    def push_or_decrease(self, vertex, key):
+        """Insere ou diminui a chave; retorna True se a heap mudou"""
+        if self.position[vertex] == NOT_IN_HEAP:
+            self.push(vertex, key)
+            return True
+        if key < self.keys[vertex]:
+            self.decrease_key(vertex, key)
+            return True
+        return False
+
+    def pop(self):
+        """Remove e retorna ``(vértice, chave)`` de menor chave"""
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.position[top] = NOT_IN_HEAP
+        if heap:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return top, self.keys[top]
+
+    def _counted_push(self, vertex, key):
+        IndexedHeap.push(self, vertex, key)
+        self.stats.add('heap_pushes')
+
+    def _counted_decrease_key(self, vertex, key):
+        IndexedHeap.decrease_key(self, vertex, key)
+        self.stats.add('heap_decrease_keys')
+
+    def _counted_pop(self):
+        self.stats.add('heap_pops')
+        return IndexedHeap.pop(self)
+
+    def items(self):
+        """Pares ``(vértice, chave)`` presentes na heap (sem ordem definida)"""
+        return [(vertex, self.keys[vertex]) for vertex in self.heap]
+
+    def _sift_up(self, index):
+        heap, keys, position, arity = self.heap, self.keys, self.position, self.arity
+        vertex = heap[index]
+        key = keys[vertex]
+        while index > 0:
+            parent = (index - 1) // arity
+            parent_vertex = heap[parent]
+            if keys[parent_vertex] <= key:
+                break
+            heap[index] = parent_vertex
+            position[parent_vertex] = index
+            index = parent
+        heap[index] = vertex
+        position[vertex] = index
+
+    def _sift_down(self, index):
+        heap, keys, position, arity = self.heap, self.keys, self.position, self.arity
+        size = len(heap)
+        vertex = heap[index]
+        key = keys[vertex]
+        while True:
+            first_child = arity * index + 1
+            if first_child >= size:
+                break
+            # Menor filho entre os até ``arity`` filhos
+            best = first_child
+            best_key = keys[heap[first_child]]
+            for child in range(first_child + 1, min(first_child + arity, size)):
+                child_key = keys[heap[child]]
+                if child_key < best_key:
+                    best, best_key = child, child_key
+            if best_key >= key:
+                break
+            heap[index] = heap[best]
+            position[heap[index]] = index
+            index = best
+        heap[index] = vertex
+        position[vertex] = index
@@ -0,0 +1,112 @@
+"""
+Instrumentação opcional dos motores: contadores de operações e tempo por fase.
+
+Todo motor (``grafos.traversal``, ``grafos.bfs``, ``grafos.dfs``,
+``grafos.mst``, ``grafos.boruvka``, ``grafos.scc``,
+``grafos.topological``) e toda visualização aceita
+``stats=None``. Sem ``stats`` nada muda: os laços internos são os mesmos, sem
+nenhum teste a mais. Com um ``Stats``, o motor soma seus contadores e mede
+suas fases:
+
+* BFS/DFS: ``edges_scanned`` (arcos examinados), ``enqueues`` (entradas na
+  fila ou na pilha) e ``revisits`` (arcos que chegaram em vértice já
+  descoberto). Esses contadores são calculados no fim, de forma vetorizada, a
+  partir da ordem de visitação;
+* Prim: ``heap_pushes``, ``heap_pops``, ``heap_decrease_keys`` e
+  ``heap_stale_pops``. Este último é sempre 0 com a heap indexada, que troca a
+  chave no lugar em vez de deixar entradas obsoletas. Ele fica para comparar
+  com implementações de ``heapq`` preguiçoso;
+* Kruskal/Borůvka: ``find_calls``, ``find_hops`` (passos da divisão de
+  caminho) e ``unions``;
+* CFCs (``grafos.scc``): ``edges_scanned``, ``enqueues`` e ``components``.
+  O Kosaraju soma as duas passadas e mede a fase ``transpose``;
+* Kahn (``grafos.topological``): ``edges_scanned``, ``enqueues`` e
+  ``levels``, enviados a cada nível;
+* fases (segundos): ``sort``, ``main_loop``, ``record`` (gravação dos
+  quadros) e ``render`` (desenho). Fases podem ser aninhadas: nos
+  visualizadores ``record`` acontece dentro de ``main_loop``.
+
+Depois da execução, ``stats.as_dict()`` devolve tudo. Com ``callback``, os
+valores também são enviados durante a execução, como
+``callback(tipo, nome, valor)``, com tipo ``'counter'`` ou ``'phase'``. Os
+contadores são enviados no fim de cada fase e a cada nível da BFS por níveis
+ou lote do union-find.
+
+    stats = Stats()
+    kruskal_mst(grafo, stats=stats)
+    stats.as_dict()
+    # {'counters': {'find_calls': ..., 'find_hops': ..., 'unions': ...},
+    #  'phases': {'sort': ..., 'main_loop': ...}}
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+
+class Stats:
+    def __init__(self, callback=None):
+        self.counters = {}
+        self.phases = {}
+        self.callback = callback
+        self._flushed = {}  # Último valor enviado de cada contador
+
+    def add(self, name, amount=1):
+        """Soma ``amount`` ao contador (sem enviar ao callback)"""
+        self.counters[name] = self.counters.get(name, 0) + int(amount)
+
+    def flush(self):
+        """Envia ao callback os contadores que mudaram desde o último envio"""
+        if self.callback is None:
+            return
+        for name, value in self.counters.items():
+            if self._flushed.get(name) != value:
+                self._flushed[name] = value
+                self.callback('counter', name, value)
+
+    @contextmanager
+    def phase(self, name):
+        """Mede o bloco e soma o tempo à fase ``name``"""
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            if self.callback is not None:
+                self.flush()
+                self.callback('phase', name, elapsed)
+
+    def reset(self):
+        self.counters.clear()
+        self.phases.clear()
+        self._flushed.clear()
+
+    def as_dict(self):
+        return {'counters': dict(self.counters), 'phases': dict(self.phases)}
+
+    def __repr__(self):
+        counters = ", ".join(f"{name}={value}" for name, value in self.counters.items())
+        phases = ", ".join(f"{name}={value:.4f}s" for name, value in self.phases.items())
+        return f"Stats({counters}; {phases})"
+
+
+def phase(stats, name):
+    """``stats.phase(name)``, ou um contexto vazio se ``stats`` é None"""
+    return nullcontext() if stats is None else stats.phase(name)
+
+
+def count_traversal(stats, graph, order, num_roots=1):
+    """Contadores de BFS/DFS a partir da ordem de visitação (ids)
+
+    Todo vértice visitado tem todos os seus arcos examinados, e entrou uma
+    única vez na fila/pilha. Então ``edges_scanned`` é a soma dos graus, e
+    ``revisits`` são os arcos que não descobriram um vértice novo (todos menos
+    os arcos de árvore).
+    """
+    order = np.asarray(order, dtype=np.int64)
+    scanned = int((graph.indptr[order + 1] - graph.indptr[order]).sum())
+    stats.add('edges_scanned', scanned)
+    stats.add('enqueues', len(order))
+    stats.add('revisits', scanned - (len(order) - num_roots))
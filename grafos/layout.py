@@ -0,0 +1,132 @@
+"""
+Posições dos vértices (spring layout) com cache em disco.
+
+``nx.spring_layout`` é, de longe, a parte mais cara de abrir uma visualização
+de um grafo grande: muito mais lenta que o próprio algoritmo. Como as posições
+só dependem do grafo e dos parâmetros do layout, elas são calculadas uma vez e
+guardadas como um array ``.npy`` de coordenadas.
+
+A chave do cache é um hash SHA-256 de:
+
+* os rótulos dos vértices, em ordem canônica (ordenados);
+* as arestas, como pares de posições nessa ordem, sem sentido e sem repetição;
+* os pesos, quando o layout os usa;
+* os parâmetros do layout (``seed``, ``iterations``...).
+
+Como a chave não depende da ordem de construção do ``CSRGraph``, as
+visualizações de BFS, DFS, Prim e Kruskal de um mesmo grafo compartilham as
+mesmas posições. O layout também é calculado com os vértices nessa ordem
+canônica, então o resultado não depende de quem o calculou primeiro.
+"""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+# Muda quando o formato da chave ou do arquivo mudar (invalida o cache antigo)
+CACHE_VERSION = 1
+
+# Diretório padrão; pode ser trocado pela variável de ambiente GRAFOS_LAYOUT_CACHE
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'grafos', 'layouts')
+
+
+def default_cache_dir():
+    return os.environ.get('GRAFOS_LAYOUT_CACHE', DEFAULT_CACHE_DIR)
+
+
+def canonical_graph(graph, weighted=False):
+    """Vértices em ordem canônica e arestas ``(lo, hi)`` como posições nessa ordem
+
+    Retorna ``(rótulos, lo, hi, pesos)``; as arestas vêm ordenadas e sem
+    repetição, e ``pesos`` é None se ``weighted`` for False.
+    """
+    labels = graph.vertex_labels()
+    order = sorted(range(len(labels)), key=lambda i: (type(labels[i]).__name__, labels[i]))
+    rank = np.empty(len(labels), dtype=np.int64)
+    rank[order] = np.arange(len(labels), dtype=np.int64)
+
+    src, dst, weights, _ = graph.unique_edges()
+    a = rank[src]
+    b = rank[dst]
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    edge_order = np.lexsort((hi, lo))
+    lo, hi = lo[edge_order], hi[edge_order]
+    weights = weights[edge_order] if weighted else None
+    if len(lo):
+        # Em grafos dirigidos u->v e v->u viram a mesma aresta
+        keep = np.ones(len(lo), dtype=bool)
+        keep[1:] = (lo[1:] != lo[:-1]) | (hi[1:] != hi[:-1])
+        lo, hi = lo[keep], hi[keep]
+        if weighted:
+            weights = weights[keep]
+    return [labels[i] for i in order], lo, hi, weights
+
+
+def layout_key(labels, lo, hi, weights, params):
+    digest = hashlib.sha256()
+    digest.update(f"spring-v{CACHE_VERSION}|{sorted(params.items())!r}|".encode())
+    digest.update('\0'.join(repr(label) for label in labels).encode())
+    digest.update(lo.astype('<i8').tobytes())
+    digest.update(hi.astype('<i8').tobytes())
+    if weights is not None:
+        digest.update(weights.astype('<f8').tobytes())
+    return digest.hexdigest()
+
+
+def spring_layout(graph, weighted=False, seed=42, cache_dir=None, **params):
+    """``nx.spring_layout`` do ``CSRGraph`` com cache em disco; retorna ``{rótulo: (x, y)}``
+
+    ``weighted`` usa os pesos das arestas como força das molas (como quando o
+    ``nx.Graph`` tem o atributo ``weight``). ``params`` são repassados a
+    ``nx.spring_layout`` e fazem parte da chave. ``cache_dir=False`` desliga o
+    cache.
+    """
+    labels, lo, hi, weights = canonical_graph(graph, weighted)
+    params = dict(params, seed=seed)
+
+    path = None
+    if cache_dir is not False:
+        directory = default_cache_dir() if cache_dir is None else cache_dir
+        path = os.path.join(directory, layout_key(labels, lo, hi, weights, params) + '.npy')
+        if os.path.exists(path):
+            coords = np.load(path)
+            if coords.shape == (len(labels), 2):
+                return dict(zip(labels, coords))
+
+    coords = compute_spring_layout(labels, lo, hi, weights, params)
+    if path is not None:
+        save_atomic(path, coords)
+    return dict(zip(labels, coords))
+
+
+def compute_spring_layout(labels, lo, hi, weights, params):
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_nodes_from(labels)
+    if weights is None:
+        G.add_edges_from((labels[u], labels[v]) for u, v in zip(lo.tolist(), hi.tolist()))
+    else:
+        G.add_weighted_edges_from((labels[u], labels[v], w) for u, v, w in
+                                  zip(lo.tolist(), hi.tolist(), weights.tolist()))
+    pos = nx.spring_layout(G, **params)
+    return np.array([pos[label] for label in labels], dtype=float).reshape(-1, 2)
+
+
+def save_atomic(path, coords):
+    """Grava via arquivo temporário + rename (leitores nunca veem arquivo pela metade)"""
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp = tempfile.mkstemp(suffix='.npy', dir=directory)
+    except OSError:
+        return  # Sem permissão de escrita: segue sem cache
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            np.save(file, coords)
+        os.replace(temp, path)
+    except OSError:
+        os.unlink(temp)
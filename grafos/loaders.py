@@ -0,0 +1,287 @@
+"""
+Leitura de grafos grandes de arquivos, direto para arrays NumPy.
+
+Formatos aceitos:
+
+* lista de arestas: uma aresta ``u v [peso]`` por linha, separada por espaços
+  (ou por ``delimiter``). Linhas que começam com ``#`` ou ``%`` são
+  comentários (SNAP, KONECT, CSV simples);
+* DIMACS ``.gr`` (mapas rodoviários do 9º desafio DIMACS): a linha
+  ``p sp n m`` e os arcos ``a u v peso``, com vértices de 1 a n;
+* Matrix Market ``.mtx`` no formato ``coordinate`` (``pattern``, ``integer``
+  ou ``real``; ``general`` ou ``symmetric``), com índices a partir de 1.
+
+O arquivo é lido em blocos de ``chunk_bytes`` cortados na última quebra de
+linha. Cada bloco vira arrays ``src``/``dst``/``pesos`` pelo ``np.loadtxt``,
+que tem parser em C. Nenhum objeto Python é criado por aresta, então a memória
+fica perto dos arrays finais mais um bloco. Arquivos ``.gz`` são
+descompactados durante a leitura.
+
+Todos os leitores devolvem um ``CSRGraph``, que as quatro visualizações
+aceitam no construtor. Em grafos não dirigidos os laços são descartados, e as
+arestas repetidas viram uma só via ``deduplicate_edges`` (por exemplo, os
+arcos ``u->v`` e ``v->u`` dos mapas DIMACS).
+"""
+
+import gzip
+import io
+import os
+import warnings
+
+import numpy as np
+
+from grafos.csr import CSRGraph, deduplicate_edges
+
+# Tamanho dos blocos lidos do disco (a última linha incompleta passa para o próximo)
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+EDGE_LIST_COMMENTS = ('#', '%')
+
+
+def open_binary(path):
+    """Abre ``path`` para leitura binária, descompactando ``.gz``"""
+    if os.fspath(path).endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def read_blocks(file, chunk_bytes=DEFAULT_CHUNK_BYTES, first=b''):
+    """Blocos de linhas completas de ``file``, começando com os bytes ``first``"""
+    rest = first
+    while True:
+        data = file.read(chunk_bytes)
+        if not data:
+            break
+        data = rest + data
+        cut = data.rfind(b'\n') + 1
+        rest = data[cut:]
+        if cut:
+            yield data[:cut]
+    if rest.strip():
+        yield rest  # Última linha sem quebra no final
+
+
+def parse_blocks(blocks, dtype, source, **options):
+    """Converte cada bloco com ``np.loadtxt`` e junta os resultados"""
+    parts = []
+    ndmin = 1 if np.dtype(dtype).names else 2  # Uma linha por registro ou por linha da matriz
+    for block in blocks:
+        with warnings.catch_warnings():
+            # Um bloco só com comentários não é erro
+            warnings.simplefilter('ignore', UserWarning)
+            try:
+                parts.append(np.loadtxt(io.BytesIO(block), dtype=dtype, ndmin=ndmin,
+                                        encoding='utf-8', **options))
+            except ValueError as error:
+                raise ValueError(f"{source}: {error}") from None
+    if not parts:
+        return np.empty((0,) * ndmin, dtype=dtype)
+    return np.concatenate(parts)
+
+
+def compact_weights(weights):
+    """Pesos inteiros lidos como float voltam a ser int64"""
+    if len(weights) and np.all(np.isfinite(weights)) and np.all(weights == np.round(weights)):
+        return weights.astype(np.int64)
+    return weights
+
+
+def build_graph(src, dst, weights, num_vertices, labels=None, directed=False):
+    """``CSRGraph`` dos arrays lidos; sem laços nem repetições se não for dirigido"""
+    if not directed:
+        keep = src != dst
+        if not keep.all():
+            src, dst = src[keep], dst[keep]
+            weights = None if weights is None else weights[keep]
+        src, dst, weights, _ = deduplicate_edges(src, dst, weights)
+    return CSRGraph.from_arrays(src, dst, weights, num_vertices=num_vertices,
+                                labels=labels, directed=directed)
+
+
+def first_data_line(file, comments):
+    """Pula linhas vazias e comentários; retorna a primeira linha de dados (ou b'')"""
+    prefixes = tuple(comment.encode() for comment in comments)
+    for line in iter(file.readline, b''):
+        stripped = line.strip()
+        if stripped and not stripped.startswith(prefixes):
+            return line
+    return b''
+
+
+def is_integer(token):
+    try:
+        int(token)
+    except ValueError:
+        return False
+    return True
+
+
+# =============================================================================
+# Lista de arestas
+# =============================================================================
+
+def load_edge_list(path, directed=False, weighted=None, delimiter=None,
+                   comments=EDGE_LIST_COMMENTS, relabel=False,
+                   chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Lista de arestas ``u v [peso]``, uma por linha
+
+    Vértices inteiros são usados como ids (``0..max``). Com ``relabel=True``,
+    ou se algum vértice não for inteiro, os ids são compactados e os valores
+    originais viram os rótulos. ``weighted=None`` usa a terceira coluna se
+    ela existir; pesos inteiros ficam int64.
+    """
+    with open_binary(path) as file:
+        first = first_data_line(file, comments)
+        if not first:
+            return CSRGraph.from_arrays([], [], directed=directed)
+        tokens = first.decode('utf-8').split(delimiter)
+        if len(tokens) < 2:
+            raise ValueError(f"{path}: esperado 'u v [peso]', encontrado {first!r}")
+        if weighted is None:
+            weighted = len(tokens) > 2
+        numeric = is_integer(tokens[0]) and is_integer(tokens[1])
+
+        columns = (0, 1, 2) if weighted else (0, 1)
+        if numeric:
+            dtype = [('u', np.int64), ('v', np.int64), ('w', np.float64)][:len(columns)]
+        else:
+            dtype = str  # Largura dos rótulos decidida pelo próprio loadtxt
+        rows = parse_blocks(read_blocks(file, chunk_bytes, first), dtype, path,
+                            comments=comments, delimiter=delimiter, usecols=columns)
+
+    if numeric:
+        src, dst = rows['u'], rows['v']
+        weights = compact_weights(rows['w']) if weighted else None
+    else:
+        rows = rows.reshape(-1, len(columns))  # Vazio vira (0, colunas)
+        src, dst = rows[:, 0], rows[:, 1]
+        weights = None
+        if weighted:
+            try:
+                weights = compact_weights(rows[:, 2].astype(np.float64))
+            except ValueError as error:
+                raise ValueError(f"{path}: {error}") from None
+
+    labels = None
+    if relabel or not numeric:
+        values, inverse = np.unique(np.concatenate([src, dst]), return_inverse=True)
+        src, dst = inverse[:len(src)], inverse[len(src):]
+        labels = values.tolist()
+        num_vertices = len(labels)
+    else:
+        if len(src) and min(src.min(), dst.min()) < 0:
+            raise ValueError(f"{path}: ids negativos (use relabel=True)")
+        num_vertices = int(max(src.max(), dst.max())) + 1 if len(src) else 0
+    return build_graph(src, dst, weights, num_vertices, labels, directed)
+
+
+# =============================================================================
+# DIMACS (.gr)
+# =============================================================================
+
+def load_dimacs(path, directed=False, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Grafo DIMACS ``.gr`` (linha ``p sp n m`` e arcos ``a u v peso``)
+
+    Os vértices ``1..n`` viram os ids ``0..n-1``, e o rótulo é o próprio id.
+    Os mapas rodoviários trazem cada via nos dois sentidos. Com
+    ``directed=False`` (o padrão, que é o que Prim e Kruskal esperam) os dois
+    arcos viram uma aresta só.
+    """
+    with open_binary(path) as file:
+        header = None
+        for line in iter(file.readline, b''):
+            fields = line.split()
+            if not fields or fields[0] == b'c':
+                continue
+            if fields[0] != b'p' or len(fields) != 4:
+                raise ValueError(f"{path}: esperada a linha 'p sp n m', encontrado {line!r}")
+            header = fields
+            break
+        if header is None:
+            raise ValueError(f"{path}: linha 'p sp n m' não encontrada")
+        num_vertices, num_arcs = int(header[2]), int(header[3])
+
+        dtype = [('u', np.int64), ('v', np.int64), ('w', np.float64)]
+        arcs = parse_blocks(read_blocks(file, chunk_bytes), dtype, path,
+                            comments='c', usecols=(1, 2, 3))
+
+    if len(arcs) != num_arcs:
+        raise ValueError(f"{path}: {len(arcs)} arcos lidos, o cabeçalho indica {num_arcs}")
+    src, dst = arcs['u'] - 1, arcs['v'] - 1
+    if len(src) and (min(src.min(), dst.min()) < 0 or
+                     max(src.max(), dst.max()) >= num_vertices):
+        raise ValueError(f"{path}: vértice fora do intervalo 1..{num_vertices}")
+    return build_graph(src, dst, compact_weights(arcs['w']), num_vertices,
+                       directed=directed)
+
+
+# =============================================================================
+# Matrix Market (.mtx)
+# =============================================================================
+
+def load_matrix_market(path, directed=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Matriz de adjacência Matrix Market no formato ``coordinate``
+
+    A entrada ``i j [valor]`` vira a aresta ``i-1 -> j-1`` com o valor como
+    peso (``pattern`` não tem pesos). ``directed=None`` decide pela simetria:
+    ``symmetric`` é não dirigido e ``general`` é dirigido.
+    """
+    with open_binary(path) as file:
+        banner = file.readline().decode('utf-8').lower().split()
+        if len(banner) != 5 or banner[0] != '%%matrixmarket' or banner[1] != 'matrix':
+            raise ValueError(f"{path}: cabeçalho %%MatrixMarket inválido")
+        _, _, layout, field, symmetry = banner
+        if layout != 'coordinate':
+            raise ValueError(f"{path}: só o formato 'coordinate' é suportado, não '{layout}'")
+        if field not in ('pattern', 'integer', 'real'):
+            raise ValueError(f"{path}: tipo '{field}' não suportado")
+        if symmetry not in ('general', 'symmetric'):
+            raise ValueError(f"{path}: simetria '{symmetry}' não suportada")
+
+        size = first_data_line(file, '%').split()
+        if len(size) != 3:
+            raise ValueError(f"{path}: esperada a linha 'linhas colunas entradas'")
+        rows, cols, entries = (int(value) for value in size)
+        if rows != cols:
+            raise ValueError(f"{path}: matriz de adjacência deve ser quadrada ({rows}x{cols})")
+
+        weighted = field != 'pattern'
+        dtype = [('i', np.int64), ('j', np.int64), ('w', np.float64)][:3 if weighted else 2]
+        data = parse_blocks(read_blocks(file, chunk_bytes), dtype, path,
+                            comments='%', usecols=(0, 1, 2) if weighted else (0, 1))
+
+    if len(data) != entries:
+        raise ValueError(f"{path}: {len(data)} entradas lidas, o cabeçalho indica {entries}")
+    src, dst = data['i'] - 1, data['j'] - 1
+    if len(src) and (min(src.min(), dst.min()) < 0 or
+                     max(src.max(), dst.max()) >= rows):
+        raise ValueError(f"{path}: índice fora do intervalo 1..{rows}")
+    weights = None
+    if weighted:
+        weights = data['w'].astype(np.int64) if field == 'integer' else data['w']
+    if directed is None:
+        directed = symmetry == 'general'
+    elif directed and symmetry == 'symmetric':
+        # O arquivo só traz um triângulo; o grafo dirigido precisa dos dois sentidos
+        mirror = src != dst
+        src, dst = np.concatenate([src, dst[mirror]]), np.concatenate([dst, src[mirror]])
+        if weights is not None:
+            weights = np.concatenate([weights, weights[mirror]])
+    return build_graph(src, dst, weights, rows, directed=directed)
+
+
+def load_graph(path, **options):
+    """Escolhe o leitor pela extensão: ``.csr`` (``grafos.binary``), ``.gr``
+    (DIMACS), ``.mtx`` (Matrix Market) ou lista de arestas para o resto
+    (``.gz`` é aceito nos formatos de texto)"""
+    name = os.fspath(path)
+    if name.endswith('.csr'):
+        from grafos.binary import load_binary  # Import tardio: python -m grafos.binary
+        return load_binary(path, **options)
+    if name.endswith('.gz'):
+        name = name[:-3]
+    if name.endswith('.gr'):
+        return load_dimacs(path, **options)
+    if name.endswith('.mtx'):
+        return load_matrix_market(path, **options)
+    return load_edge_list(path, **options)
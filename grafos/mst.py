@@ -0,0 +1,78 @@
+"""
+Árvore geradora mínima sem interface gráfica.
+
+As funções retornam ``(mst, total_weight)``, o mesmo formato de
+``KruskalVisualization.kruskal_algorithm`` e ``PrimVisualization.run_prim_algorithm``,
+mas ``mst`` é um array estruturado ``(u, v, w)`` com ids de vértices. Use
+``mst_labels`` para obter a lista de tuplas com rótulos.
+"""
+
+from array import array
+
+import numpy as np
+
+from grafos.edge_sort import edge_dtype, sorted_edges
+from grafos.indexed_heap import IndexedHeap
+from grafos.instrument import phase
+from grafos.union_find import UnionFind
+
+
+def kruskal_mst(graph, stats=None):
+    """Kruskal: ordenação em cache (grafos.edge_sort) + union-find em lotes
+
+    ``stats``: ver grafos.instrument.
+    """
+    with phase(stats, 'sort'):
+        edges = sorted_edges(graph)
+    with phase(stats, 'main_loop'):
+        union_find = UnionFind(graph.num_vertices, stats)
+        accepted = union_find.union_many(edges['u'], edges['v'])
+    mst = edges[accepted]
+    return mst, mst['w'].sum().item()
+
+
+def prim_mst(graph, start=0, arity=4, stats=None):
+    """Prim com heap indexada d-ária (uma entrada por vértice, como primComHeap em C)
+
+    Cobre apenas o componente de ``start``. As arestas saem na ordem em que
+    entram na árvore. ``stats``: ver grafos.instrument.
+    """
+    n = graph.num_vertices
+    indptr = memoryview(np.ascontiguousarray(graph.indptr))
+    indices = graph.indices
+    weights = graph.weights if graph.weights is not None else np.ones(len(indices), dtype=np.int64)
+
+    heap = IndexedHeap(n, arity, stats)
+    parent = array('q', [-1]) * n
+    in_tree = bytearray(n)
+    tree_u = array('q')
+    tree_v = array('q')
+    tree_w = []
+
+    with phase(stats, 'main_loop'):
+        heap.push(start, 0)
+        while heap:
+            v, key = heap.pop()
+            in_tree[v] = 1
+            if parent[v] >= 0:
+                tree_u.append(parent[v])
+                tree_v.append(v)
+                tree_w.append(key)
+
+            begin, end = indptr[v], indptr[v + 1]
+            for u, weight in zip(indices[begin:end].tolist(), weights[begin:end].tolist()):
+                if not in_tree[u] and heap.push_or_decrease(u, weight):
+                    parent[u] = v
+
+    mst = np.empty(len(tree_u), dtype=edge_dtype(graph))
+    mst['u'] = np.frombuffer(tree_u, dtype=np.int64)
+    mst['v'] = np.frombuffer(tree_v, dtype=np.int64)
+    mst['w'] = tree_w
+    return mst, mst['w'].sum().item()
+
+
+def mst_labels(graph, mst):
+    """Converte o array ``(u, v, w)`` para ``[(rótulo_u, rótulo_v, peso)]``"""
+    label_of = graph.label_of
+    return [(label_of(u), label_of(v), w)
+            for u, v, w in zip(mst['u'].tolist(), mst['v'].tolist(), mst['w'].tolist())]
@@ -0,0 +1,231 @@
+"""
+Backend nativo opcional (ctypes) para Kruskal e Prim.
+
+``native_mst.c`` traz o ``kruskal``/``UnionFind`` de ``Alg_Kruskal.c`` e o
+``primComHeap``/``primSimples`` de ``Alg_Prim.c`` reescritos sobre os arrays do
+``CSRGraph``. Os arrays do NumPy são passados por ponteiro, sem converter
+aresta por aresta para objetos Python. O C recebe vértices int64 e pesos
+double; o ``CSRGraph`` guarda ``indices`` em int32 quando cabe e pesos
+inteiros em int64, então a conversão é feita uma única vez por grafo e fica
+em cache nele (``native_arrays``), como as arestas ordenadas de
+``grafos.edge_sort``. A biblioteca é compilada uma vez:
+
+    python -m grafos.native
+
+Esse comando também roda ``check_parity``, que compara o peso das MSTs com o
+caminho em Python puro (``grafos.mst``). ``kruskal_mst`` e ``prim_mst`` têm a
+mesma interface das funções de ``grafos.mst``. Sem a biblioteca compilada, ou
+com ``GRAFOS_NATIVE=0``, elas chamam as versões em Python.
+
+A ordenação das arestas continua no NumPy (``grafos.edge_sort``). O
+``quickSort`` do C não é estável e fica O(E²) com muitos pesos repetidos. A
+ordem estável faz o Kruskal nativo escolher exatamente as mesmas arestas que
+o Python.
+"""
+
+import ctypes
+import os
+import subprocess
+import sys
+import sysconfig
+
+import numpy as np
+
+from grafos import mst
+from grafos.edge_sort import edge_dtype, sorted_edges
+from grafos.instrument import phase
+
+ABI_VERSION = 1  # VERSAO_ABI de native_mst.c
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(DIRECTORY, 'native_mst.c')
+LIBRARY = os.path.join(DIRECTORY, '_native_mst' + (sysconfig.get_config_var('SHLIB_SUFFIX')
+                                                   or '.so'))
+
+# Tipos dos argumentos: arrays contíguos passados por ponteiro
+INT64_ARRAY = np.ctypeslib.ndpointer(dtype=np.int64, flags='C_CONTIGUOUS')
+UINT8_ARRAY = np.ctypeslib.ndpointer(dtype=np.uint8, flags='C_CONTIGUOUS')
+FLOAT64_ARRAY = np.ctypeslib.ndpointer(dtype=np.float64, flags='C_CONTIGUOUS')
+
+_library = None
+_loaded = False
+
+
+def build(compiler=None):
+    """Compila ``native_mst.c`` em ``LIBRARY``; retorna o caminho da biblioteca"""
+    global _library, _loaded
+    compiler = compiler or os.environ.get('CC', 'cc')
+    subprocess.run([compiler, '-O2', '-shared', '-fPIC', '-o', LIBRARY, SOURCE], check=True)
+    _library, _loaded = None, False
+    return LIBRARY
+
+
+def load_library():
+    """A biblioteca nativa, ou None se não foi compilada, está desatualizada ou foi desligada"""
+    global _library, _loaded
+    if _loaded:
+        return _library
+    _loaded = True
+    if os.environ.get('GRAFOS_NATIVE', '1') == '0' or not os.path.exists(LIBRARY):
+        return None
+    try:
+        library = ctypes.CDLL(LIBRARY)
+    except OSError:
+        return None
+
+    library.versaoABI.restype = ctypes.c_int64
+    if library.versaoABI() != ABI_VERSION:
+        return None
+
+    int64 = ctypes.c_int64
+    library.kruskal.restype = int64
+    library.kruskal.argtypes = [int64, int64, INT64_ARRAY, INT64_ARRAY, UINT8_ARRAY, INT64_ARRAY]
+    prim_arguments = [int64, INT64_ARRAY, INT64_ARRAY, FLOAT64_ARRAY, int64,
+                      INT64_ARRAY, INT64_ARRAY, INT64_ARRAY, INT64_ARRAY]
+    for name in ('primComHeap', 'primSimples'):
+        function = getattr(library, name)
+        function.restype = int64
+        function.argtypes = prim_arguments
+    _library = library
+    return library
+
+
+def available():
+    return load_library() is not None
+
+
+def native_arrays(graph, name):
+    """Arrays contíguos nos tipos do C, convertidos uma vez e guardados no grafo
+
+    ``'csr'``: ``(indptr, indices, pesos)`` para o Prim; ``'edges'``: origem e
+    destino das arestas ordenadas para o Kruskal. Arrays que já estão no tipo
+    certo não são copiados. ``CSRGraph.clear_caches`` descarta o cache.
+    """
+    cache = graph._native_arrays
+    if name not in cache:
+        if name == 'csr':
+            weights = graph.weights if graph.weights is not None else np.ones(len(graph.indices))
+            cache[name] = (np.ascontiguousarray(graph.indptr, dtype=np.int64),
+                           np.ascontiguousarray(graph.indices, dtype=np.int64),
+                           np.ascontiguousarray(weights, dtype=np.float64))
+        else:
+            edges = sorted_edges(graph)
+            cache[name] = (np.ascontiguousarray(edges['u'], dtype=np.int64),
+                           np.ascontiguousarray(edges['v'], dtype=np.int64))
+    return cache[name]
+
+
+def kruskal_mst(graph, stats=None):
+    """Kruskal nativo; mesmo resultado de ``grafos.mst.kruskal_mst``"""
+    library = load_library()
+    if library is None:
+        return mst.kruskal_mst(graph, stats=stats)
+
+    with phase(stats, 'sort'):
+        edges = sorted_edges(graph)
+        sources, targets = native_arrays(graph, 'edges')
+    with phase(stats, 'main_loop'):
+        accepted = np.empty(len(edges), dtype=np.uint8)
+        counters = np.zeros(3, dtype=np.int64)
+        if library.kruskal(graph.num_vertices, len(edges), sources, targets,
+                           accepted, counters) < 0:
+            raise MemoryError("kruskal nativo: falha na alocação")
+        if stats is not None:
+            for name, value in zip(('find_calls', 'find_hops', 'unions'), counters.tolist()):
+                stats.add(name, value)
+    tree = edges[accepted.view(bool)]
+    return tree, tree['w'].sum().item()
+
+
+def prim_mst(graph, start=0, method='heap', stats=None):
+    """Prim nativo; mesmo formato de ``grafos.mst.prim_mst``
+
+    ``method='heap'`` usa ``primComHeap`` (O(E log V)); ``'simple'`` usa
+    ``primSimples`` (O(V²)), melhor em grafos densos. Sem a biblioteca, os
+    dois caem no Prim com heap de ``grafos.mst``. Com empates de peso a árvore
+    pode ter outras arestas, mas o peso total é o mesmo.
+    """
+    if method not in ('heap', 'simple'):
+        raise ValueError(f"método desconhecido: {method}")
+    # Conferido antes do C, que escreveria fora dos arrays (e antes do fallback,
+    # para que os dois caminhos falhem do mesmo jeito)
+    n = graph.num_vertices
+    if n == 0:
+        raise ValueError("prim: o grafo não tem vértices")
+    if not 0 <= start < n:
+        raise IndexError(f"prim: vértice inicial {start} fora de 0..{n - 1}")
+    library = load_library()
+    if library is None:
+        return mst.prim_mst(graph, start, stats=stats)
+
+    indptr, indices, weights = native_arrays(graph, 'csr')
+    order = np.empty(n, dtype=np.int64)
+    parent = np.empty(n, dtype=np.int64)
+    arc = np.empty(n, dtype=np.int64)
+    counters = np.zeros(3, dtype=np.int64)
+    function = library.primComHeap if method == 'heap' else library.primSimples
+
+    with phase(stats, 'main_loop'):
+        size = function(n, indptr, indices, weights, start, order, parent, arc, counters)
+        if size < 0:
+            raise MemoryError("prim nativo: falha na alocação")
+        if stats is not None and method == 'heap':
+            for name, value in zip(('heap_pushes', 'heap_pops', 'heap_decrease_keys'),
+                                   counters.tolist()):
+                stats.add(name, value)
+            stats.add('heap_stale_pops', 0)
+
+    children = order[1:size]
+    tree = np.empty(len(children), dtype=edge_dtype(graph))
+    tree['u'] = parent[children]
+    tree['v'] = children
+    tree['w'] = (graph.weights[arc[children]] if graph.weights is not None
+                 else np.ones(len(children), dtype=np.int64))
+    return tree, tree['w'].sum().item()
+
+
+def check_parity(graphs=None, verbose=True):
+    """Compara o peso das MSTs nativas com ``grafos.mst``; retorna True se todas batem
+
+    Sem ``graphs``, usa grafos de ``grafos.generators`` (esparsos, densos,
+    pesos inteiros e reais, desconexos). Para Prim, cada grafo é testado a
+    partir do vértice de maior grau (só o componente dele).
+    """
+    from grafos import generators
+
+    if graphs is None:
+        graphs = {
+            'er inteiro': generators.erdos_renyi(2000, 8000, seed=1, weights=(1, 50)),
+            'er real': generators.erdos_renyi(2000, 8000, seed=2, weights=(0.0, 1.0)),
+            'er desconexo': generators.erdos_renyi(3000, 1500, seed=3, weights=(1, 5)),
+            'rodoviário': generators.road_graph(60, 60, seed=4),
+            'completo': generators.complete_graph(300, seed=5),
+            'sem pesos': generators.grid_graph(40, 40),
+        }
+    if not available():
+        if verbose:
+            print("⚠️  Biblioteca nativa indisponível: rode 'python -m grafos.native'")
+        return False
+
+    ok = True
+    if verbose:
+        print(f"{'grafo':>14} {'algoritmo':>12} {'python':>14} {'nativo':>14}")
+    for name, graph in graphs.items():
+        checks = [('kruskal', mst.kruskal_mst(graph)[1], kruskal_mst(graph)[1])]
+        start = int(np.argmax(graph.degrees()))
+        python_prim = mst.prim_mst(graph, start)[1]
+        for method in ('heap', 'simple'):
+            checks.append((f'prim {method}', python_prim, prim_mst(graph, start, method)[1]))
+        for algorithm, expected, got in checks:
+            match = bool(np.isclose(expected, got, rtol=1e-9, atol=1e-9))
+            ok &= match
+            if verbose:
+                print(f"{name:>14} {algorithm:>12} {expected:>14.6g} {got:>14.6g} "
+                      f"{'✅' if match else '❌'}")
+    return ok
+
+
+if __name__ == '__main__':
+    print(f"🔧 Compilando {SOURCE}...")
+    build()
+    print(f"✅ Biblioteca gerada em {LIBRARY}")
+    sys.exit(0 if check_parity() else 1)
@@ -0,0 +1,334 @@
+/*
+ * Backend nativo das árvores geradoras mínimas (ver grafos/native.py)
+ *
+ * Mesmos algoritmos de Alg_Kruskal.c (kruskal, UnionFind) e Alg_Prim.c
+ * (primComHeap, primSimples), adaptados para receber os arrays do CSRGraph
+ * direto da memória do NumPy: sem limite de vértices, sem structs por aresta
+ * e sem printf. Vértices são int64 e pesos são double.
+ *
+ * Compilação (feita por "python -m grafos.native"):
+ *     cc -O2 -shared -fPIC -o _native_mst.so native_mst.c
+ */
+
+#include <stdint.h>
+#include <stdlib.h>
+
+// Incrementada a cada mudança de assinatura; conferida pelo Python ao carregar
+#define VERSAO_ABI 1
+
+int64_t versaoABI(void) {
+    return VERSAO_ABI;
+}
+
+// =============================================================================
+// UNION-FIND (Alg_Kruskal.c, com arrays alocados pelo tamanho do grafo)
+// =============================================================================
+
+typedef struct {
+    int64_t* pai;
+    uint8_t* rank;
+    int64_t numeroConjuntos;
+    int64_t* contadores;  // find_calls, find_hops, unions
+} UnionFind;
+
+// Encontra o representante do conjunto (com compressão de caminho)
+static int64_t encontrar(UnionFind* uf, int64_t vertice) {
+    uf->contadores[0]++;
+    int64_t raiz = vertice;
+    while (uf->pai[raiz] != raiz) {
+        raiz = uf->pai[raiz];
+    }
+    // Compressão de caminho: faz todos os nós apontarem diretamente para a raiz
+    while (uf->pai[vertice] != raiz) {
+        int64_t proximo = uf->pai[vertice];
+        uf->pai[vertice] = raiz;
+        vertice = proximo;
+        uf->contadores[1]++;
+    }
+    return raiz;
+}
+
+// Une dois conjuntos (com união por rank); retorna 0 se já estavam unidos
+static int unir(UnionFind* uf, int64_t vertice1, int64_t vertice2) {
+    int64_t raiz1 = encontrar(uf, vertice1);
+    int64_t raiz2 = encontrar(uf, vertice2);
+
+    if (raiz1 == raiz2) {
+        return 0;
+    }
+
+    // União por rank: anexa a árvore menor à maior
+    if (uf->rank[raiz1] < uf->rank[raiz2]) {
+        uf->pai[raiz1] = raiz2;
+    } else if (uf->rank[raiz1] > uf->rank[raiz2]) {
+        uf->pai[raiz2] = raiz1;
+    } else {
+        uf->pai[raiz2] = raiz1;
+        uf->rank[raiz1]++;
+    }
+
+    uf->numeroConjuntos--;
+    uf->contadores[2]++;
+    return 1;
+}
+
+// =============================================================================
+// KRUSKAL
+// =============================================================================
+
+/*
+ * Kruskal sobre arestas já ordenadas por peso (ordem estável de
+ * grafos.edge_sort, feita pelo NumPy). Marca em aceita[i] as arestas da
+ * árvore e retorna quantas foram aceitas, ou -1 se faltar memória.
+ * contadores recebe find_calls, find_hops e unions.
+ */
+int64_t kruskal(int64_t numeroVertices, int64_t numeroArestas,
+                const int64_t* origem, const int64_t* destino,
+                uint8_t* aceita, int64_t* contadores) {
+    UnionFind uf;
+    uf.pai = (int64_t*)malloc((numeroVertices > 0 ? numeroVertices : 1) * sizeof(int64_t));
+    uf.rank = (uint8_t*)calloc(numeroVertices > 0 ? numeroVertices : 1, sizeof(uint8_t));
+    uf.numeroConjuntos = numeroVertices;
+    uf.contadores = contadores;
+    if (uf.pai == NULL || uf.rank == NULL) {
+        free(uf.pai);
+        free(uf.rank);
+        return -1;
+    }
+
+    // Cada vértice começa como seu próprio pai (conjunto individual)
+    for (int64_t i = 0; i < numeroVertices; i++) {
+        uf.pai[i] = i;
+    }
+
+    int64_t aceitas = 0;
+    for (int64_t i = 0; i < numeroArestas; i++) {
+        aceita[i] = 0;
+        if (uf.numeroConjuntos > 1 && unir(&uf, origem[i], destino[i])) {
+            aceita[i] = 1;
+            aceitas++;
+        }
+    }
+
+    free(uf.pai);
+    free(uf.rank);
+    return aceitas;
+}
+
+// =============================================================================
+// HEAP MÍNIMA INDEXADA (Alg_Prim.c)
+// =============================================================================
+
+typedef struct {
+    int64_t* vertices;  // Vértices, em ordem de heap
+    int64_t* posicao;   // Posição de cada vértice na heap (-1 se fora)
+    double* chave;      // Chave atual de cada vértice
+    int64_t tamanho;
+} HeapMinima;
+
+static void heapificarParaCima(HeapMinima* heap, int64_t indice) {
+    int64_t vertice = heap->vertices[indice];
+    double chave = heap->chave[vertice];
+    while (indice > 0) {
+        int64_t pai = (indice - 1) / 2;
+        int64_t verticePai = heap->vertices[pai];
+        if (heap->chave[verticePai] <= chave) {
+            break;
+        }
+        heap->vertices[indice] = verticePai;
+        heap->posicao[verticePai] = indice;
+        indice = pai;
+    }
+    heap->vertices[indice] = vertice;
+    heap->posicao[vertice] = indice;
+}
+
+static void heapificarParaBaixo(HeapMinima* heap, int64_t indice) {
+    int64_t vertice = heap->vertices[indice];
+    double chave = heap->chave[vertice];
+    for (;;) {
+        int64_t menor = 2 * indice + 1;
+        if (menor >= heap->tamanho) {
+            break;
+        }
+        int64_t direita = menor + 1;
+        if (direita < heap->tamanho &&
+            heap->chave[heap->vertices[direita]] < heap->chave[heap->vertices[menor]]) {
+            menor = direita;
+        }
+        if (heap->chave[heap->vertices[menor]] >= chave) {
+            break;
+        }
+        heap->vertices[indice] = heap->vertices[menor];
+        heap->posicao[heap->vertices[indice]] = indice;
+        indice = menor;
+    }
+    heap->vertices[indice] = vertice;
+    heap->posicao[vertice] = indice;
+}
+
+static void inserir(HeapMinima* heap, int64_t vertice, double chave) {
+    heap->chave[vertice] = chave;
+    heap->vertices[heap->tamanho] = vertice;
+    heap->tamanho++;
+    heapificarParaCima(heap, heap->tamanho - 1);
+}
+
+static int64_t extrairMinimo(HeapMinima* heap) {
+    int64_t verticeMinimo = heap->vertices[0];
+    heap->posicao[verticeMinimo] = -1;
+    heap->tamanho--;
+    if (heap->tamanho > 0) {
+        heap->vertices[0] = heap->vertices[heap->tamanho];
+        heapificarParaBaixo(heap, 0);
+    }
+    return verticeMinimo;
+}
+
+static void diminuirChave(HeapMinima* heap, int64_t vertice, double novaChave) {
+    heap->chave[vertice] = novaChave;
+    heapificarParaCima(heap, heap->posicao[vertice]);
+}
+
+// =============================================================================
+// PRIM
+// =============================================================================
+
+/*
+ * Prim com heap indexada sobre o CSR (indptr, indices, pesos). Cobre o
+ * componente de verticeInicial: ordem recebe os vértices na ordem em que
+ * entram na árvore, predecessor[v] o pai de v e arco[v] a posição em indices
+ * da aresta pai -> v. Retorna o número de vértices da árvore (0 se
+ * verticeInicial não é um vértice), ou -1 se faltar memória. contadores
+ * recebe heap_pushes, heap_pops e heap_decrease_keys.
+ */
+int64_t primComHeap(int64_t numeroVertices, const int64_t* indptr, const int64_t* indices,
+                    const double* pesos, int64_t verticeInicial,
+                    int64_t* ordem, int64_t* predecessor, int64_t* arco,
+                    int64_t* contadores) {
+    int64_t n = numeroVertices;
+    if (verticeInicial < 0 || verticeInicial >= n) {
+        return 0;  // Conferido também em native.py, que levanta IndexError
+    }
+    HeapMinima heap;
+    heap.vertices = (int64_t*)malloc(n * sizeof(int64_t));
+    heap.posicao = (int64_t*)malloc(n * sizeof(int64_t));
+    heap.chave = (double*)malloc(n * sizeof(double));
+    uint8_t* naArvore = (uint8_t*)calloc(n, sizeof(uint8_t));
+    heap.tamanho = 0;
+    if (!heap.vertices || !heap.posicao || !heap.chave || !naArvore) {
+        free(heap.vertices);
+        free(heap.posicao);
+        free(heap.chave);
+        free(naArvore);
+        return -1;
+    }
+
+    for (int64_t v = 0; v < n; v++) {
+        heap.posicao[v] = -1;
+        predecessor[v] = -1;
+        arco[v] = -1;
+    }
+
+    inserir(&heap, verticeInicial, 0.0);
+    contadores[0]++;
+    int64_t tamanhoArvore = 0;
+
+    while (heap.tamanho > 0) {
+        // Extrair vértice com menor chave
+        int64_t u = extrairMinimo(&heap);
+        contadores[1]++;
+        naArvore[u] = 1;
+        ordem[tamanhoArvore++] = u;
+
+        // Atualizar chaves dos vizinhos fora da árvore
+        for (int64_t a = indptr[u]; a < indptr[u + 1]; a++) {
+            int64_t v = indices[a];
+            double peso = pesos[a];
+            if (naArvore[v]) {
+                continue;
+            }
+            if (heap.posicao[v] < 0) {
+                predecessor[v] = u;
+                arco[v] = a;
+                inserir(&heap, v, peso);
+                contadores[0]++;
+            } else if (peso < heap.chave[v]) {
+                predecessor[v] = u;
+                arco[v] = a;
+                diminuirChave(&heap, v, peso);
+                contadores[2]++;
+            }
+        }
+    }
+
+    free(heap.vertices);
+    free(heap.posicao);
+    free(heap.chave);
+    free(naArvore);
+    return tamanhoArvore;
+}
+
+/*
+ * Prim sem heap: a cada iteração procura o vértice de menor chave varrendo
+ * todos os vértices, O(V² + E). Mais rápido que a heap em grafos densos.
+ * Mesmos parâmetros e retorno de primComHeap (contadores não é usado).
+ */
+int64_t primSimples(int64_t numeroVertices, const int64_t* indptr, const int64_t* indices,
+                    const double* pesos, int64_t verticeInicial,
+                    int64_t* ordem, int64_t* predecessor, int64_t* arco,
+                    int64_t* contadores) {
+    int64_t n = numeroVertices;
+    if (verticeInicial < 0 || verticeInicial >= n) {
+        return 0;
+    }
+    double* chave = (double*)malloc(n * sizeof(double));
+    uint8_t* alcancado = (uint8_t*)calloc(n, sizeof(uint8_t));
+    uint8_t* processado = (uint8_t*)calloc(n, sizeof(uint8_t));
+    if (!chave || !alcancado || !processado) {
+        free(chave);
+        free(alcancado);
+        free(processado);
+        return -1;
+    }
+    (void)contadores;
+
+    for (int64_t v = 0; v < n; v++) {
+        predecessor[v] = -1;
+        arco[v] = -1;
+    }
+    chave[verticeInicial] = 0.0;
+    alcancado[verticeInicial] = 1;
+
+    int64_t tamanhoArvore = 0;
+    for (int64_t iteracao = 0; iteracao < n; iteracao++) {
+        // Encontrar vértice alcançado de menor chave não processado
+        int64_t u = -1;
+        for (int64_t v = 0; v < n; v++) {
+            if (alcancado[v] && !processado[v] && (u < 0 || chave[v] < chave[u])) {
+                u = v;
+            }
+        }
+        if (u < 0) {
+            break;  // Restante do grafo não é alcançável
+        }
+
+        processado[u] = 1;
+        ordem[tamanhoArvore++] = u;
+
+        for (int64_t a = indptr[u]; a < indptr[u + 1]; a++) {
+            int64_t v = indices[a];
+            if (!processado[v] && (!alcancado[v] || pesos[a] < chave[v])) {
+                alcancado[v] = 1;
+                chave[v] = pesos[a];
+                predecessor[v] = u;
+                arco[v] = a;
+            }
+        }
+    }
+
+    free(chave);
+    free(alcancado);
+    free(processado);
+    return tamanhoArvore;
+}
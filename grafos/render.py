@@ -0,0 +1,532 @@
+"""
+Desenho de grafos com artistas persistentes (sem limpar e redesenhar a cada passo).
+
+As visualizações antigas chamavam ``ax.clear()``/``plt.clf()`` e recriavam, a
+cada passo, um ``nx.Graph`` e todos os artistas do matplotlib (um por vértice,
+aresta e rótulo): custo O(V + E) em criação de objetos por quadro.
+
+``GraphRenderer`` cria uma única vez:
+
+* uma ``PathCollection`` (``ax.scatter``) com todos os vértices;
+* duas ``LineCollection``: a base, com todas as arestas no estilo padrão, e a
+  de destaque, só com as arestas cujo estilo mudou (árvore, candidatas...);
+* os rótulos dos vértices, como contornos de glifos numa única
+  ``PathCollection`` (``GlyphLabelLayer``), e os pesos das arestas, se
+  pedidos, como ``Text``; os dois em camadas com nível de detalhe.
+
+Cada passo só altera cores, tamanhos, larguras e estilos nos arrays dessas
+coleções e o texto dos rótulos que mudaram. Quando o backend permite
+(``canvas.supports_blit``), o quadro é atualizado por blitting: o fundo
+estático (eixos, legenda e as arestas base, que nunca mudam) é copiado uma
+vez e só os artistas dinâmicos são redesenhados por cima. O destaque fica
+sobre a base, como nas versões antigas (arestas tracejadas deixam ver a cinza
+por baixo), e o custo de cada quadro é proporcional às arestas destacadas, não
+a todas as arestas.
+
+Grafos grandes (nível de detalhe):
+
+* texto é o artista mais caro de desenhar (cerca de 1 ms por ``Text`` no Agg,
+  que refaz o layout e a rasterização no FreeType a cada desenho). Por isso o
+  contorno de cada texto de vértice é calculado uma única vez (``TextPath``)
+  e todos os rótulos visíveis saem numa só chamada: com blitting eles são
+  redesenhados a cada quadro (ficam acima dos vértices, que mudam), e isso
+  custa cerca de 1 ms no total, não por rótulo. Só os rótulos dentro da vista
+  atual são desenhados; se forem mais de
+  ``MAX_LABELS``, aparece no máximo um por célula de uma grade
+  ``LABEL_GRID`` x ``LABEL_GRID``. Ao dar zoom, os rótulos da região aparecem;
+* acima de ``MAX_EDGES`` arestas, a coleção base mostra só uma amostra fixa
+  delas. As destacadas (árvore, AGM, candidatas) são sempre desenhadas;
+* o tamanho dos vértices diminui com o número de vértices, para que o grafo
+  não vire uma mancha;
+* as arestas destacadas com o mesmo estilo são desenhadas como uma única
+  linha interrompida por NaN (um ``Path`` por estilo, não um por aresta): a
+  árvore de um grafo com 100 mil vértices vira poucos caminhos.
+"""
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.colors import to_rgba
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+# Com até MAX_LABELS rótulos na vista, todos aparecem (ver docstring)
+MAX_LABELS = 200
+
+# Em vistas mais densas, no máximo um rótulo por célula desta grade
+LABEL_GRID = 8
+
+# Acima disso as arestas base (fora dos destaques) são amostradas
+MAX_EDGES = 20000
+
+# Tamanho mínimo dos vértices (pontos²) quando o grafo é grande
+MIN_NODE_SIZE = 4.0
+
+# Segmentos por caminho nas arestas destacadas (ver GraphRenderer._push)
+SEGMENTS_PER_PATH = 5000
+
+# Distância entre linhas dos rótulos de vértices, em múltiplos do tamanho da fonte
+LINE_SPACING = 1.2
+
+
+class LabelLayer:
+    """Rótulos de um conjunto de pontos, criados e mostrados conforme a vista
+
+    ``create(i, texto)`` cria o ``Text`` do ponto ``i``; ele só é chamado
+    quando o rótulo aparece pela primeira vez. Com ``budget=None`` todos os
+    rótulos aparecem sempre.
+    """
+
+    def __init__(self, ax, xy, texts, create, budget=MAX_LABELS, animated=False):
+        self.ax = ax
+        self.xy = xy
+        self.texts = list(texts)
+        self.create = create
+        self.budget = budget
+        self.animated = animated
+        self.artists = {}  # Índice -> Text (só os que já apareceram)
+        self.shown = []    # Índices visíveis
+        self.update_view()
+
+    def select(self):
+        """Índices dos rótulos a mostrar na vista atual"""
+        if self.budget is None or not len(self.xy):
+            return np.arange(len(self.xy))
+        (x0, y0), (x1, y1) = np.sort(self.ax.viewLim.get_points(), axis=0)
+        x, y = self.xy[:, 0], self.xy[:, 1]
+        inside = np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+        if len(inside) <= self.budget:
+            return inside
+
+        # Vista densa: o primeiro ponto (em ordem) de cada célula da grade
+        size = np.maximum([(x1 - x0) / LABEL_GRID, (y1 - y0) / LABEL_GRID], 1e-12)
+        cell = np.floor((self.xy[inside] - [x0, y0]) / size).astype(np.int64)
+        cell = np.clip(cell, 0, LABEL_GRID - 1)
+        _, first = np.unique(cell[:, 0] * LABEL_GRID + cell[:, 1], return_index=True)
+        return inside[np.sort(first)]
+
+    def update_view(self, *args):
+        """Refaz a seleção (chamado quando os limites dos eixos mudam)"""
+        shown = self.select().tolist()
+        keep = set(shown)
+        for i in self.shown:
+            if i not in keep:
+                self.artists[i].set_visible(False)
+        for i in shown:
+            artist = self.artists.get(i)
+            if artist is None:
+                artist = self.artists[i] = self.create(i, self.texts[i])
+                artist.set_animated(self.animated)
+            else:
+                artist.set_visible(True)
+                if artist.get_text() != self.texts[i]:
+                    artist.set_text(self.texts[i])
+        self.shown = shown
+
+    def refresh(self):
+        """Copia ``texts`` para os rótulos visíveis (só os que mudaram)"""
+        for i in self.shown:
+            artist = self.artists[i]
+            if artist.get_text() != self.texts[i]:
+                artist.set_text(self.texts[i])
+
+    def visible_artists(self):
+        return [self.artists[i] for i in self.shown]
+
+    def set_animated(self, animated):
+        self.animated = animated
+        for artist in self.artists.values():
+            artist.set_animated(animated)
+
+
+class GlyphLabelLayer(LabelLayer):
+    """Rótulos de vértices desenhados como contornos de glifos numa ``PathCollection``
+
+    Substitui um ``Text`` por rótulo: o contorno de cada texto distinto é
+    calculado uma vez e guardado, e trocar rótulos só troca a lista de
+    contornos e posições da coleção. Rótulos vazios não entram nela.
+    """
+
+    def __init__(self, ax, xy, texts, font_size, budget=MAX_LABELS, animated=False):
+        self.prop = FontProperties(size=font_size, weight='bold')
+        self.paths = {}  # Texto -> contorno centrado em (0, 0), em pontos
+        # Pontos -> pixels; acompanha o dpi (inclusive o de savefig)
+        points = Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans
+        self.collection = PathCollection([], offsets=np.empty((0, 2)),
+                                         offset_transform=ax.transData, transform=points,
+                                         facecolors=[rcParams['text.color']],
+                                         edgecolors='none', zorder=3)
+        ax.add_collection(self.collection, autolim=False)
+        self.collection.set_clip_on(False)  # Como os Text, não são cortados pelos eixos
+        super().__init__(ax, xy, texts, create=None, budget=budget, animated=animated)
+
+    def path_of(self, text):
+        """Contorno de ``text`` (várias linhas centralizadas), calculado uma vez por texto"""
+        path = self.paths.get(text)
+        if path is None:
+            step = LINE_SPACING * self.prop.get_size_in_points()
+            lines = []
+            for row, line in enumerate(text.split('\n')):
+                glyphs = TextPath((0, 0), line, prop=self.prop)
+                if len(glyphs.vertices):
+                    box = glyphs.get_extents()
+                    shift = Affine2D().translate(-(box.x0 + box.x1) / 2, -row * step)
+                    lines.append(glyphs.transformed(shift))
+            path = Path.make_compound_path(*lines) if lines else Path(np.empty((0, 2)))
+            if lines:
+                box = path.get_extents()
+                path = path.transformed(Affine2D().translate(0, -(box.y0 + box.y1) / 2))
+            self.paths[text] = path
+        return path
+
+    def update_view(self, *args):
+        self.shown = self.select().tolist()
+        self.refresh()
+
+    def refresh(self):
+        shown = [i for i in self.shown if self.texts[i]]
+        self.collection.set_paths([self.path_of(self.texts[i]) for i in shown])
+        self.collection.set_offsets(self.xy[shown].reshape(-1, 2))
+
+    def visible_artists(self):
+        return [self.collection]
+
+    def set_animated(self, animated):
+        self.animated = animated
+        self.collection.set_animated(animated)
+
+
+class GraphRenderer:
+    def __init__(self, ax, pos, vertices, edges, node_color='lightgray', node_size=1200,
+                 node_alpha=0.9, edge_color='lightgray', edge_width=1.0, edge_alpha=0.5,
+                 font_size=14, edge_labels=None, edge_font_size=10, edge_label_style=None,
+                 show_labels=None, label_text=None, margins=None, max_edges=MAX_EDGES,
+                 blit=True):
+        """``show_labels``: None (nível de detalhe), True (todos) ou False (nenhum);
+        ``edge_label_style`` sobrescreve os kwargs de ``ax.text`` dos pesos;
+        ``max_edges=None`` desliga a amostragem das arestas base"""
+        self.ax = ax
+        self.fig = ax.figure
+        self.canvas = self.fig.canvas
+        self.blit = blit
+        self._colors = {}  # Cache (cor, alpha) -> RGBA
+
+        # Índices vértice -> posição nas coleções
+        self.vertices = list(vertices)
+        self.vertex_index = {vertex: i for i, vertex in enumerate(self.vertices)}
+        self.edges = [(u, v) for u, v in edges]
+        self.edge_index = {}
+        for i, (u, v) in enumerate(self.edges):
+            self.edge_index.setdefault((u, v), i)
+            self.edge_index.setdefault((v, u), i)
+
+        # Estilo base dos vértices (restaurado por reset) e estilo atual
+        n = len(self.vertices)
+        self.base_node_colors = np.tile(self._rgba(node_color, node_alpha), (n, 1))
+        self.base_node_sizes = np.full(n, node_size, dtype=float)
+        self.node_colors = self.base_node_colors.copy()
+        self.node_sizes = self.base_node_sizes.copy()
+        # Grafos grandes: vértices menores na mesma proporção para todos os estilos
+        self.size_scale = min(1.0, MAX_LABELS / n) if n else 1.0
+
+        # Arestas destacadas: índice -> (cor RGBA, largura, estilo)
+        self.edge_overlay = {}
+        self._dirty = True  # Estilo mudou desde o último _push
+
+        # Artistas (criados uma única vez)
+        xy = np.array([pos[vertex] for vertex in self.vertices], dtype=float).reshape(-1, 2)
+        self.xy = xy
+        src = np.array([self.vertex_index[u] for u, _ in self.edges], dtype=np.int64)
+        dst = np.array([self.vertex_index[v] for _, v in self.edges], dtype=np.int64)
+        self.segments = np.stack([xy[src], xy[dst]], axis=1).reshape(-1, 2, 2)
+        # Arestas base desenhadas: todas ou uma amostra fixa (semente 0)
+        self.base_edge_ids = np.arange(len(self.edges))
+        if max_edges is not None and len(self.edges) > max_edges:
+            rng = np.random.default_rng(0)
+            self.base_edge_ids = np.sort(rng.choice(len(self.edges), max_edges, replace=False))
+        self.base_edge_collection = LineCollection(
+            self.segments[self.base_edge_ids], colors=[self._rgba(edge_color, edge_alpha)],
+            linewidths=edge_width, zorder=1)
+        ax.add_collection(self.base_edge_collection)
+        self.edge_collection = LineCollection([], zorder=1.5)
+        ax.add_collection(self.edge_collection)
+        # Vértices: uma coleção por estilo (cor e tamanho únicos desenham bem mais rápido)
+        self.node_collections = []
+
+        ax.update_datalim(xy)
+        if margins is not None:
+            ax.margins(*margins)  # Folga (x, y) em volta dos vértices
+        ax.autoscale_view()
+        ax.axis('off')
+
+        # Texto base de cada rótulo (restaurado por apply); padrão str(vértice)
+        label_text = label_text or {}
+        self.base_labels = [label_text.get(vertex, str(vertex)) for vertex in self.vertices]
+        budget = None if show_labels else MAX_LABELS
+        self.label_layer = None
+        if show_labels is not False:
+            self.label_layer = GlyphLabelLayer(ax, xy, self.base_labels, font_size,
+                                               budget=budget, animated=self._use_blit())
+
+        # Pesos no meio de cada aresta, alinhados a ela, como em nx.draw_networkx_edge_labels
+        self.edge_label_layer = None
+        if edge_labels is not None:
+            ends = [(xy[self.vertex_index[u]], xy[self.vertex_index[v]]) for u, v in edge_labels]
+            middles = np.array([(a + b) / 2 for a, b in ends], dtype=float).reshape(-1, 2)
+            style = dict(fontsize=edge_font_size, zorder=4,
+                         bbox=dict(boxstyle='round', ec=(1, 1, 1), fc=(1, 1, 1)))
+            style.update(edge_label_style or {})
+
+            def create_edge_label(i, text):
+                (x1, y1), (x2, y2) = ends[i]
+                angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
+                if angle > 90:
+                    angle -= 180
+                elif angle < -90:
+                    angle += 180
+                return ax.text(*middles[i], text, ha='center', va='center', rotation=angle,
+                               rotation_mode='anchor', transform_rotates_text=True, **style)
+
+            self.edge_label_layer = LabelLayer(
+                ax, middles, [str(text) for text in edge_labels.values()], create_edge_label,
+                budget=budget, animated=self._use_blit())
+        self._layers = [layer for layer in (self.label_layer, self.edge_label_layer)
+                        if layer is not None]
+        self._limit_callbacks = [ax.callbacks.connect(event, self._on_limits)
+                                 for event in ('xlim_changed', 'ylim_changed')]
+
+        # Artistas redesenhados a cada quadro; o resto fica no fundo copiado
+        self.title = ax.title
+        self._animated = [self.edge_collection, self.title]
+        for artist in self._animated:
+            artist.set_animated(self._use_blit())
+        self._attached = []  # Renderizadores da mesma figura desenhados por este
+        self._background = None
+        self._draw_callback = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _rgba(self, color, alpha=None):
+        key = (color if isinstance(color, str) else tuple(color), alpha)
+        if key not in self._colors:
+            self._colors[key] = to_rgba(color, alpha)
+        return self._colors[key]
+
+    def _use_blit(self):
+        return self.blit and self.canvas.supports_blit
+
+    def _scaled_sizes(self):
+        if self.size_scale == 1.0:
+            return self.node_sizes
+        return np.maximum(self.node_sizes * self.size_scale, MIN_NODE_SIZE)
+
+    def _on_limits(self, ax):
+        """Zoom ou arraste: escolhe de novo os rótulos (o redesenho completo vem em seguida)"""
+        for layer in self._layers:
+            layer.update_view()
+
+    # =========================================================================
+    # Estilo dos elementos
+    # =========================================================================
+
+    def reset(self):
+        """Volta todos os vértices e arestas ao estilo base"""
+        self.node_colors[:] = self.base_node_colors
+        self.node_sizes[:] = self.base_node_sizes
+        self.edge_overlay.clear()
+        self._dirty = True
+
+    def style_nodes(self, vertices, color=None, size=None, alpha=0.9):
+        self._dirty = True
+        for vertex in vertices:
+            i = self.vertex_index[vertex]
+            if color is not None:
+                self.node_colors[i] = self._rgba(color, alpha)
+            if size is not None:
+                self.node_sizes[i] = size
+
+    def style_edges(self, edges, color, width, style='solid', alpha=None):
+        """Destaca as arestas ``(u, v)`` dadas (em qualquer sentido)"""
+        rgba = self._rgba(color, alpha)
+        self._dirty = True
+        for u, v in edges:
+            self.edge_overlay[self.edge_index[(u, v)]] = (rgba, width, style)
+
+    def set_labels(self, labels, reset=False):
+        """Atualiza o texto dos rótulos ``{vértice: texto}`` (só os visíveis são redesenhados)
+
+        Com ``reset=True`` os vértices fora de ``labels`` voltam ao texto base.
+        """
+        layer = self.label_layer
+        if layer is None:
+            return
+        if reset:
+            layer.texts = list(self.base_labels)
+        for vertex, text in labels.items():
+            layer.texts[self.vertex_index[vertex]] = text
+        layer.refresh()
+
+    def set_title(self, text, **kwargs):
+        self.ax.set_title(text, **kwargs)
+
+    def apply(self, frame):
+        """Aplica um quadro descrito como dados (ver ``grafos.export``)
+
+        ``frame`` tem as chaves opcionais ``nodes`` (lista de
+        ``(vértices, cor, tamanho)``), ``edges`` (lista de
+        ``(arestas, cor, largura, estilo, alpha)``), ``labels`` e ``title``
+        (``(texto, kwargs)``), aplicadas nessa ordem a partir do estilo base.
+        Rótulos fora de ``labels`` voltam ao texto base, então o resultado não
+        depende do quadro anterior (voltar um passo funciona). Os artistas
+        ficam atualizados (prontos para ``savefig``), sem desenhar.
+        """
+        self.reset()
+        for vertices, color, size in frame.get('nodes', ()):
+            self.style_nodes(vertices, color, size)
+        for edges, color, width, style, alpha in frame.get('edges', ()):
+            self.style_edges(edges, color, width, style, alpha)
+        self.set_labels(frame.get('labels', {}), reset=True)
+        if 'title' in frame:
+            text, kwargs = frame['title']
+            self.set_title(text, **kwargs)
+        self._push()
+
+    def track(self, artist):
+        """Registra um artista extra (ex.: texto de informações) redesenhado a cada quadro"""
+        artist.set_animated(self._use_blit())
+        self._animated.append(artist)
+        return artist
+
+    def attach(self, other):
+        """Passa a desenhar também os artistas dinâmicos de outro renderizador da figura
+
+        Com blitting, cada ``draw`` restaura o fundo da figura inteira; com dois
+        renderizadores independentes, o segundo apagaria o que o primeiro
+        desenhou. Depois de ``attach`` basta chamar ``draw`` neste.
+        """
+        if other._draw_callback is not None:
+            self.canvas.mpl_disconnect(other._draw_callback)
+            other._draw_callback = None
+        for artist in other._animated:
+            self.track(artist)
+        for layer in other._layers:
+            layer.set_animated(self._use_blit())
+            self._layers.append(layer)
+        self._attached.append(other)  # As coleções de vértices dele ainda podem crescer
+
+    # =========================================================================
+    # Desenho
+    # =========================================================================
+
+    def _push(self):
+        """Copia os arrays de estilo para as coleções (se algo mudou)"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._push_nodes()
+
+        # Uma linha por estilo (na ordem do primeiro uso), com NaN entre as arestas
+        groups = {}
+        for i, style in self.edge_overlay.items():
+            groups.setdefault(style, []).append(i)
+        lines, colors, widths, styles = [], [], [], []
+        for (rgba, width, style), ids in groups.items():
+            for begin in range(0, len(ids), SEGMENTS_PER_PATH):
+                chunk = self.segments[ids[begin:begin + SEGMENTS_PER_PATH]]
+                gaps = np.full((len(chunk), 1, 2), np.nan)
+                lines.append(np.concatenate([chunk, gaps], axis=1).reshape(-1, 2)[:-1])
+                colors.append(rgba)
+                widths.append(width)
+                styles.append(style)
+        self.edge_collection.set_segments(lines)
+        if lines:
+            self.edge_collection.set_colors(colors)
+            self.edge_collection.set_linewidths(widths)
+            self.edge_collection.set_linestyles(styles)
+
+    def _push_nodes(self):
+        """Agrupa os vértices por (cor, tamanho) e preenche uma coleção por grupo
+
+        Um scatter com cor e tamanho por ponto desenha cada marcador
+        separadamente; com um estilo só por coleção o Agg carimba o mesmo
+        marcador em todas as posições. O grupo maior (o estilo base) vem
+        primeiro, então os vértices destacados ficam por cima.
+        """
+        styles = np.column_stack([self.node_colors, self._scaled_sizes()])
+        groups, inverse, counts = np.unique(styles, axis=0, return_inverse=True,
+                                            return_counts=True)
+        inverse = inverse.ravel()
+        members = np.argsort(inverse, kind='stable')
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        ranking = np.argsort(-counts, kind='stable')
+        while len(self.node_collections) < len(groups):
+            collection = self.ax.scatter([], [], zorder=2)
+            collection.set_animated(self._use_blit())
+            self.node_collections.append(collection)
+        for k, collection in enumerate(self.node_collections):
+            if k >= len(groups):
+                collection.set_offsets(np.empty((0, 2)))
+                continue
+            group = ranking[k]
+            collection.set_offsets(self.xy[members[bounds[group]:bounds[group + 1]]])
+            collection.set_facecolor([groups[group, :4]])
+            collection.set_sizes([groups[group, 4]])
+            collection.set_zorder(2 + k * 1e-3)
+
+    def _node_artists(self):
+        artists = list(self.node_collections)
+        for other in self._attached:
+            artists += other._node_artists()
+        return artists
+
+    def _on_draw(self, event):
+        """Desenho completo do canvas: guarda o novo fundo e repõe os artistas dinâmicos"""
+        if not self._use_blit():
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        artists = self._animated + self._node_artists() + [
+            artist for layer in self._layers for artist in layer.visible_artists()]
+        for artist in sorted(artists, key=lambda a: a.get_zorder()):
+            self.fig.draw_artist(artist)
+
+    def draw(self):
+        """Mostra o estado atual; com blitting só os artistas dinâmicos são redesenhados"""
+        self._push()
+        if not self._use_blit():
+            self.canvas.draw_idle()
+            return
+        if self._background is None:
+            self.canvas.draw()  # Dispara _on_draw, que guarda o fundo
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_animated()
+            self.canvas.blit(self.fig.bbox)
+            # O quadro já está na tela; evita que plt.pause refaça o desenho completo
+            self.fig.stale = False
+        self.canvas.flush_events()
+
+    def redraw(self):
+        """Redesenho completo (necessário quando algo fora dos artistas dinâmicos mudou)"""
+        self._push()
+        if self._use_blit():
+            self.canvas.draw()
+            self.canvas.flush_events()
+        else:
+            self.canvas.draw_idle()
+
+    def close(self):
+        """Desliga o renderizador do canvas (antes de limpar os eixos)"""
+        if self._draw_callback is not None:
+            self.canvas.mpl_disconnect(self._draw_callback)
+            self._draw_callback = None
+        for callback in self._limit_callbacks:
+            self.ax.callbacks.disconnect(callback)
+        self._limit_callbacks = []
+        for artist in self._animated + self._node_artists():
+            artist.set_animated(False)
+        for layer in self._layers:
+            layer.set_animated(False)
+        self._background = None
@@ -0,0 +1,221 @@
+"""
+Componentes fortemente conexas (CFCs) de grafos dirigidos: Tarjan e Kosaraju
+iterativos.
+
+Os dois algoritmos são O(V + E) e não usam recursão: como em ``grafos.dfs``,
+cada vértice da pilha guarda um cursor para o próximo arco a examinar, então
+grafos de dependência com milhões de vértices não esbarram no limite de
+recursão do Python.
+
+* ``tarjan_scc``: uma única DFS, com ``low[v]`` (menor índice alcançável) e a
+  pilha de vértices ainda sem componente;
+* ``kosaraju_scc``: DFS em G (``iterative_dfs``) para a ordem de finalização e
+  DFS em Gᵀ em ordem decrescente de término. A transposta é
+  ``CSRGraph.incoming()``, construída em uma passada vetorizada (``argsort``
+  dos destinos), sem laço Python por aresta.
+
+Nos dois, os ids das componentes seguem a ordem topológica do DAG de
+condensação: todo arco entre componentes vai de um id menor para um maior.
+
+``on_step`` recebe os mesmos passos de ``DFSVisualization.record_steps``
+(``DISCOVER``/``FINISH`` de ``grafos.dfs``) e ``COMPONENT`` quando uma CFC
+fica completa, o que permite animar a execução
+(``DFSVisualization.record_scc_steps``).
+"""
+
+from array import array
+
+import numpy as np
+
+from grafos.csr import CSRGraph
+from grafos.dfs import DISCOVER, FINISH, iterative_dfs
+from grafos.instrument import phase
+
+# on_step(COMPONENT, raiz, vértices): CFC completa (array de ids)
+COMPONENT = 'component'
+# on_step(PASS, número, None): início de uma passada de Kosaraju (1 em G, 2 em Gᵀ)
+PASS = 'pass'
+
+
+class SCCResult:
+    """Componentes fortemente conexas, com vértices identificados por id inteiro"""
+
+    def __init__(self, graph, component, num_components):
+        self.graph = graph
+        self.component = component            # component[v] = id da CFC de v
+        self.num_components = num_components
+        self._condensation = None
+
+    def sizes(self):
+        return np.bincount(self.component, minlength=self.num_components)
+
+    def components(self):
+        """Vértices de cada CFC, na ordem dos ids (lista de arrays)"""
+        order = np.argsort(self.component, kind='stable')
+        return np.split(order, np.cumsum(self.sizes())[:-1])
+
+    def component_labels(self):
+        label_of = self.graph.label_of
+        return [[label_of(v) for v in members.tolist()] for members in self.components()]
+
+    def condensation(self):
+        """DAG de condensação: um vértice por CFC, um arco por par de CFCs ligadas
+
+        O peso de cada arco é o número de arcos do grafo original entre as duas
+        componentes. Calculado uma vez, sem laço Python por aresta.
+        """
+        if self._condensation is None:
+            k = self.num_components
+            src = self.component[self.graph.arc_sources()]
+            dst = self.component[self.graph.indices]
+            between = src != dst
+            keys, counts = np.unique(src[between] * k + dst[between], return_counts=True)
+            self._condensation = CSRGraph.from_arrays(keys // k, keys % k, weights=counts,
+                                                      num_vertices=k, directed=True)
+        return self._condensation
+
+
+def tarjan_scc(graph, stats=None, on_step=None):
+    """CFCs por Tarjan: uma DFS iterativa com ``low`` e pilha de vértices
+
+    ``stats``: ver grafos.instrument. ``on_step``: ver o início do módulo.
+    """
+    n = graph.num_vertices
+    indptr = memoryview(np.ascontiguousarray(graph.indptr))
+    indices = memoryview(np.ascontiguousarray(graph.indices))
+
+    cursor = array('q', graph.indptr[:-1].tolist())
+    index = array('q', [-1]) * n       # Ordem de descoberta
+    low = array('q', [-1]) * n         # Menor índice alcançável ainda na pilha
+    position = array('q', [0]) * n     # Posição de cada vértice em pending
+    component = array('q', [-1]) * n
+    on_pending = bytearray(n)
+    pending = array('q')               # Vértices descobertos ainda sem CFC
+    stack = array('q')                 # Pilha da DFS
+    counter = 0
+    found = 0
+
+    with phase(stats, 'main_loop'):
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            position[root] = len(pending)
+            pending.append(root)
+            on_pending[root] = 1
+            stack.append(root)
+            if on_step is not None:
+                on_step(DISCOVER, root, -1)
+
+            while stack:
+                v = stack[-1]
+                arc = cursor[v]
+                if arc == indptr[v + 1]:
+                    # Todos os arcos examinados: finaliza v e repassa low ao pai
+                    stack.pop()
+                    if stack and low[v] < low[stack[-1]]:
+                        low[stack[-1]] = low[v]
+                    if on_step is not None:
+                        on_step(FINISH, v, None)
+                    if low[v] == index[v]:
+                        # v é a raiz de uma CFC: ela é o topo de pending a partir de v
+                        start = position[v]
+                        members = pending[start:]
+                        del pending[start:]
+                        for u in members:
+                            on_pending[u] = 0
+                            component[u] = found
+                        found += 1
+                        if on_step is not None:
+                            on_step(COMPONENT, v, np.frombuffer(members, dtype=np.int64))
+                    continue
+
+                cursor[v] = arc + 1
+                u = indices[arc]
+                if index[u] < 0:
+                    index[u] = low[u] = counter
+                    counter += 1
+                    position[u] = len(pending)
+                    pending.append(u)
+                    on_pending[u] = 1
+                    stack.append(u)
+                    if on_step is not None:
+                        on_step(DISCOVER, u, v)
+                elif on_pending[u] and index[u] < low[v]:
+                    low[v] = index[u]
+
+        if stats is not None:
+            stats.add('edges_scanned', graph.num_arcs)
+            stats.add('enqueues', n)
+            stats.add('components', found)
+
+    # Tarjan fecha as CFCs em ordem topológica reversa (sumidouros primeiro)
+    component = (found - 1) - np.frombuffer(component, dtype=np.int64)
+    return SCCResult(graph, component, found)
+
+
+def kosaraju_scc(graph, stats=None, on_step=None):
+    """CFCs por Kosaraju: DFS em G, depois DFS em Gᵀ por término decrescente
+
+    ``stats``: ver grafos.instrument. ``on_step``: ver o início do módulo.
+    """
+    n = graph.num_vertices
+
+    # Passada 1: ordem de finalização em G
+    if on_step is not None:
+        on_step(PASS, 1, None)
+    finish_order = iterative_dfs(graph, stats=stats, on_step=on_step).finish_order
+
+    # Passada 2: floresta DFS em Gᵀ; cada árvore é uma CFC
+    with phase(stats, 'transpose'):
+        in_indptr, in_sources, _ = graph.incoming()
+    if on_step is not None:
+        on_step(PASS, 2, None)
+    indptr = memoryview(np.ascontiguousarray(in_indptr))
+    sources = memoryview(np.ascontiguousarray(in_sources))
+
+    cursor = array('q', in_indptr[:-1].tolist())
+    component = array('q', [-1]) * n
+    order = array('q')                 # Vértices na ordem de descoberta em Gᵀ
+    stack = array('q')
+    found = 0
+
+    with phase(stats, 'main_loop'):
+        for root in finish_order[::-1].tolist():
+            if component[root] >= 0:
+                continue
+            start = len(order)
+            component[root] = found
+            order.append(root)
+            stack.append(root)
+            if on_step is not None:
+                on_step(DISCOVER, root, -1)
+
+            while stack:
+                v = stack[-1]
+                arc = cursor[v]
+                if arc == indptr[v + 1]:
+                    stack.pop()
+                    if on_step is not None:
+                        on_step(FINISH, v, None)
+                    continue
+                cursor[v] = arc + 1
+                u = sources[arc]
+                if component[u] < 0:
+                    component[u] = found
+                    order.append(u)
+                    stack.append(u)
+                    if on_step is not None:
+                        on_step(DISCOVER, u, v)
+
+            if on_step is not None:
+                on_step(COMPONENT, root, np.frombuffer(order[start:], dtype=np.int64))
+            found += 1
+
+        if stats is not None:
+            stats.add('edges_scanned', graph.num_arcs)
+            stats.add('enqueues', n)
+            stats.add('components', found)
+
+    return SCCResult(graph, np.frombuffer(component, dtype=np.int64), found)
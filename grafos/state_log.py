@@ -0,0 +1,262 @@
+"""
+Log de estados da animação por deltas, com keyframes espaçados por tamanho.
+
+Em vez de guardar cópias completas de ``visited``, ``mst_edges`` e da lista de
+candidatas em cada estado (memória O(passos × V)), cada quadro guarda apenas
+o que mudou: vértice adicionado, aresta adicionada, candidata inserida ou
+removida. De tempos em tempos é guardada uma cópia completa (keyframe).
+
+Os keyframes são espaçados pelo número de deltas, não de quadros: um keyframe
+só é gravado depois de pelo menos ``max(keyframe_deltas, tamanho do estado)``
+deltas desde o anterior. Cada cópia é então paga pelos deltas que a precedem
+e a memória total é O(deltas), e não O(passos × V).
+
+Para ler o quadro ``i`` parte-se do estado atual de reprodução (se ``i`` está
+logo à frente) ou do keyframe anterior a ``i`` (achado por busca binária),
+aplicando os deltas até ``i``. Avançar ou voltar um quadro, como fazem
+``animate_algorithm`` e ``interactive_visualization``, custa só os deltas
+envolvidos (ou uma cópia do keyframe ao voltar).
+
+``StateLog`` se comporta como a antiga lista ``animation_states`` do Prim:
+aceita ``len()`` e ``log[i]``, que devolve um dicionário com as mesmas chaves.
+
+``FrameLog`` faz o mesmo para o BFS, o DFS e o Kruskal, com coleções
+nomeadas (fila, pilha, visitados, arestas da árvore...) em vez das três
+fixas do Prim, e monta o quadro só na leitura.
+"""
+
+from bisect import bisect_right
+
+ADD_VERTEX = 0
+ADD_EDGE = 1
+SET_CANDIDATE = 2
+REMOVE_CANDIDATE = 3
+SET_ITEM = 4
+REMOVE_ITEM = 5
+CLEAR_ITEMS = 6
+
+
+class StateLog:
+    def __init__(self, keyframe_deltas=64):
+        if keyframe_deltas < 1:
+            raise ValueError("keyframe_deltas deve ser pelo menos 1")
+        self.keyframe_deltas = keyframe_deltas
+        self.frames = []            # (metadados, deltas) de cada quadro
+        self.keyframe_indices = []  # Quadros com keyframe, em ordem crescente
+        self.keyframes = []         # (visited, mst_edges, candidates) em cada um deles
+
+        # Estado de gravação (atualizado a cada delta)
+        self._visited = set()
+        self._mst_edges = []
+        self._candidates = {}
+        self._pending = []
+        self._since_keyframe = 0
+
+        # Estado de reprodução (quadro materializado por último)
+        self._cursor = -1
+        self._play_visited = set()
+        self._play_mst_edges = []
+        self._play_candidates = {}
+
+    # =========================================================================
+    # Gravação
+    # =========================================================================
+
+    def add_vertex(self, vertex):
+        self._visited.add(vertex)
+        self._pending.append((ADD_VERTEX, vertex))
+
+    def add_edge(self, edge):
+        self._mst_edges.append(edge)
+        self._pending.append((ADD_EDGE, edge))
+
+    def set_candidate(self, key, candidate):
+        """Insere ou substitui a candidata identificada por ``key``"""
+        self._candidates[key] = candidate
+        self._pending.append((SET_CANDIDATE, (key, candidate)))
+
+    def remove_candidate(self, key):
+        if self._candidates.pop(key, None) is not None:
+            self._pending.append((REMOVE_CANDIDATE, key))
+
+    def commit(self, **metadata):
+        """Fecha o quadro atual com os deltas pendentes e seus metadados (título, etc.)"""
+        index = len(self.frames)
+        self.frames.append((metadata, tuple(self._pending)))
+        self._since_keyframe += len(self._pending)
+        self._pending = []
+        size = len(self._visited) + len(self._mst_edges) + len(self._candidates)
+        if index == 0 or self._since_keyframe >= max(self.keyframe_deltas, size):
+            self.keyframe_indices.append(index)
+            self.keyframes.append((frozenset(self._visited), tuple(self._mst_edges),
+                                   dict(self._candidates)))
+            self._since_keyframe = 0
+
+    def delta_count(self):
+        """Total de deltas gravados (medida do tamanho do log)"""
+        return sum(len(deltas) for _, deltas in self.frames)
+
+    # =========================================================================
+    # Leitura
+    # =========================================================================
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        """Estado do quadro ``index`` no formato dos antigos ``animation_states``
+
+        Os conjuntos devolvidos são o estado interno de reprodução (sem cópia,
+        inclusive ``candidate_edges``, que é uma visão do dicionário de
+        candidatas): valem até a próxima leitura e não devem ser modificados.
+        """
+        if index < 0:
+            index += len(self.frames)
+        if not 0 <= index < len(self.frames):
+            raise IndexError("quadro fora do intervalo")
+        self._seek(index)
+
+        metadata = self.frames[index][0]
+        state = dict(metadata)
+        state['visited'] = self._play_visited
+        state['mst_edges'] = self._play_mst_edges
+        state['candidate_edges'] = self._play_candidates.values()
+        return state
+
+    def _seek(self, index):
+        if index == self._cursor:
+            return
+        start = self._cursor + 1
+        k = bisect_right(self.keyframe_indices, index) - 1
+        keyframe = self.keyframe_indices[k]
+        if not keyframe <= self._cursor < index:
+            # Recomeça do keyframe anterior a ``index``
+            visited, mst_edges, candidates = self.keyframes[k]
+            self._play_visited = set(visited)
+            self._play_mst_edges = list(mst_edges)
+            self._play_candidates = dict(candidates)
+            start = keyframe + 1
+
+        for frame in range(start, index + 1):
+            self._apply(self.frames[frame][1])
+        self._cursor = index
+
+    def _apply(self, deltas):
+        for op, value in deltas:
+            if op == ADD_VERTEX:
+                self._play_visited.add(value)
+            elif op == ADD_EDGE:
+                self._play_mst_edges.append(value)
+            elif op == SET_CANDIDATE:
+                key, candidate = value
+                self._play_candidates[key] = candidate
+            else:
+                self._play_candidates.pop(value, None)
+
+
+class FrameLog:
+    def __init__(self, build, names, keyframe_deltas=64):
+        """``build(estado)`` monta o quadro a cada leitura; ``names`` são as coleções
+
+        O estado passado a ``build`` tem os metadados de ``commit`` e, para
+        cada nome, um dicionário (em ordem de inserção) que vale só até a
+        próxima leitura: o quadro não deve guardar referências a ele.
+        """
+        if keyframe_deltas < 1:
+            raise ValueError("keyframe_deltas deve ser pelo menos 1")
+        self.build = build
+        self.names = tuple(names)
+        self.keyframe_deltas = keyframe_deltas
+        self.frames = []            # (metadados, deltas) de cada quadro
+        self.keyframe_indices = []  # Quadros com keyframe, em ordem crescente
+        self.keyframes = []         # Cópia das coleções em cada um deles
+
+        # Estado de gravação
+        self._items = {name: {} for name in self.names}
+        self._pending = []
+        self._since_keyframe = 0
+
+        # Estado de reprodução
+        self._cursor = -1
+        self._play = None
+
+    # =========================================================================
+    # Gravação
+    # =========================================================================
+
+    def set(self, name, key, value=None):
+        """Insere ou substitui ``key`` em ``name`` (sem valor: conjunto ordenado)"""
+        self._items[name][key] = value
+        self._pending.append((SET_ITEM, name, key, value))
+
+    def remove(self, name, key):
+        items = self._items[name]
+        if key in items:
+            del items[key]
+            self._pending.append((REMOVE_ITEM, name, key, None))
+
+    def clear(self, name):
+        if self._items[name]:
+            self._items[name].clear()
+            self._pending.append((CLEAR_ITEMS, name, None, None))
+
+    def commit(self, **metadata):
+        """Fecha o quadro atual com os deltas pendentes e seus metadados (título, etc.)"""
+        index = len(self.frames)
+        self.frames.append((metadata, tuple(self._pending)))
+        self._since_keyframe += len(self._pending)
+        self._pending = []
+        size = sum(len(items) for items in self._items.values())
+        if index == 0 or self._since_keyframe >= max(self.keyframe_deltas, size):
+            self.keyframe_indices.append(index)
+            self.keyframes.append({name: dict(items) for name, items in self._items.items()})
+            self._since_keyframe = 0
+
+    def delta_count(self):
+        """Total de deltas gravados (medida do tamanho do log)"""
+        return sum(len(deltas) for _, deltas in self.frames)
+
+    # =========================================================================
+    # Leitura
+    # =========================================================================
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        """Quadro ``index`` montado por ``build``; uma fatia devolve uma lista de quadros"""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.frames)))]
+        if index < 0:
+            index += len(self.frames)
+        if not 0 <= index < len(self.frames):
+            raise IndexError("quadro fora do intervalo")
+        self._seek(index)
+
+        state = dict(self.frames[index][0])
+        state.update(self._play)
+        return self.build(state)
+
+    def _seek(self, index):
+        if index == self._cursor:
+            return
+        start = self._cursor + 1
+        k = bisect_right(self.keyframe_indices, index) - 1
+        keyframe = self.keyframe_indices[k]
+        if not keyframe <= self._cursor < index:
+            # Recomeça do keyframe anterior a ``index``
+            self._play = {name: dict(items) for name, items in self.keyframes[k].items()}
+            start = keyframe + 1
+
+        for frame in range(start, index + 1):
+            self._apply(self.frames[frame][1])
+        self._cursor = index
+
+    def _apply(self, deltas):
+        for op, name, key, value in deltas:
+            if op == SET_ITEM:
+                self._play[name][key] = value
+            elif op == REMOVE_ITEM:
+                self._play[name].pop(key, None)
+            else:
+                self._play[name].clear()
@@ -0,0 +1,117 @@
+"""
+Reprodução dos passos de uma animação pelo laço de eventos do matplotlib.
+
+As visualizações chamavam ``time.sleep``/``plt.pause`` dentro do laço do
+algoritmo: o tempo total era dominado pelas pausas e o cálculo ficava preso ao
+desenho. Agora o algoritmo roda até o fim gravando os quadros (ver
+``grafos.export``) e ``Stepper`` os mostra depois, a partir do laço de eventos
+do canvas (a janela continua respondendo entre um quadro e outro):
+
+* ``'auto'``: um timer do próprio canvas avança um quadro a cada ``interval``
+  segundos. ESPAÇO pausa/continua, ``+``/``-`` mudam a velocidade e ESC
+  pula para o fim;
+* ``'keys'``: cada tecla → ou ESPAÇO avança um quadro, ← volta e ESC pula
+  para o fim (avançar depois do último quadro também encerra);
+* ``'benchmark'``: todos os quadros são desenhados em sequência, sem espera.
+
+Em backends não interativos (Agg, por exemplo) não há laço de eventos, então
+qualquer modo se comporta como ``'benchmark'``.
+"""
+
+MODES = ('auto', 'keys', 'benchmark')
+
+# Limites do intervalo ajustado com +/- (segundos)
+MIN_INTERVAL = 0.05
+MAX_INTERVAL = 10.0
+
+
+def is_interactive(fig):
+    """True se o canvas da figura tem laço de eventos (janela de um toolkit)"""
+    return type(fig.canvas).required_interactive_framework is not None
+
+
+class Stepper:
+    def __init__(self, fig, frames, show, mode='auto', interval=2.0):
+        """``show(i)`` desenha o quadro ``i`` de ``frames``"""
+        if mode not in MODES:
+            raise ValueError(f"modo inválido: {mode} (use {', '.join(MODES)})")
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.frames = frames
+        self.show = show
+        self.mode = mode
+        self.interval = interval
+        self.index = -1      # Quadro mostrado por último
+        self.paused = False
+        self.running = False
+        self._timer = None
+        self._callbacks = []
+
+    def run(self):
+        """Mostra os quadros e retorna quando a reprodução termina"""
+        if not self.frames:
+            return 0
+        if self.mode == 'benchmark' or not is_interactive(self.fig):
+            for index in range(len(self.frames)):
+                self.index = index
+                self.show(index)
+            return len(self.frames)
+
+        self.running = True
+        self._callbacks = [self.canvas.mpl_connect('key_press_event', self._on_key),
+                           self.canvas.mpl_connect('close_event', lambda event: self.stop())]
+        if self.mode == 'auto':
+            self._timer = self.canvas.new_timer(interval=self._milliseconds())
+            self._timer.add_callback(self._on_timer)
+            self._timer.start()
+        # Bloqueia aqui, processando eventos, até stop()
+        self.canvas.start_event_loop(timeout=0)
+        return self.index + 1
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        for callback in self._callbacks:
+            self.canvas.mpl_disconnect(callback)
+        self._callbacks = []
+        self.canvas.stop_event_loop()
+
+    def step(self, delta=1):
+        """Avança (ou volta) ``delta`` quadros; passar do último encerra"""
+        index = self.index + delta
+        if index >= len(self.frames):
+            self.stop()
+        elif index >= 0 and index != self.index:
+            self.index = index
+            self.show(index)
+
+    def set_interval(self, interval):
+        self.interval = min(MAX_INTERVAL, max(MIN_INTERVAL, interval))
+        if self._timer is not None:
+            self._timer.interval = self._milliseconds()
+
+    def _milliseconds(self):
+        return max(1, int(self.interval * 1000))
+
+    def _on_timer(self):
+        if not self.paused:
+            self.step()
+
+    def _on_key(self, event):
+        if event.key == 'escape':
+            self.stop()
+        elif self.mode == 'keys':
+            if event.key in ('right', ' '):
+                self.step()
+            elif event.key == 'left':
+                self.step(-1)
+        elif event.key == ' ':
+            self.paused = not self.paused
+        elif event.key == '+':
+            self.set_interval(self.interval / 2)
+        elif event.key == '-':
+            self.set_interval(self.interval * 2)
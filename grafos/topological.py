@@ -0,0 +1,198 @@
+"""
+Ordenação topológica de grafos dirigidos: DFS (tempos de término) e Kahn por
+níveis.
+
+* ``dfs_topological_sort``: o algoritmo do Readme de ``Ordenação Topológica``.
+  A ordem é a de ``finish_time`` decrescente da DFS iterativa
+  (``grafos.dfs.iterative_dfs``), e uma aresta de retorno prova que há ciclo;
+* ``kahn_levels``: Kahn síncrono. Cada nível é o conjunto dos vértices cujas
+  dependências já estão todas nos níveis anteriores, uma anticadeia que pode
+  ser executada em paralelo. Os graus de entrada são um array NumPy
+  (``bincount`` dos destinos), e cada nível é processado inteiro com arrays,
+  sem laço Python por vértice (como a BFS de ``grafos.bfs``). Os níveis são
+  gerados um a um, então o consumidor pode despachar um nível antes de o
+  próximo ser calculado;
+* ``kahn_topological_sort``: consome ``kahn_levels`` e junta tudo em um
+  ``TopologicalResult``.
+
+Se o grafo tem ciclo, o resultado traz em ``cycle`` os vértices de um ciclo
+(testemunha), na ordem dos arcos: ``cycle[0] -> cycle[1] -> ... -> cycle[0]``.
+"""
+
+import numpy as np
+
+from grafos.bfs import expand_ranges
+from grafos.dfs import BACK_EDGE, iterative_dfs
+from grafos.instrument import phase
+
+# Níveis com até tantos vértices são processados sem NumPy: em cadeias longas de
+# dependências, o custo fixo de cada chamada vetorizada dominaria o tempo
+SMALL_LEVEL = 32
+
+
+class CycleError(ValueError):
+    """O grafo não é acíclico; ``cycle`` é a testemunha (ids, na ordem dos arcos)"""
+
+    def __init__(self, graph, cycle):
+        self.graph = graph
+        self.cycle = cycle
+        labels = " → ".join(map(str, [graph.label_of(v) for v in cycle.tolist()]))
+        super().__init__(f"o grafo tem ciclo: {labels} → {graph.label_of(cycle[0])}")
+
+
+class TopologicalResult:
+    """Ordem topológica, com vértices identificados por id inteiro
+
+    ``level`` só existe no Kahn. Com ciclo, ``order`` tem apenas os vértices
+    que nenhum ciclo impede de executar (Kahn) ou é None (DFS).
+    """
+
+    def __init__(self, graph, order, level=None, cycle=None):
+        self.graph = graph
+        self.order = order    # Vértices em ordem topológica
+        self.level = level    # level[v] = nível de v (-1 se preso em um ciclo)
+        self.cycle = cycle    # Testemunha de ciclo, ou None se o grafo é um DAG
+
+    def is_dag(self):
+        return self.cycle is None
+
+    def levels(self):
+        """Vértices de cada nível (lista de arrays); ``order`` já vem agrupado por nível"""
+        if self.level is None:
+            raise ValueError("níveis só são calculados por kahn_topological_sort")
+        if len(self.order) == 0:
+            return []
+        sizes = np.bincount(self.level[self.order])
+        return np.split(self.order, np.cumsum(sizes)[:-1])
+
+    def order_labels(self):
+        return [self.graph.label_of(v) for v in self.order.tolist()]
+
+    def level_labels(self):
+        label_of = self.graph.label_of
+        return [[label_of(v) for v in level.tolist()] for level in self.levels()]
+
+    def cycle_labels(self):
+        if self.cycle is None:
+            return None
+        return [self.graph.label_of(v) for v in self.cycle.tolist()]
+
+
+def require_directed(graph):
+    if not graph.directed:
+        raise ValueError("ordenação topológica exige um grafo dirigido")
+
+
+def dfs_topological_sort(graph, stats=None):
+    """Ordem topológica por ``finish_time`` decrescente (floresta DFS completa)
+
+    ``stats``: ver grafos.instrument.
+    """
+    require_directed(graph)
+    result = iterative_dfs(graph, stats=stats)
+
+    back = np.flatnonzero(result.edge_types == BACK_EDGE)
+    if len(back):
+        # Arco de retorno u -> v: v é ancestral de u, e o caminho da árvore fecha o ciclo
+        arc = int(back[0])
+        u = int(graph.arc_sources()[arc])
+        v = int(graph.indices[arc])
+        path = [u]
+        while path[-1] != v:
+            path.append(int(result.parent[path[-1]]))
+        return TopologicalResult(graph, None, cycle=np.array(path[::-1], dtype=np.int64))
+
+    # finish_order já está em finish_time crescente: basta invertê-la
+    return TopologicalResult(graph, result.finish_order[::-1].copy())
+
+
+def kahn_levels(graph, stats=None):
+    """Gera os níveis de Kahn (arrays de ids, ordenados) até esgotar o grafo
+
+    Se sobrarem vértices com dependências pendentes, o grafo tem ciclo: depois
+    do último nível possível, levanta ``CycleError`` com uma testemunha.
+    ``stats``: ver grafos.instrument.
+    """
+    require_directed(graph)
+    n = graph.num_vertices
+    indptr = graph.indptr
+    indices = graph.indices
+
+    with phase(stats, 'main_loop'):
+        in_degree = np.bincount(indices, minlength=n).astype(np.int64)
+        frontier = np.flatnonzero(in_degree == 0)
+        if stats is not None:
+            stats.add('enqueues', len(frontier))
+    emitted = 0
+
+    while len(frontier):
+        emitted += len(frontier)
+        yield frontier
+
+        with phase(stats, 'main_loop'):
+            # Remove os arcos que saem do nível: quem zerar o grau forma o próximo
+            if len(frontier) <= SMALL_LEVEL:
+                ready = []
+                scanned = 0
+                for v in frontier.tolist():
+                    targets = indices[indptr[v]:indptr[v + 1]].tolist()
+                    scanned += len(targets)
+                    for u in targets:
+                        in_degree[u] -= 1
+                        if in_degree[u] == 0:
+                            ready.append(u)
+                frontier = np.array(sorted(ready), dtype=np.int64)
+            else:
+                starts = indptr[frontier]
+                counts = indptr[frontier + 1] - starts
+                targets = indices[expand_ranges(starts, counts)]
+                scanned = len(targets)
+                np.subtract.at(in_degree, targets, 1)
+                frontier = np.unique(targets[in_degree[targets] == 0]).astype(np.int64)
+            if stats is not None:
+                stats.add('edges_scanned', scanned)
+                stats.add('enqueues', len(frontier))
+                stats.add('levels', 1)
+                stats.flush()
+
+    if emitted < n:
+        raise CycleError(graph, cycle_witness(graph, in_degree > 0))
+
+
+def cycle_witness(graph, remaining):
+    """Um ciclo entre os vértices ``remaining`` (máscara) que sobraram do Kahn
+
+    Todo vértice que sobrou ainda tem um arco de entrada vindo de outro que
+    sobrou. Andando para trás por esses arcos, algum vértice se repete, e o
+    trecho entre as duas visitas é um ciclo. Cada vértice é visitado no máximo
+    uma vez.
+    """
+    in_indptr, in_sources, _ = graph.incoming()
+    position = {}
+    walk = []
+    v = int(np.flatnonzero(remaining)[0])
+    while v not in position:
+        position[v] = len(walk)
+        walk.append(v)
+        sources = in_sources[in_indptr[v]:in_indptr[v + 1]]
+        v = int(sources[remaining[sources]][0])
+    # walk[i + 1] -> walk[i]: o ciclo, invertido, vai na ordem dos arcos
+    return np.array(walk[position[v]:][::-1], dtype=np.int64)
+
+
+def kahn_topological_sort(graph, stats=None):
+    """Ordem topológica por níveis (Kahn), com ``level`` e testemunha de ciclo
+
+    ``stats``: ver grafos.instrument.
+    """
+    level = np.full(graph.num_vertices, -1, dtype=np.int64)
+    levels = []
+    cycle = None
+    try:
+        for depth, frontier in enumerate(kahn_levels(graph, stats=stats)):
+            level[frontier] = depth
+            levels.append(frontier)
+    except CycleError as error:
+        cycle = error.cycle
+    order = np.concatenate(levels) if levels else np.empty(0, dtype=np.int64)
+    return TopologicalResult(graph, order, level, cycle)
@@ -0,0 +1,161 @@
+"""
+Travessias BFS e DFS sem interface gráfica (modo headless).
+
+Seguem a mesma lógica de ``BFSVisualization.bfs_algorithm`` e
+``DFSVisualization.dfs_algorithm``, mas sem desenho nem pausas. "Está na fila"
+e "está na pilha" ficam em arrays de bytes indexados pelo id do vértice, então
+cada teste de pertinência é O(1) e a travessia toda é O(V + E).
+"""
+
+import numpy as np
+
+from grafos.instrument import count_traversal, phase
+
+
+class TraversalResult:
+    """Resultado de uma travessia, com vértices identificados por id inteiro"""
+
+    def __init__(self, graph, order, parent, steps, levels=None,
+                 discovery_time=None, finish_time=None):
+        self.graph = graph
+        self.order = order                    # Ordem de visitação
+        self.parent = parent                  # parent[v] = pai na árvore (-1 se raiz/não alcançado)
+        self.steps = steps                    # Passos executados (mesma contagem do visualizador)
+        self.levels = levels                  # BFS: nível de cada vértice (-1 se não alcançado)
+        self.discovery_time = discovery_time  # DFS: tempo de descoberta
+        self.finish_time = finish_time        # DFS: tempo de finalização
+
+    def tree_edges(self):
+        """Arestas da árvore ``(pai, filho)`` na ordem de visitação"""
+        children = self.order[self.parent[self.order] >= 0]
+        return list(zip(self.parent[children].tolist(), children.tolist()))
+
+    def path_labels(self):
+        """Ordem de visitação com os rótulos do grafo"""
+        return [self.graph.label_of(v) for v in self.order]
+
+    def parent_labels(self):
+        """``{filho: pai}`` com rótulos, como ``parent`` dos visualizadores"""
+        label_of = self.graph.label_of
+        return {label_of(child): label_of(parent) for parent, child in self.tree_edges()}
+
+    def tree_edge_labels(self):
+        """``[(pai, filho)]`` com rótulos, como ``tree_edges`` dos visualizadores"""
+        label_of = self.graph.label_of
+        return [(label_of(parent), label_of(child)) for parent, child in self.tree_edges()]
+
+    def level_labels(self):
+        """``{vértice: nível}`` com rótulos, como ``levels`` do BFSVisualization"""
+        label_of = self.graph.label_of
+        return {label_of(v): int(self.levels[v]) for v in self.order}
+
+
+def bfs_traversal(graph, start, stats=None):
+    """BFS a partir do id ``start``
+
+    A fila é um array pré-alocado com ponteiro de início: cada vértice entra
+    no máximo uma vez, então ``n`` posições bastam. ``stats``: ver
+    grafos.instrument.
+    """
+    n = graph.num_vertices
+    indptr = graph.indptr
+    indices = graph.indices
+
+    enqueued = bytearray(n)
+    queue = np.empty(n, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    levels = np.full(n, -1, dtype=np.int64)
+
+    queue[0] = start
+    enqueued[start] = 1
+    levels[start] = 0
+    head, tail = 0, 1
+    steps = 1  # Passo 0: vértice inicial
+
+    with phase(stats, 'main_loop'):
+        while head < tail:
+            current = int(queue[head])
+            head += 1
+            next_level = levels[current] + 1
+
+            for neighbor in indices[indptr[current]:indptr[current + 1]].tolist():
+                if not enqueued[neighbor]:
+                    enqueued[neighbor] = 1
+                    queue[tail] = neighbor
+                    tail += 1
+                    parent[neighbor] = current
+                    levels[neighbor] = next_level
+            steps += 1
+
+        if stats is not None:
+            count_traversal(stats, graph, queue[:tail])
+
+    return TraversalResult(graph, queue[:tail], parent, steps, levels=levels)
+
+
+def label_rank(graph):
+    """Posição de cada vértice na ordem crescente dos rótulos (lista indexada por id)"""
+    if graph.labels is None:
+        return None
+    rank = [0] * graph.num_vertices
+    for position, v in enumerate(sorted(range(graph.num_vertices), key=graph.labels.__getitem__)):
+        rank[v] = position
+    return rank
+
+
+def dfs_traversal(graph, start, stats=None):
+    """DFS a partir do id ``start``, com a mesma pilha do visualizador
+
+    Ao visitar um vértice todos os vizinhos não visitados que ainda não estão
+    na pilha são empilhados em ordem decrescente de rótulo, como em
+    ``DFSVisualization.dfs_algorithm``, para que o menor seja explorado
+    primeiro: a ordem de visitação e o número de passos são os mesmos do
+    visualizador. O vértice sai da pilha quando volta ao topo já visitado
+    (backtracking). ``stats``: ver grafos.instrument.
+    """
+    n = graph.num_vertices
+    indptr = graph.indptr
+    indices = graph.indices
+
+    visited = bytearray(n)
+    on_stack = bytearray(n)
+    parent = np.full(n, -1, dtype=np.int64)
+    discovery_time = np.full(n, -1, dtype=np.int64)
+    finish_time = np.full(n, -1, dtype=np.int64)
+    order = []
+    rank = label_rank(graph)  # None: rótulos são os próprios ids
+
+    stack = [start]
+    on_stack[start] = 1
+    time_counter = 0
+    steps = 1  # Passo 0: vértice inicial
+
+    with phase(stats, 'main_loop'):
+        while stack:
+            current = stack[-1]
+
+            if not visited[current]:
+                visited[current] = 1
+                order.append(current)
+                discovery_time[current] = time_counter
+                time_counter += 1
+
+                neighbors = indices[indptr[current]:indptr[current + 1]].tolist()
+                neighbors.sort(key=None if rank is None else rank.__getitem__)
+                for neighbor in reversed(neighbors):
+                    if not visited[neighbor] and not on_stack[neighbor]:
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        parent[neighbor] = current
+            else:
+                finished = stack.pop()
+                on_stack[finished] = 0
+                finish_time[finished] = time_counter
+                time_counter += 1
+            steps += 1
+
+        if stats is not None:
+            count_traversal(stats, graph, order)
+
+    return TraversalResult(graph, np.array(order, dtype=np.int64), parent, steps,
+                           discovery_time=discovery_time, finish_time=finish_time)
@@ -0,0 +1,73 @@
+"""
+Layout hierárquico incremental para os painéis de árvore do BFS e do DFS.
+
+Antes, a cada passo, o painel da árvore reconstruía o ``nx.Graph`` e
+recalculava todas as posições (reordenando cada nível no BFS, ou rodando
+``graphviz_layout``/um ``spring_layout`` sem semente no DFS): custo O(V log V)
+ou pior por passo, e vértices que mudavam de lugar entre um quadro e outro.
+
+``IncrementalTreeLayout`` posiciona cada vértice uma única vez, quando ele
+entra na árvore: um nível abaixo do pai, na primeira coluna livre do seu
+nível que não fique à esquerda do pai. Basta guardar a próxima coluna livre
+de cada nível, então cada inserção é O(1) e nenhum vértice já posicionado se
+move. Dois vértices nunca ocupam a mesma posição.
+"""
+
+
+class IncrementalTreeLayout:
+    def __init__(self, spacing=1.0, level_gap=1.0):
+        self.spacing = spacing        # Distância horizontal entre colunas
+        self.level_gap = level_gap    # Distância vertical entre níveis
+        self.pos = {}                 # Vértice -> (x, y); a raiz fica em y = 0
+        self.parent = {}              # Vértice -> pai (None nas raízes)
+        self.depth = {}
+        self.column = {}
+        self.next_column = []         # Primeira coluna livre de cada nível
+        self.width = 0                # Número de colunas já usadas
+
+    def __len__(self):
+        return len(self.pos)
+
+    def __contains__(self, vertex):
+        return vertex in self.pos
+
+    @property
+    def height(self):
+        """Profundidade do nível mais fundo (-1 se a árvore está vazia)"""
+        return len(self.next_column) - 1
+
+    def add(self, vertex, parent=None):
+        """Posiciona ``vertex`` como filho de ``parent`` (ou como nova raiz) em O(1)"""
+        if vertex in self.pos:
+            raise ValueError(f"vértice {vertex} já está na árvore")
+        if parent is None:
+            # Raízes novas (florestas) começam à direita de tudo que já existe
+            depth = 0
+            column = self.width
+        else:
+            depth = self.depth[parent] + 1
+            column = self.column[parent]
+
+        if depth == len(self.next_column):
+            self.next_column.append(0)
+        column = max(column, self.next_column[depth])
+        self.next_column[depth] = column + 1
+        self.width = max(self.width, column + 1)
+
+        self.parent[vertex] = parent
+        self.depth[vertex] = depth
+        self.column[vertex] = column
+        self.pos[vertex] = (column * self.spacing, -depth * self.level_gap)
+        return self.pos[vertex]
+
+    def edges(self):
+        """Arestas ``(pai, filho)`` na ordem de inserção"""
+        return [(parent, vertex) for vertex, parent in self.parent.items() if parent is not None]
+
+    @classmethod
+    def from_parents(cls, order, parent, **options):
+        """Layout de uma árvore já pronta, inserindo os vértices na ordem dada"""
+        layout = cls(**options)
+        for vertex in order:
+            layout.add(vertex, parent.get(vertex))
+        return layout
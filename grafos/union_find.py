@@ -0,0 +1,164 @@
+"""
+Union-Find (conjuntos disjuntos) sobre arrays de inteiros.
+
+``parent`` e ``rank`` são arrays NumPy indexados pelo id do vértice. As
+operações escalares usam ``memoryview`` sobre esses mesmos arrays (acesso
+rápido a partir do Python, sem cópia), e ``find`` usa divisão de caminho
+(path halving) iterativa, então cadeias longas nunca esbarram no limite de
+recursão.
+
+Com ``stats`` (grafos.instrument), a instância passa a usar versões de
+``find`` e ``union`` que contam ``find_calls``, ``find_hops`` e ``unions``.
+Sem ``stats`` os métodos originais ficam intactos.
+"""
+
+import numpy as np
+
+
+class UnionFind:
+    def __init__(self, num_elements, stats=None):
+        self.parent = np.arange(num_elements, dtype=np.int64)
+        self.rank = np.zeros(num_elements, dtype=np.uint8)
+        self.num_sets = num_elements
+
+        # Visões para acesso escalar rápido (compartilham memória com os arrays)
+        self._parent = memoryview(self.parent)
+        self._rank = memoryview(self.rank)
+
+        self.stats = stats
+        if stats is not None:
+            # Atributos da instância têm precedência sobre os métodos da classe
+            self.find = self._counted_find
+            self.union = self._counted_union
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, x):
+        """Encontra o representante do conjunto com divisão de caminho"""
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Une dois conjuntos usando união por rank; retorna False se já estavam unidos"""
+        root_x = self.find(x)
+        root_y = self.find(y)
+
+        if root_x == root_y:
+            return False
+
+        rank = self._rank
+        if rank[root_x] < rank[root_y]:
+            self._parent[root_x] = root_y
+        elif rank[root_x] > rank[root_y]:
+            self._parent[root_y] = root_x
+        else:
+            self._parent[root_y] = root_x
+            rank[root_x] += 1
+        self.num_sets -= 1
+        return True
+
+    def _counted_find(self, x):
+        parent = self._parent
+        hops = 0
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+            hops += 1
+        self.stats.add('find_calls')
+        self.stats.add('find_hops', hops)
+        return x
+
+    def _counted_union(self, x, y):
+        merged = UnionFind.union(self, x, y)
+        if merged:
+            self.stats.add('unions')
+        return merged
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def find_many(self, elements):
+        """Representantes de vários elementos de uma vez (vetorizado)
+
+        Todos os caminhos avançam juntos, dois níveis por rodada, com a mesma
+        divisão de caminho do ``find`` escalar.
+        """
+        parent = self.parent
+        x = np.array(elements, dtype=np.int64)
+        active = np.flatnonzero(parent[x] != x)
+        if self.stats is not None:
+            self.stats.add('find_calls', len(x))
+        while active.size:
+            if self.stats is not None:
+                self.stats.add('find_hops', active.size)
+            nodes = x[active]
+            grandparent = parent[parent[nodes]]
+            parent[nodes] = grandparent
+            x[active] = grandparent
+            active = active[parent[grandparent] != grandparent]
+        return x
+
+    def union_many(self, u, v, batch_size=1 << 16):
+        """Une os pares ``(u[i], v[i])`` em ordem; retorna a máscara dos que uniram conjuntos
+
+        O resultado é o mesmo de chamar ``union`` par a par (como Kruskal
+        exige). Os pares são processados em lotes: em cada lote os pares que
+        já estão no mesmo conjunto são descartados de forma vetorizada, e só os
+        restantes passam pelo ``union`` escalar. Em grafos densos quase todas
+        as arestas finais são descartadas sem laço Python.
+        """
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        merged = np.zeros(len(u), dtype=bool)
+        union = self.union
+
+        for begin in range(0, len(u), batch_size):
+            if self.num_sets == 1:
+                break
+            batch_u = u[begin:begin + batch_size]
+            batch_v = v[begin:begin + batch_size]
+            candidates = np.flatnonzero(self.find_many(batch_u) != self.find_many(batch_v))
+            for i, a, b in zip(candidates.tolist(), batch_u[candidates].tolist(),
+                               batch_v[candidates].tolist()):
+                if union(a, b):
+                    merged[begin + i] = True
+            if self.stats is not None:
+                self.stats.flush()
+        return merged
+
+    def link_many(self, u, v):
+        """Une todos os pares sem se importar com a ordem (para checar conectividade)
+
+        Totalmente vetorizado: a cada rodada cada raiz envolvida passa a apontar
+        para uma raiz menor com que divide um par, e os caminhos são encurtados
+        com ``find_many``. Como os ponteiros sempre descem de índice, não há
+        ciclos. O rank deixa de refletir a altura das árvores, o que só afeta o
+        balanceamento de uniões futuras, não a correção. Retorna o número de
+        uniões feitas.
+        """
+        parent = self.parent
+        roots_u = self.find_many(u)
+        roots_v = self.find_many(v)
+        while True:
+            distinct = roots_u != roots_v
+            if not distinct.any():
+                break
+            roots_u, roots_v = roots_u[distinct], roots_v[distinct]
+            parent[np.maximum(roots_u, roots_v)] = np.minimum(roots_u, roots_v)
+            roots_u = self.find_many(roots_u)
+            roots_v = self.find_many(roots_v)
+
+        num_sets = int(np.count_nonzero(parent == np.arange(len(parent))))
+        merges = self.num_sets - num_sets
+        self.num_sets = num_sets
+        if self.stats is not None:
+            self.stats.add('unions', merges)
+        return merges
+
+    def component_labels(self):
+        """Representante de cada elemento (vetorizado); útil para checar conectividade"""
+        return self.find_many(np.arange(len(self.parent)))
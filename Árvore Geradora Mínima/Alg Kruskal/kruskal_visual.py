@@ -1,34 +1,57 @@
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
 from matplotlib.animation import FuncAnimation
-import time
+import os
+import sys
+
+# Permite importar o pacote compartilhado "grafos" da raiz do repositório
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from grafos import export, layout, native
+from grafos.csr import CSRGraph
+from grafos.instrument import phase
+from grafos.loaders import load_graph
+from grafos.edge_sort import sorted_edges as sorted_edge_records
+from grafos.mst import mst_labels
+from grafos.render import GraphRenderer
+from grafos.state_log import FrameLog
+from grafos.stepper import Stepper
+from grafos.union_find import UnionFind
 
 # Configurar matplotlib para modo interativo
 plt.ion()
 
 class KruskalVisualization:
-    def __init__(self):
-        # Definindo um grafo de exemplo simples
-        # Formato: (vértice1, vértice2, peso)
-        self.edges = [
-            ('A', 'B', 4),
-            ('A', 'C', 2),
-            ('B', 'C', 1),
-            ('B', 'D', 5),
-            ('C', 'D', 8),
-            ('C', 'E', 10),
-            ('D', 'E', 2),
-            ('D', 'F', 6),
-            ('E', 'F', 3)
-        ]
+    def __init__(self, graph=None, stats=None):
+        # Grafo em CSR compartilhado pelas visualizações (grafos.csr)
+        if graph is None:
+            # Definindo um grafo de exemplo simples
+            # Formato: (vértice1, vértice2, peso)
+            graph = CSRGraph.from_edge_list([
+                ('A', 'B', 4),
+                ('A', 'C', 2),
+                ('B', 'C', 1),
+                ('B', 'D', 5),
+                ('C', 'D', 8),
+                ('C', 'E', 10),
+                ('D', 'E', 2),
+                ('D', 'F', 6),
+                ('E', 'F', 3)
+            ])
+        elif isinstance(graph, list):
+            graph = CSRGraph.from_edge_list(graph)
+        self.csr = graph
+        
+        # Contadores e tempos por fase, opcionais (ver grafos.instrument)
+        self.stats = stats
+        
+        # Formato: (vértice1, vértice2, peso) usado no desenho
+        self.edges = self.csr.to_edge_list()
         
         # Vértices únicos
         self.vertices = list(set([edge[0] for edge in self.edges] + [edge[1] for edge in self.edges]))
         
-        # Estrutura Union-Find
-        self.parent = {v: v for v in self.vertices}
-        self.rank = {v: 0 for v in self.vertices}
+        # Estrutura Union-Find (arrays indexados pelo id do vértice no CSR)
+        self.union_find = UnionFind(self.csr.num_vertices)
         
         # Para visualização
         self.mst_edges = []
@@ -36,54 +59,31 @@ class KruskalVisualization:
         self.step = 0
         self.fig = None
         self.pos = None
+        self.renderer = None  # Artistas persistentes usados nos passos
+        self.artists = None
+        self.frames = []      # Quadros gravados por record_steps
         
     def find(self, x):
-        """Encontra o representante do conjunto com compressão de caminho"""
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        """Encontra o representante do conjunto (find iterativo, ver grafos.union_find)"""
+        return self.csr.label_of(self.union_find.find(self.csr.id_of(x)))
     
     def union(self, x, y):
         """Une dois conjuntos usando união por rank"""
-        root_x = self.find(x)
-        root_y = self.find(y)
-        
-        if root_x != root_y:
-            if self.rank[root_x] < self.rank[root_y]:
-                self.parent[root_x] = root_y
-            elif self.rank[root_x] > self.rank[root_y]:
-                self.parent[root_y] = root_x
-            else:
-                self.parent[root_y] = root_x
-                self.rank[root_x] += 1
-            return True
-        return False
+        return self.union_find.union(self.csr.id_of(x), self.csr.id_of(y))
     
     def show_initial_graph(self):
         """Mostra o grafo inicial antes de começar o algoritmo"""
         self.fig = plt.figure(figsize=(12, 8))
+        self.renderer = None
         
-        # Cria o grafo
-        G = nx.Graph()
-        for edge in self.edges:
-            G.add_edge(edge[0], edge[1], weight=edge[2])
-        
-        # Posicionamento dos vértices (fixo para toda a animação)
-        self.pos = nx.spring_layout(G, seed=42)
-        
-        # Desenha todas as arestas
-        nx.draw_networkx_edges(G, self.pos, edge_color='blue', width=2, alpha=0.7)
-        
-        # Desenha os vértices
-        nx.draw_networkx_nodes(G, self.pos, node_color='lightblue', 
-                              node_size=1000, alpha=0.9)
-        
-        # Adiciona labels dos vértices
-        nx.draw_networkx_labels(G, self.pos, font_size=16, font_weight='bold')
+        self.compute_layout()
         
-        # Adiciona pesos das arestas
+        # Arestas, vértices, labels e pesos (com nível de detalhe; ver grafos.render)
         edge_labels = {(edge[0], edge[1]): edge[2] for edge in self.edges}
-        nx.draw_networkx_edge_labels(G, self.pos, edge_labels, font_size=10)
+        GraphRenderer(plt.gca(), self.pos, self.csr.vertex_labels(),
+                      [(u, v) for u, v, _ in self.edges], node_color='lightblue',
+                      node_size=1000, edge_color='blue', edge_width=2, edge_alpha=0.7,
+                      font_size=16, edge_labels=edge_labels, blit=False)
         
         plt.title("GRAFO INICIAL - Algoritmo de Kruskal\nTodas as arestas com seus pesos", 
                  fontsize=16, fontweight='bold', color='blue')
@@ -91,19 +91,53 @@ class KruskalVisualization:
         plt.axis('off')
         plt.tight_layout()
         
-        # Mostra o grafo inicial
+        # Mostra o grafo inicial (fica na tela até o primeiro passo; ver play)
         plt.draw()
-        plt.pause(3)  # Mostra por 3 segundos
-    def kruskal_algorithm(self):
-        """Algoritmo de Kruskal com visualização passo a passo"""
+    
+    def compute_layout(self):
+        """Calcula o posicionamento dos vértices (fixo para toda a animação)"""
+        # Pesos como força das molas, como no nx.Graph com atributo weight (em cache no disco)
+        self.pos = layout.spring_layout(self.csr, weighted=True, seed=42)
+        return self.pos
+    
+    def kruskal_algorithm(self, mode='auto', interval=2.0):
+        """Algoritmo de Kruskal com visualização passo a passo
+        
+        O algoritmo roda sem pausas gravando os passos, que depois são mostrados
+        por grafos.stepper: mode='auto' (um passo a cada interval segundos),
+        'keys' (um passo por tecla) ou 'benchmark' (sem espera).
+        """
         # Mostra o grafo inicial
         print("🌟 ALGORITMO DE KRUSKAL - ÁRVORE GERADORA MÍNIMA")
         print("=" * 55)
         print("📊 Mostrando grafo inicial...")
-        self.show_initial_graph()
+        with phase(self.stats, 'render'):
+            self.show_initial_graph()
         
-        # Ordena as arestas por peso
-        sorted_edges = sorted(self.edges, key=lambda x: x[2])
+        with phase(self.stats, 'main_loop'):
+            mst, total_weight = self.record_steps()
+        with phase(self.stats, 'render'):
+            self.play(mode, interval)
+        return mst, total_weight
+    
+    def record_steps(self):
+        """Executa o algoritmo sem pausas, gravando um quadro por passo em self.frames
+        
+        Os quadros são gravados como deltas (grafos.state_log.FrameLog): cada
+        aresta aceita entra na coleção 'mst', e a decisão (aceita ou rejeitada)
+        vai nos metadados do passo. frame_of monta o quadro só na leitura.
+        """
+        self.frames = FrameLog(self.frame_of, ('mst',))
+        self.union_find = UnionFind(self.csr.num_vertices, self.stats)
+        self.mst_edges = []
+        self.current_edge = None
+        
+        # Ordena as arestas por peso (ordem estável, guardada no grafo; ver grafos.edge_sort)
+        with phase(self.stats, 'sort'):
+            records = sorted_edge_records(self.csr)
+        label_of = self.csr.label_of
+        sorted_edges = [(label_of(u), label_of(v), w) for u, v, w in
+                        zip(records['u'].tolist(), records['v'].tolist(), records['w'].tolist())]
         
         print("📊 Grafo original:")
         for edge in self.edges:
@@ -137,20 +171,18 @@ class KruskalVisualization:
                 print(f"   ✅ Aresta adicionada à MST! Peso total: {total_weight}")
                 
                 # Atualiza para visualização
-                self.mst_edges = mst.copy()
+                self.frames.set('mst', (u, v))
                 self.current_edge = (u, v, weight)
-                self.visualize_step(sorted_edges, i)
+                self.record_step(i, accepted=True)
                 
             else:
                 print(f"   ❌ Aresta rejeitada (formaria ciclo)")
                 
-                # Atualiza visualização mesmo para arestas rejeitadas
+                # Grava o passo mesmo para arestas rejeitadas
                 self.current_edge = (u, v, weight)
-                self.visualize_step(sorted_edges, i)
-                
-            # Pausa para visualização
-            time.sleep(2)
+                self.record_step(i, accepted=False)
         
+        self.mst_edges = mst
         print(f"\n🎉 RESULTADO FINAL:")
         print(f"📋 Árvore Geradora Mínima:")
         for edge in mst:
@@ -159,118 +191,139 @@ class KruskalVisualization:
         
         return mst, total_weight
     
-    def visualize_step(self, sorted_edges, current_step):
-        """Visualiza o estado atual do algoritmo"""
+    def run_engine(self):
+        """Calcula a MST sem gravar passos, no backend nativo quando compilado (grafos.native)
+        
+        Produz as mesmas arestas de kruskal_algorithm, então create_final_visualization
+        pode ser chamado em seguida. Sem a biblioteca nativa usa grafos.mst.
+        """
+        tree, total_weight = native.kruskal_mst(self.csr, stats=self.stats)
+        self.mst_edges = mst_labels(self.csr, tree)
+        self.current_edge = None
+        return self.mst_edges, total_weight
+    
+    def build_scene(self):
+        """Descreve a figura dos passos para grafos.export"""
+        edge_labels = {(edge[0], edge[1]): edge[2] for edge in self.edges}
+        
+        # Legenda (estática, fica no fundo)
+        legend = [
+            dict(color='lightgray', lw=1, alpha=0.5, label='Arestas originais'),
+            dict(color='green', lw=3, label='MST (arestas aceitas)'),
+            dict(color='red', lw=2, linestyle='--', label='Aresta sendo analisada'),
+        ]
+        
+        scene = export.Scene(figsize=(12, 8))
+        # Título de duas linhas provisório, para o tight_layout reservar o espaço
+        scene.add_graph('graph', self.pos, self.csr.vertex_labels(),
+                        [(u, v) for u, v, _ in self.edges], legend=legend,
+                        title=("\n", dict(fontsize=14, fontweight='bold')),
+                        node_color='lightblue', node_size=1000, edge_width=1,
+                        edge_alpha=0.5, font_size=16, edge_labels=edge_labels)
+        return scene
+    
+    def setup_renderer(self):
+        """Cria uma única vez os artistas usados nos passos (ver grafos.render)"""
         # Inicializa a figura apenas uma vez
         if self.fig is None:
             self.fig = plt.figure(figsize=(12, 8))
-            # Cria o grafo para posicionamento fixo
-            G = nx.Graph()
-            for edge in self.edges:
-                G.add_edge(edge[0], edge[1], weight=edge[2])
-            self.pos = nx.spring_layout(G, seed=42)
-        
-        # Limpa o conteúdo anterior
-        plt.clf()
-        
-        # Cria o grafo
-        G = nx.Graph()
-        for edge in self.edges:
-            G.add_edge(edge[0], edge[1], weight=edge[2])
-        
-        # Desenha todas as arestas em cinza claro
-        nx.draw_networkx_edges(G, self.pos, edge_color='lightgray', width=1, alpha=0.5)
-        
-        # Desenha as arestas da MST em verde
-        mst_graph = nx.Graph()
-        for edge in self.mst_edges:
-            mst_graph.add_edge(edge[0], edge[1])
+        if self.pos is None:
+            self.compute_layout()
         
-        if len(self.mst_edges) > 0:
-            nx.draw_networkx_edges(mst_graph, self.pos, edge_color='green', width=3)
+        # Limpa o grafo inicial e cria os eixos dos passos
+        self.fig.clf()
+        self.artists = self.build_scene().build(self.fig)
+        self.renderer = self.artists['graph']
+        self.fig.tight_layout()
+    
+    def frame_of(self, state):
+        """Quadro a partir de um estado gravado (ver GraphRenderer.apply)"""
+        # Arestas da MST em verde
+        edges = [(list(state['mst']), 'green', 3, 'solid', None)]
         
         # Destaca a aresta atual sendo analisada
-        if self.current_edge:
-            current_graph = nx.Graph()
-            current_graph.add_edge(self.current_edge[0], self.current_edge[1])
-            nx.draw_networkx_edges(current_graph, self.pos, edge_color='red', width=2, style='dashed')
-        
-        # Desenha os vértices
-        nx.draw_networkx_nodes(G, self.pos, node_color='lightblue', 
-                              node_size=1000, alpha=0.9)
-        
-        # Adiciona labels dos vértices
-        nx.draw_networkx_labels(G, self.pos, font_size=16, font_weight='bold')
-        
-        # Adiciona pesos das arestas
-        edge_labels = {(edge[0], edge[1]): edge[2] for edge in self.edges}
-        nx.draw_networkx_edge_labels(G, self.pos, edge_labels, font_size=10)
+        current_edge = state['edge']
+        if current_edge:
+            edges.append(([current_edge[:2]], 'red', 2, 'dashed', None))
         
         # Título e informações
         current_edge_info = ""
-        if self.current_edge:
-            status = "ADICIONADA" if any(self.current_edge[:2] == (e[0], e[1]) or self.current_edge[:2] == (e[1], e[0]) for e in self.mst_edges) else "REJEITADA"
-            current_edge_info = f"Aresta atual: {self.current_edge[0]}-{self.current_edge[1]} ({self.current_edge[2]}) - {status}"
-        
-        plt.title(f"Algoritmo de Kruskal - Passo {current_step + 1}\n{current_edge_info}", 
-                 fontsize=14, fontweight='bold')
-        
-        # Legenda
-        from matplotlib.lines import Line2D
-        legend_elements = [
-            Line2D([0], [0], color='lightgray', lw=1, alpha=0.5, label='Arestas originais'),
-            Line2D([0], [0], color='green', lw=3, label='MST (arestas aceitas)'),
-            Line2D([0], [0], color='red', lw=2, linestyle='--', label='Aresta sendo analisada')
-        ]
-        plt.legend(handles=legend_elements, loc='upper right')
-        
-        plt.axis('off')
-        plt.tight_layout()
-        
-        # Atualiza a visualização
-        plt.draw()
-        plt.pause(0.1)  # Pequena pausa para renderização
+        if current_edge:
+            status = "ADICIONADA" if state['accepted'] else "REJEITADA"
+            current_edge_info = (f"Aresta atual: {current_edge[0]}-{current_edge[1]} "
+                                 f"({current_edge[2]}) - {status}")
+        
+        title = f"Algoritmo de Kruskal - Passo {state['step'] + 1}\n{current_edge_info}"
+        return {'graph': {'edges': edges,
+                          'title': (title, dict(fontsize=14, fontweight='bold'))}}
+    
+    def record_step(self, current_step, accepted):
+        """Fecha o quadro do passo atual, com a decisão tomada sobre a aresta"""
+        with phase(self.stats, 'record'):
+            self.frames.commit(step=current_step, edge=self.current_edge, accepted=accepted)
+    
+    def show_frame(self, frame):
+        """Desenha um quadro gravado"""
+        if self.renderer is None:
+            self.setup_renderer()
+        
+        # Só muda o estilo dos artistas já criados
+        export.Scene.apply(self.artists, frame)
+        self.renderer.draw()
+    
+    def play(self, mode='auto', interval=2.0):
+        """Mostra os quadros gravados pelo laço de eventos (ver grafos.stepper)"""
+        frames = self.frames
+        print(f"\n🎬 Mostrando {len(frames)} passos (modo: {mode})...")
+        return Stepper(self.fig, frames, lambda i: self.show_frame(frames[i]),
+                       mode=mode, interval=interval).run()
+    
+    def export_animation(self, path, fps=0.5, workers=None, dpi=100):
+        """Grava o algoritmo e exporta sem abrir janela: .gif, .mp4 ou diretório de PNGs
+        
+        Os quadros são desenhados em paralelo por grafos.export.
+        """
+        self.compute_layout()
+        with phase(self.stats, 'main_loop'):
+            self.record_steps()
+        frames = self.frames
+        
+        print(f"\n🎬 Exportando {len(frames)} quadros para {path}...")
+        with phase(self.stats, 'render'):
+            export.export_animation(self.build_scene(), frames, path, fps=fps,
+                                    workers=workers, dpi=dpi)
+        print(f"✅ Animação salva em {path}")
+        return path
         
     def create_final_visualization(self, mst, total_weight):
         """Cria a visualização final da MST"""
+        # Desliga os artistas persistentes antes de limpar a figura
+        if self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+        
         # Limpa o conteúdo anterior se existir figura
         if self.fig is not None:
             plt.clf()
         else:
             self.fig = plt.figure(figsize=(12, 8))
         
-        # Cria o grafo original
-        G = nx.Graph()
-        for edge in self.edges:
-            G.add_edge(edge[0], edge[1], weight=edge[2])
-        
         # Usa o mesmo posicionamento se já foi calculado
         if self.pos is None:
-            self.pos = nx.spring_layout(G, seed=42)
-        
-        # Desenha todas as arestas em cinza claro
-        nx.draw_networkx_edges(G, self.pos, edge_color='lightgray', width=1, alpha=0.3)
+            self.compute_layout()
         
-        # Desenha as arestas da MST
-        mst_graph = nx.Graph()
-        for edge in mst:
-            mst_graph.add_edge(edge[0], edge[1])
-        
-        nx.draw_networkx_edges(mst_graph, self.pos, edge_color='green', width=4)
-        
-        # Desenha os vértices
-        nx.draw_networkx_nodes(G, self.pos, node_color='lightgreen', 
-                              node_size=1200, alpha=0.9)
-        
-        # Adiciona labels dos vértices
-        nx.draw_networkx_labels(G, self.pos, font_size=16, font_weight='bold')
-        
-        # Adiciona pesos apenas das arestas da MST
+        # Todas as arestas em cinza claro e pesos apenas das arestas da MST
         mst_edge_labels = {(edge[0], edge[1]): edge[2] for edge in mst}
-        nx.draw_networkx_edge_labels(mst_graph, self.pos, mst_edge_labels, 
-                                   font_size=12, font_weight='bold', 
-                                   bbox=dict(boxstyle='round,pad=0.3', 
-                                           facecolor='yellow', alpha=0.8))
+        final = GraphRenderer(plt.gca(), self.pos, self.csr.vertex_labels(),
+                              [(u, v) for u, v, _ in self.edges], node_color='lightgreen',
+                              edge_alpha=0.3, font_size=16, edge_labels=mst_edge_labels,
+                              edge_font_size=12,
+                              edge_label_style=dict(fontweight='bold', bbox=dict(
+                                  boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8)),
+                              blit=False)
+        
+        # Arestas da MST em verde
+        final.apply({'edges': [([edge[:2] for edge in mst], 'green', 4, 'solid', None)]})
         
         plt.title(f"ÁRVORE GERADORA MÍNIMA - Algoritmo de Kruskal\nPeso Total: {total_weight}", 
                  fontsize=16, fontweight='bold', color='darkgreen')
@@ -288,15 +341,20 @@ class KruskalVisualization:
         plt.ioff()  # Desliga modo interativo
         plt.show()
 
-def main():
-    """Função principal para executar a demonstração"""
+def main(mode='auto', graph_file=None):
+    """Função principal para executar a demonstração
+    
+    mode: 'auto', 'keys' ou 'benchmark' (ver grafos.stepper)
+    graph_file: arquivo do grafo (ver grafos.loaders); sem ele, usa o exemplo A–F
+    """
     print("🚀 Iniciando demonstração do Algoritmo de Kruskal")
     print("⏳ Aguarde... A visualização será exibida passo a passo\n")
     
-    kruskal_demo = KruskalVisualization()
+    graph = load_graph(graph_file) if graph_file else None
+    kruskal_demo = KruskalVisualization(graph)
     
     # Executa o algoritmo
-    mst, total_weight = kruskal_demo.kruskal_algorithm()
+    mst, total_weight = kruskal_demo.kruskal_algorithm(mode=mode)
     
     # Visualização final
     print(f"\n📊 Criando visualização final...")
@@ -306,4 +364,6 @@ def main():
     print(f"📈 A Árvore Geradora Mínima conecta todos os vértices com o menor peso total possível.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Argumentos opcionais: modo (auto, keys ou benchmark) e arquivo do grafo
+    main(sys.argv[1] if len(sys.argv) > 1 else 'auto',
+         sys.argv[2] if len(sys.argv) > 2 else None)
\ No newline at end of file
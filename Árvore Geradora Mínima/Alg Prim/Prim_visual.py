@@ -1,34 +1,61 @@
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
-import heapq
 import time
 from matplotlib.animation import FuncAnimation
+import os
+import sys
+
+# Permite importar o pacote compartilhado "grafos" da raiz do repositório
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from grafos import export, layout, native
+from grafos.csr import CSRGraph
+from grafos.indexed_heap import IndexedHeap
+from grafos.instrument import phase
+from grafos.loaders import load_graph
+from grafos.mst import mst_labels
+from grafos.state_log import StateLog
 
 class PrimVisualization:
-    def __init__(self):
-        # Definindo um grafo de exemplo simples
-        self.graph = {
-            'A': [('B', 4), ('C', 2)],
-            'B': [('A', 4), ('C', 1), ('D', 5)],
-            'C': [('A', 2), ('B', 1), ('D', 8), ('E', 10)],
-            'D': [('B', 5), ('C', 8), ('E', 2), ('F', 6)],
-            'E': [('C', 10), ('D', 2), ('F', 3)],
-            'F': [('D', 6), ('E', 3)]
-        }
+    def __init__(self, graph=None, stats=None):
+        # Grafo em CSR compartilhado pelas visualizações (grafos.csr)
+        example_graph = graph is None
+        if graph is None:
+            # Definindo um grafo de exemplo simples
+            graph = CSRGraph.from_adjacency({
+                'A': [('B', 4), ('C', 2)],
+                'B': [('A', 4), ('C', 1), ('D', 5)],
+                'C': [('A', 2), ('B', 1), ('D', 8), ('E', 10)],
+                'D': [('B', 5), ('C', 8), ('E', 2), ('F', 6)],
+                'E': [('C', 10), ('D', 2), ('F', 3)],
+                'F': [('D', 6), ('E', 3)]
+            })
+        elif isinstance(graph, dict):
+            graph = CSRGraph.from_adjacency(graph)
+        self.csr = graph
+        
+        # Contadores e tempos por fase, opcionais (ver grafos.instrument)
+        self.stats = stats
+        
+        # Formato: {vértice: [(vizinho, peso)]} usado no algoritmo e no desenho
+        self.graph = self.csr.to_weighted_adjacency()
+        
+        # Arestas sem repetição (chave canônica (min, max), em tempo linear)
+        self.edge_src, self.edge_dst, self.edge_weights, conflicts = self.csr.unique_edges()
+        self.report_parallel_edges(conflicts)
         
         # Lista de todas as arestas para visualização
-        self.all_edges = []
-        for vertex, neighbors in self.graph.items():
-            for neighbor, weight in neighbors:
-                if (neighbor, vertex, weight) not in self.all_edges:
-                    self.all_edges.append((vertex, neighbor, weight))
+        label_of = self.csr.label_of
+        self.all_edges = [(label_of(u), label_of(v), w)
+                          for u, v, w in zip(self.edge_src.tolist(), self.edge_dst.tolist(),
+                                             self.edge_weights.tolist())]
         
         self.vertices = list(self.graph.keys())
         
-        # Estados para animação
-        self.animation_states = []
+        # Estados para animação (log de deltas; ver grafos.state_log)
+        self.animation_states = StateLog()
         self.current_state = 0
+        self.renderer = None  # Artistas persistentes (criados no primeiro desenho)
+        self.artists = None
         
         # Setup da figura
         self.fig, self.ax = plt.subplots(figsize=(14, 10))
@@ -36,209 +63,250 @@ class PrimVisualization:
                          fontsize=16, fontweight='bold')
         
         # Posicionamento fixo dos vértices
-        self.pos = {
-            'A': (0, 1),
-            'B': (1, 2),
-            'C': (1, 0),
-            'D': (2, 1),
-            'E': (3, 0),
-            'F': (4, 1)
-        }
+        if example_graph:
+            self.pos = {
+                'A': (0, 1),
+                'B': (1, 2),
+                'C': (1, 0),
+                'D': (2, 1),
+                'E': (3, 0),
+                'F': (4, 1)
+            }
+        else:
+            # Spring layout sem pesos, em cache no disco (ver grafos.layout)
+            self.pos = layout.spring_layout(self.csr, seed=42)
+        
+    def report_parallel_edges(self, conflicts):
+        """Avisa sobre arestas paralelas com pesos diferentes (só a primeira é desenhada)"""
+        if len(conflicts) == 0:
+            return
+        sources = self.csr.arc_sources()
+        print(f"⚠️  {len(conflicts)} aresta(s) paralela(s) com peso diferente:")
+        for arc in conflicts[:10].tolist():
+            u = self.csr.label_of(sources[arc])
+            v = self.csr.label_of(self.csr.indices[arc])
+            print(f"   {u}-{v} (peso: {self.csr.weights[arc].item()})")
+        if len(conflicts) > 10:
+            print(f"   ... e mais {len(conflicts) - 10}")
         
     def run_prim_algorithm(self, start_vertex='A'):
-        """Executa o algoritmo de Prim e salva todos os estados"""
+        """Executa o algoritmo de Prim e salva todos os estados
+        
+        Os estados são gravados como deltas em um StateLog (grafos.state_log):
+        cada passo guarda só o vértice/aresta adicionados e as candidatas que
+        mudaram, em vez de cópias completas de visited, mst_edges e candidatas.
+        
+        As candidatas exibidas são as arestas que cruzam o corte (de um vértice
+        visitado para um não visitado). O conjunto é mantido incrementalmente:
+        quando v entra na árvore, as arestas que chegavam em v são invalidadas e
+        as que saem de v são inseridas, com custo O(grau de v) por passo.
+        """
         print("🌟 Executando Algoritmo de Prim...")
         print(f"🚀 Iniciando do vértice: {start_vertex}")
         
+        self.animation_states = StateLog()
+        states = self.animation_states
+        
         # Estado inicial
-        self.animation_states.append({
-            'title': f'Estado Inicial - Vértice {start_vertex} selecionado',
-            'visited': {start_vertex},
-            'mst_edges': [],
-            'current_edge': None,
-            'candidate_edges': [],
-            'step_info': f'Iniciando com vértice {start_vertex}',
-            'total_weight': 0
-        })
+        states.add_vertex(start_vertex)
+        states.commit(title=f'Estado Inicial - Vértice {start_vertex} selecionado',
+                      current_edge=None,
+                      step_info=f'Iniciando com vértice {start_vertex}',
+                      total_weight=0)
         
         # Inicialização do algoritmo
         mst = []
         total_weight = 0
         visited = {start_vertex}
-        priority_queue = []
         
-        # Adiciona arestas iniciais à fila
-        for neighbor, weight in self.graph[start_vertex]:
-            heapq.heappush(priority_queue, (weight, start_vertex, neighbor))
+        # Heap indexada (como a HeapMinima de Alg_Prim.c): uma entrada por vértice
+        # fora da árvore, com o peso da aresta mais leve que o alcança
+        heap = IndexedHeap(self.csr.num_vertices, stats=self.stats)
+        best_edge = {}  # vértice -> (u, v, peso) da aresta candidata atual
+        
+        def push_candidates(v):
+            """Insere as arestas de v para fora da árvore; retorna as novas candidatas"""
+            new_candidates = []
+            for neighbor, weight in self.graph[v]:
+                if neighbor not in visited:
+                    states.set_candidate((v, neighbor, weight), (weight, v, neighbor))
+                    new_candidates.append((weight, v, neighbor))
+                    if heap.push_or_decrease(self.csr.id_of(neighbor), weight):
+                        best_edge[neighbor] = (v, neighbor, weight)
+            return new_candidates
+        
+        def invalidate_candidates(v):
+            """Remove as candidatas que chegavam em v (deixaram de cruzar o corte)"""
+            for neighbor, weight in self.graph[v]:
+                if neighbor in visited:
+                    states.remove_candidate((neighbor, v, weight))
+        
+        # Adiciona arestas iniciais à heap
+        candidate_edges = push_candidates(start_vertex)
         
         # Estado após adicionar candidatos iniciais
-        candidate_edges = [(weight, u, v) for weight, u, v in priority_queue]
-        self.animation_states.append({
-            'title': f'Arestas candidatas de {start_vertex} adicionadas à fila',
-            'visited': visited.copy(),
-            'mst_edges': mst.copy(),
-            'current_edge': None,
-            'candidate_edges': candidate_edges,
-            'step_info': f'Candidatos: {[(u, v, w) for w, u, v in candidate_edges]}',
-            'total_weight': total_weight
-        })
+        states.commit(title=f'Arestas candidatas de {start_vertex} adicionadas à fila',
+                      current_edge=None,
+                      step_info=f'Candidatos: {[(u, v, w) for w, u, v in candidate_edges]}',
+                      total_weight=total_weight)
         
         step = 1
         
-        while priority_queue and len(visited) < len(self.vertices):
-            # Pega a aresta de menor peso
-            weight, u, v = heapq.heappop(priority_queue)
+        with phase(self.stats, 'main_loop'):
+            while heap and len(visited) < len(self.vertices):
+                # Pega o vértice alcançado pela aresta de menor peso
+                vertex_id, _ = heap.pop()
+                u, v, weight = best_edge.pop(self.csr.label_of(vertex_id))
             
-            # Se já foi visitado, pula
-            if v in visited:
-                continue
+                # Adiciona à MST
+                mst.append((u, v, weight))
+                total_weight += weight
+                visited.add(v)
+                invalidate_candidates(v)
+                states.add_vertex(v)
+                states.add_edge((u, v, weight))
             
-            # Adiciona à MST
-            mst.append((u, v, weight))
-            total_weight += weight
-            visited.add(v)
+                # Estado destacando a aresta sendo adicionada
+                states.commit(title=f'Passo {step}: Selecionando aresta {u}-{v} (peso: {weight})',
+                              current_edge=(u, v, weight),
+                              step_info=f'Adicionada: {u}-{v} (peso: {weight}) | Total: {total_weight}',
+                              total_weight=total_weight)
             
-            # Estado destacando a aresta sendo adicionada
-            self.animation_states.append({
-                'title': f'Passo {step}: Selecionando aresta {u}-{v} (peso: {weight})',
-                'visited': visited.copy(),
-                'mst_edges': mst.copy(),
-                'current_edge': (u, v, weight),
-                'candidate_edges': [(w, x, y) for w, x, y in priority_queue if y not in visited],
-                'step_info': f'Adicionada: {u}-{v} (peso: {weight}) | Total: {total_weight}',
-                'total_weight': total_weight
-            })
+                # Adiciona novas arestas candidatas
+                new_candidates = push_candidates(v)
             
-            # Adiciona novas arestas candidatas
-            new_candidates = []
-            for neighbor, edge_weight in self.graph[v]:
-                if neighbor not in visited:
-                    heapq.heappush(priority_queue, (edge_weight, v, neighbor))
-                    new_candidates.append((edge_weight, v, neighbor))
+                # Estado após adicionar novos candidatos
+                if new_candidates or heap:
+                    new_info = f'Novos candidatos de {v}: {[(x, y, w) for w, x, y in new_candidates]}'
+                    states.commit(title=f'Passo {step}: Vértice {v} adicionado, atualizando candidatos',
+                                  current_edge=None,
+                                  step_info=new_info,
+                                  total_weight=total_weight)
             
-            # Estado após adicionar novos candidatos
-            if new_candidates or priority_queue:
-                candidate_edges = [(w, x, y) for w, x, y in priority_queue if y not in visited]
-                new_info = f'Novos candidatos de {v}: {[(x, y, w) for w, x, y in new_candidates]}'
-                
-                self.animation_states.append({
-                    'title': f'Passo {step}: Vértice {v} adicionado, atualizando candidatos',
-                    'visited': visited.copy(),
-                    'mst_edges': mst.copy(),
-                    'current_edge': None,
-                    'candidate_edges': candidate_edges,
-                    'step_info': new_info,
-                    'total_weight': total_weight
-                })
-            
-            step += 1
+                step += 1
         
         # Estado final
-        self.animation_states.append({
-            'title': f'🎉 Algoritmo Concluído! MST encontrada',
-            'visited': visited.copy(),
-            'mst_edges': mst.copy(),
-            'current_edge': None,
-            'candidate_edges': [],
-            'step_info': f'MST completa | Peso total: {total_weight} | Arestas: {len(mst)}',
-            'total_weight': total_weight
-        })
+        states.commit(title=f'🎉 Algoritmo Concluído! MST encontrada',
+                      current_edge=None,
+                      step_info=f'MST completa | Peso total: {total_weight} | Arestas: {len(mst)}',
+                      total_weight=total_weight)
         
         print(f"✅ Algoritmo concluído! {len(self.animation_states)} estados gerados")
         return mst, total_weight
     
-    def draw_graph_state(self, state):
-        """Desenha um estado específico do grafo"""
-        self.ax.clear()
+    def run_engine(self, start_vertex='A', method='heap'):
+        """Calcula a MST sem os estados intermediários, no backend nativo quando compilado
+        
+        Usa grafos.native (primComHeap, ou primSimples com method='simple') e
+        cai no Prim de grafos.mst sem a biblioteca. Grava só dois estados, o
+        inicial e o final, para que as visualizações continuem funcionando.
+        """
+        tree, total_weight = native.prim_mst(self.csr, self.csr.id_of(start_vertex), method,
+                                             stats=self.stats)
+        mst = mst_labels(self.csr, tree)
+        
+        self.animation_states = StateLog()
+        states = self.animation_states
+        states.add_vertex(start_vertex)
+        states.commit(title=f'Estado Inicial - Vértice {start_vertex} selecionado',
+                      current_edge=None,
+                      step_info=f'Iniciando com vértice {start_vertex}',
+                      total_weight=0)
+        for u, v, weight in mst:
+            states.add_vertex(v)
+            states.add_edge((u, v, weight))
+        states.commit(title=f'🎉 Algoritmo Concluído! MST encontrada',
+                      current_edge=None,
+                      step_info=f'MST completa | Peso total: {total_weight} | Arestas: {len(mst)}',
+                      total_weight=total_weight)
+        self.current_state = 0
+        return mst, total_weight
+    
+    def build_scene(self):
+        """Descreve a figura da animação para grafos.export"""
+        edge_labels = {(edge[0], edge[1]): edge[2] for edge in self.all_edges}
         
-        # Cria o grafo
-        G = nx.Graph()
-        for edge in self.all_edges:
-            G.add_edge(edge[0], edge[1], weight=edge[2])
-        
-        # Desenha todas as arestas em cinza claro
-        nx.draw_networkx_edges(G, self.pos, edge_color='lightgray', 
-                              width=1.5, alpha=0.3, ax=self.ax)
-        
-        # Desenha arestas candidatas em laranja pontilhado
-        if state['candidate_edges']:
-            candidate_edges_draw = []
-            for weight, u, v in state['candidate_edges']:
-                if u in state['visited']:  # Só mostra se conecta a vértice visitado
-                    candidate_edges_draw.append((u, v))
-            
-            if candidate_edges_draw:
-                candidate_graph = nx.Graph()
-                candidate_graph.add_edges_from(candidate_edges_draw)
-                nx.draw_networkx_edges(candidate_graph, self.pos, edge_color='orange', 
-                                     width=3, alpha=0.8, style='dashed', ax=self.ax)
-        
-        # Desenha arestas da MST em verde
-        if state['mst_edges']:
-            mst_graph = nx.Graph()
-            for edge in state['mst_edges']:
-                mst_graph.add_edge(edge[0], edge[1])
-            
-            nx.draw_networkx_edges(mst_graph, self.pos, edge_color='green', 
-                                  width=5, alpha=0.9, ax=self.ax)
+        # Legenda (estática, fica no fundo)
+        legend = [
+            dict(marker='o', color='w', markerfacecolor='lightgreen', markersize=12,
+                 label='Vértices na MST'),
+            dict(marker='o', color='w', markerfacecolor='lightgray', markersize=12,
+                 label='Vértices não visitados'),
+            dict(color='green', lw=4, label='Arestas da MST'),
+            dict(color='orange', lw=3, linestyle='--', label='Arestas candidatas'),
+            dict(color='red', lw=3, label='Aresta sendo adicionada'),
+        ]
+        
+        scene = export.Scene(figsize=(14, 10),
+                             suptitle=('Algoritmo de Prim - Árvore Geradora Mínima',
+                                       dict(fontsize=16, fontweight='bold')))
+        # Título de duas linhas provisório, para o tight_layout reservar o espaço
+        scene.add_graph('graph', self.pos, self.vertices,
+                        [(u, v) for u, v, _ in self.all_edges], legend=legend,
+                        title=("\n", dict(fontsize=12, pad=20)),
+                        node_size=1200, edge_width=1.5, edge_alpha=0.3,
+                        font_size=14, edge_labels=edge_labels)
+        # Informações adicionais na parte inferior
+        scene.add_text('info', 0.5, 0.02, panel=False, ha='center', fontsize=10,
+                       bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow'))
+        return scene
+    
+    def setup_renderer(self):
+        """Cria uma única vez os vértices, arestas, rótulos e legenda (ver grafos.render)"""
+        self.ax.clear()
+        self.artists = self.build_scene().build(self.fig, axes={'graph': self.ax})
+        self.renderer = self.artists['graph']
+        plt.tight_layout()
+    
+    def frame_of(self, state, index):
+        """Estado ``index`` como quadro (ver GraphRenderer.apply)"""
+        # Arestas candidatas em laranja pontilhado (só se conectam a vértice visitado)
+        edges = [([(u, v) for weight, u, v in state['candidate_edges'] if u in state['visited']],
+                  'orange', 3, 'dashed', 0.8),
+                 # Arestas da MST em verde
+                 ([edge[:2] for edge in state['mst_edges']], 'green', 5, 'solid', 0.9)]
         
         # Destaca a aresta atual em vermelho
         if state['current_edge']:
-            current_graph = nx.Graph()
-            current_graph.add_edge(state['current_edge'][0], state['current_edge'][1])
-            nx.draw_networkx_edges(current_graph, self.pos, edge_color='red', 
-                                  width=4, alpha=1.0, ax=self.ax)
-        
-        # Desenha vértices com cores diferentes
-        node_colors = []
-        node_sizes = []
-        for vertex in self.vertices:
-            if vertex in state['visited']:
-                node_colors.append('lightgreen')
-                node_sizes.append(1500)
-            else:
-                node_colors.append('lightgray')
-                node_sizes.append(1200)
-        
-        nx.draw_networkx_nodes(G, self.pos, node_color=node_colors, 
-                              node_size=node_sizes, alpha=0.9, ax=self.ax)
-        
-        # Labels dos vértices
-        nx.draw_networkx_labels(G, self.pos, font_size=14, font_weight='bold', ax=self.ax)
-        
-        # Pesos das arestas
-        edge_labels = {(edge[0], edge[1]): edge[2] for edge in self.all_edges}
-        nx.draw_networkx_edge_labels(G, self.pos, edge_labels, font_size=10, ax=self.ax)
-        
-        # Título e informações
-        self.ax.set_title(f"{state['title']}\n{state['step_info']}", 
-                         fontsize=12, pad=20)
-        
-        # Legenda
-        from matplotlib.lines import Line2D
-        legend_elements = [
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='lightgreen', 
-                   markersize=12, label='Vértices na MST'),
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='lightgray', 
-                   markersize=12, label='Vértices não visitados'),
-            Line2D([0], [0], color='green', lw=4, label='Arestas da MST'),
-            Line2D([0], [0], color='orange', lw=3, linestyle='--', label='Arestas candidatas'),
-            Line2D([0], [0], color='red', lw=3, label='Aresta sendo adicionada')
-        ]
-        self.ax.legend(handles=legend_elements, loc='upper right')
+            edges.append(([state['current_edge'][:2]], 'red', 4, 'solid', 1.0))
         
-        self.ax.axis('off')
+        # Vértices na MST maiores e em verde
+        graph = {'nodes': [(list(state['visited']), 'lightgreen', 1500)],
+                 'edges': edges,
+                 'title': (f"{state['title']}\n{state['step_info']}", dict(fontsize=12, pad=20))}
         
-        # Informações adicionais na parte inferior
-        info_text = f"Estado {self.current_state + 1}/{len(self.animation_states)}"
+        info_text = f"Estado {index + 1}/{len(self.animation_states)}"
         if state['total_weight'] > 0:
             info_text += f" | Peso Total: {state['total_weight']}"
+        return {'graph': graph, 'info': info_text}
+    
+    def draw_graph_state(self, state):
+        """Desenha um estado específico do grafo"""
+        if self.renderer is None:
+            self.setup_renderer()
         
-        self.fig.text(0.5, 0.02, info_text, ha='center', fontsize=10, 
-                     bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow'))
-        
-        plt.tight_layout()
-        plt.draw()
+        # Só muda o estilo dos artistas já criados
+        with phase(self.stats, 'render'):
+            export.Scene.apply(self.artists, self.frame_of(state, self.current_state))
+            self.renderer.draw()
+    
+    def export_animation(self, path, start_vertex='A', fps=0.5, workers=None, dpi=100):
+        """Exporta os estados sem abrir janela: .gif, .mp4 ou diretório de PNGs
+        
+        Executa o algoritmo se os estados ainda não foram gerados. Os quadros
+        são desenhados em paralelo por grafos.export.
+        """
+        if len(self.animation_states) == 0:
+            self.run_prim_algorithm(start_vertex)
+        frames = [self.frame_of(self.animation_states[i], i)
+                  for i in range(len(self.animation_states))]
+        
+        print(f"\n🎬 Exportando {len(frames)} quadros para {path}...")
+        with phase(self.stats, 'render'):
+            export.export_animation(self.build_scene(), frames, path, fps=fps,
+                                    workers=workers, dpi=dpi)
+        print(f"✅ Animação salva em {path}")
+        return path
     
     def animate_algorithm(self, interval=2000):
         """Executa a animação dinâmica"""
@@ -299,16 +367,17 @@ class PrimVisualization:
         
         plt.show()
 
-def main():
-    """Função principal"""
+def main(graph_file=None):
+    """Função principal (``graph_file``: arquivo do grafo, ver grafos.loaders)"""
     print("🚀 Algoritmo de Prim - Visualização Dinâmica")
     print("=" * 45)
     
     # Cria a visualização
-    prim_viz = PrimVisualization()
+    graph = load_graph(graph_file) if graph_file else None
+    prim_viz = PrimVisualization(graph)
     
     # Executa o algoritmo e gera os estados
-    mst, total_weight = prim_viz.run_prim_algorithm('A')
+    mst, total_weight = prim_viz.run_prim_algorithm('A' if graph is None else graph.label_of(0))
     
     print(f"\n📊 Resultado:")
     print(f"   MST com {len(mst)} arestas")
@@ -341,4 +410,5 @@ def main():
         prim_viz.interactive_visualization()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Argumento opcional: arquivo do grafo
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file